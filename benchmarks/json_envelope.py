@@ -0,0 +1,84 @@
+from http import HTTPStatus
+from time import perf_counter, time
+from typing import Any, Callable
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from src.api.presenters import SuccessJSON, SuccessResponse
+from src.utils.formaters import format_dynamic_report
+
+ROWS = 20000
+ROUNDS = 20
+
+SCOPE = {
+    "type": "http",
+    "method": "GET",
+    "path": "/v2/ifms-dev-competition/api/FINAL/dynamic-report",
+    "query_string": b"",
+    "headers": [],
+    "client": ("127.0.0.1", 2007),
+    "server": ("127.0.0.1", 8000),
+}
+
+
+def model_envelope(request: Request, data: dict[str, Any]) -> bytes:
+    content = SuccessResponse(
+        success=True,
+        code=HTTPStatus.OK,
+        status=HTTPStatus.OK.phrase,
+        message="Found reports",
+        request=request,
+        data=data,
+    )
+    return bytes(JSONResponse(content.model_dump()).body)
+
+
+def fast_envelope(request: Request, data: dict[str, Any]) -> bytes:
+    return bytes(SuccessJSON(request, "Found reports", data).body)
+
+
+def measure(envelope: Callable, request: Request, data: dict) -> float:
+    start = perf_counter()
+
+    for _ in range(ROUNDS):
+        envelope(request, data)
+
+    return (perf_counter() - start) / ROUNDS * 1000
+
+
+def main() -> None:
+    request = Request(SCOPE)
+    now = time()
+    reports = [
+        format_dynamic_report(
+            (
+                index,
+                "FINAL",
+                "ABCD",
+                "UPLOAD" if index % 4 == 0 else "RETRIEVE",
+                "css" if index % 2 else "html",
+                now + index,
+                87.25 if index % 4 == 0 else None,
+                4362 if index % 4 == 0 else None,
+            )
+        )
+        for index in range(ROWS)
+    ]
+    data = {"dynamic": "FINAL", "count": ROWS, "reports": reports}
+
+    model_body = model_envelope(request, data)
+    fast_body = fast_envelope(request, data)
+    assert fast_body == model_body, "SuccessJSON output does not match"
+
+    model_ms = measure(model_envelope, request, data)
+    fast_ms = measure(fast_envelope, request, data)
+
+    print(f"Envelope of {ROWS} reports, {len(fast_body)} bytes, identical")
+    print(f"SuccessResponse.model_dump: {model_ms:8.2f} ms")
+    print(f"SuccessJSON:                {fast_ms:8.2f} ms")
+    print(f"Speedup:                    {model_ms / fast_ms:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,17 +9,24 @@ from starlette.middleware.sessions import SessionMiddleware
 from src import __version__
 from src.api.middleware import TracingTimeExceptionHandlerMiddleware
 from src.api.presenters import ErrorResponse, SuccessResponse
-from src.core.config import ENV, IMG_DIR, LIMITER, SECRET_KEY, WEB_DIR
+from src.api.static_files import ImageFiles
+from src.core.compare_executor import CompareExecutor
+from src.core.config import ENV, IMG_DIR, SECRET_KEY, WEB_DIR
 from src.core.exception_handler import ExceptionHandler
+from src.core.metrics import Metrics
 from src.core.screenshot_service import ScreenshotService
-from src.repository import BaseRepository
+from src.repository import BaseRepository, DatabaseExecutor, ReportWriter
 from src.routes import (
     admin_router,
     code_dirs_router,
     dynamics_router,
     files_router,
+    metrics_router,
     reports_router,
 )
+from src.use_cases.metrics import COLLECTORS
+from src.use_cases.report_events import ReportEvents
+from src.use_cases.scoring_jobs import ScoringJobs
 
 CONTACT = {
     "name": "@mauprogramador",
@@ -55,10 +62,20 @@ async def lifespan(_: FastAPI):
     WEB_DIR.mkdir(parents=True, exist_ok=True)
     IMG_DIR.mkdir(parents=True, exist_ok=True)
 
-    BaseRepository.create_tables()
+    BaseRepository.migrate()
+    ReportWriter.start()
     await ScreenshotService.initialize()
+    ScoringJobs.start()
+    Metrics.start(COLLECTORS)
     yield
+    await Metrics.stop()
+    ReportEvents.stop()
+    await ScoringJobs.stop()
+    await ReportWriter.stop()
     await ScreenshotService.cleanup()
+    CompareExecutor.shutdown()
+    DatabaseExecutor.shutdown()
+    BaseRepository.close()
 
 
 app = FastAPI(
@@ -75,8 +92,6 @@ app = FastAPI(
     responses=RESPONSES,
 )
 
-app.state.limiter = LIMITER
-
 app.add_middleware(TracingTimeExceptionHandlerMiddleware)
 
 app.add_middleware(
@@ -98,9 +113,10 @@ app.include_router(dynamics_router)
 app.include_router(code_dirs_router)
 app.include_router(files_router)
 app.include_router(reports_router)
+app.include_router(metrics_router)
 
 WEB_DIR.mkdir(parents=True, exist_ok=True)
 IMG_DIR.mkdir(parents=True, exist_ok=True)
 
-app.mount("/images", StaticFiles(directory=IMG_DIR))
+app.mount("/images", ImageFiles(directory=IMG_DIR))
 app.mount("/web", StaticFiles(directory=WEB_DIR))
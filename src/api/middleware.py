@@ -1,34 +1,51 @@
 from http import HTTPStatus
-from time import perf_counter
 
-from fastapi import FastAPI, Request
-from starlette.middleware.base import (
-    BaseHTTPMiddleware,
-    RequestResponseEndpoint,
-)
-from starlette.responses import Response
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.api.presenters import ErrorJSON, HTTPError
 from src.core.config import LOG
+from src.core.metrics import Metrics
+from src.core.request_timing import RequestTiming
 from src.utils.formaters import format_error, get_error_message
 
 
-class TracingTimeExceptionHandlerMiddleware(BaseHTTPMiddleware):
+class TracingTimeExceptionHandlerMiddleware:
     """Middleware tracing, process time and uncaught exceptions"""
 
     __PROCESS_TIME = "X-Process-Time"
+    __SERVER_TIMING = "Server-Timing"
 
-    def __init__(self, app: FastAPI):
+    def __init__(self, app: ASGIApp) -> None:
         """Middleware tracing, process time and uncaught exceptions"""
-        super().__init__(app)
+        self.app = app
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response | ErrorJSON:
-        start_time = perf_counter()
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = RequestTiming.start()
+        status_code, process_time = HTTPStatus.INTERNAL_SERVER_ERROR, 0.0
+        response_started = False
+
+        async def send_timing(message: Message) -> None:
+            nonlocal status_code, process_time, response_started
+
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                process_time = RequestTiming.elapsed()
+
+                headers = MutableHeaders(scope=message)
+                headers[self.__PROCESS_TIME] = f"{process_time:.2f}s"
+                headers[self.__SERVER_TIMING] = RequestTiming.server_timing()
+
+            await send(message)
 
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_timing)
 
         except Exception as error:  # pylint: disable=W0718
             message = get_error_message(error)
@@ -36,16 +53,36 @@ class TracingTimeExceptionHandlerMiddleware(BaseHTTPMiddleware):
             LOG.error(message)
             LOG.exception(error)
 
+            if response_started:
+                raise
+
             response = ErrorJSON(
-                request,
+                Request(scope),
                 HTTPStatus.INTERNAL_SERVER_ERROR,
                 format_error(error, message),
                 HTTPError.get_error_details(error),
             )
+            await response(scope, receive, send_timing)
 
-        process_time = perf_counter() - start_time
-        response.headers[self.__PROCESS_TIME] = f"{process_time:.2f}s"
+        finally:
+            LOG.trace(Request(scope), status_code, process_time)
+            RequestTiming.stop(token)
 
-        LOG.trace(request, response.status_code, process_time)
+            method, route = scope["method"], self.__route(scope)
+            Metrics.increment(
+                "http_requests_total",
+                method=method,
+                route=route,
+                status=str(status_code),
+            )
+            Metrics.observe(
+                "http_request_duration_seconds",
+                process_time,
+                method=method,
+                route=route,
+            )
 
-        return response
+    @staticmethod
+    def __route(scope: Scope) -> str:
+        endpoint = getattr(scope.get("endpoint"), "__name__", "unmatched")
+        return scope.get("route_path") or scope.get("root_path") or endpoint
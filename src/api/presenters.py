@@ -13,8 +13,20 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel, field_validator
 
 from src.core.config import LOG
+from src.core.request_timing import RequestTiming
 from src.utils.formaters import format_error, get_error_message
 
+TIMESTAMP = datetime.now().isoformat()
+
+
+def get_request_data(request: Request) -> dict[str, Any]:
+    return {
+        "host": request.client.host if request.client else "127.0.0.1",
+        "port": request.client.port if request.client else 8000,
+        "method": request.method,
+        "url": request.url.path,
+    }
+
 
 class BaseResponse(BaseModel):
     """Base class for JSON responses"""
@@ -23,18 +35,13 @@ class BaseResponse(BaseModel):
     code: int
     status: str
     message: str
-    timestamp: str = datetime.now().isoformat()
+    timestamp: str = TIMESTAMP
     request: dict[str, Any]
 
     @field_validator("request", mode="before")
     @classmethod
     def get_request_data(cls, request: Request) -> dict[str, Any]:
-        return {
-            "host": request.client.host if request.client else "127.0.0.1",
-            "port": request.client.port if request.client else 8000,
-            "method": request.method,
-            "url": request.url.path,
-        }
+        return get_request_data(request)
 
 
 class SuccessResponse(BaseResponse):
@@ -63,16 +70,18 @@ class SuccessJSON(JSONResponse):
         if code is None:
             code = HTTPStatus.OK
 
-        content = SuccessResponse(
-            success=True,
-            code=code,
-            status=HTTPStatus(code).phrase,
-            message=message,
-            request=request,
-            data=data,
-        )
+        content = {
+            "success": True,
+            "code": int(code),
+            "status": HTTPStatus(code).phrase,
+            "message": message,
+            "timestamp": TIMESTAMP,
+            "request": get_request_data(request),
+            "data": data,
+        }
 
-        super().__init__(content.model_dump(), code)
+        with RequestTiming.measure("serialization"):
+            super().__init__(content, code)
 
 
 class ErrorJSON(JSONResponse):
@@ -97,16 +106,18 @@ class ErrorJSON(JSONResponse):
                 LOG.error(format_error(error, message))
                 LOG.exception(error)
 
-        content = ErrorResponse(
-            success=False,
-            code=code,
-            status=HTTPStatus(code).phrase,
-            message=message,
-            request=request,
-            errors=errors,
-        )
+        content = {
+            "success": False,
+            "code": int(code),
+            "status": HTTPStatus(code).phrase,
+            "message": message,
+            "timestamp": TIMESTAMP,
+            "request": get_request_data(request),
+            "errors": errors,
+        }
 
-        super().__init__(content.model_dump(), code)
+        with RequestTiming.measure("serialization"):
+            super().__init__(content, code)
 
 
 class HTTPError(FastAPIHTTPException):
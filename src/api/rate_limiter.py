@@ -0,0 +1,97 @@
+from functools import wraps
+from math import ceil
+from time import time
+from typing import Any, Callable, Coroutine
+
+from fastapi import Request
+
+from src.common.enums import FileType, RequestCost
+from src.core.config import ENV, WEB_DIR
+from src.core.metrics import Metrics
+from src.repository import DatabaseExecutor, RateLimitRepository
+
+Endpoint = Callable[..., Coroutine[Any, Any, Any]]
+
+
+class RateLimitExceeded(Exception):
+    """Request cost beyond the tokens left in its client bucket"""
+
+    def __init__(self, dynamic: str, client: str, retry_after: float):
+        self.retry_after = max(1, ceil(retry_after))
+        super().__init__(
+            f"Request rate limit of {dynamic} {client} exceeded,"
+            f" retry after {self.retry_after}s"
+        )
+
+
+class RateLimiter:
+    """Cost-weighted token buckets of each dynamic team or client address"""
+
+    _CAPACITY = ENV.rate_limit_capacity
+    _REFILL = ENV.rate_limit_refill
+    _PRUNE_EVERY = 1000
+    _TAKEN = 0
+
+    @classmethod
+    def limit(
+        cls, cost: RequestCost, render_cost: RequestCost | None = None
+    ) -> Callable[[Endpoint], Endpoint]:
+        def decorator(endpoint: Endpoint) -> Endpoint:
+            @wraps(endpoint)
+            async def limited_endpoint(*args: Any, **kwargs: Any) -> Any:
+                data = cls.__request_data(kwargs)
+                charge = cost
+
+                if render_cost and getattr(data, "type", None) == FileType.CSS:
+                    charge = render_cost
+
+                dynamic = kwargs["dynamic"]
+                await cls.take(
+                    dynamic,
+                    cls.__client(kwargs["request"], dynamic, data),
+                    charge,
+                )
+                return await endpoint(*args, **kwargs)
+
+            return limited_endpoint
+
+        return decorator
+
+    @classmethod
+    async def take(cls, dynamic: str, client: str, cost: int) -> None:
+        now = time()
+        retry_after = await DatabaseExecutor.run(
+            RateLimitRepository.take_tokens,
+            dynamic,
+            client,
+            cost,
+            cls._CAPACITY,
+            cls._REFILL,
+            now,
+        )
+
+        cls._TAKEN += 1
+        if cls._TAKEN % cls._PRUNE_EVERY == 0:
+            await DatabaseExecutor.run(
+                RateLimitRepository.delete_idle_buckets,
+                now - cls._CAPACITY / cls._REFILL,
+            )
+
+        if retry_after > 0:
+            Metrics.increment("rate_limit_rejections_total")
+            raise RateLimitExceeded(dynamic, client, retry_after)
+
+    @staticmethod
+    def __request_data(kwargs: dict[str, Any]) -> Any:
+        return next(
+            (value for value in kwargs.values() if hasattr(value, "code")),
+            None,
+        )
+
+    @staticmethod
+    def __client(request: Request, dynamic: str, data: Any) -> str:
+        if data is not None and (WEB_DIR / dynamic / data.code).is_dir():
+            return f"team:{data.code}"
+
+        host = request.client.host if request.client else "unknown"
+        return f"address:{host}"
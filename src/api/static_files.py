@@ -0,0 +1,41 @@
+from pathlib import Path, PurePosixPath
+
+from fastapi.staticfiles import StaticFiles
+from starlette.responses import Response
+from starlette.types import Scope
+
+from src.core.compare_executor import CompareExecutor
+from src.core.config import (
+    DIFF_FILENAME,
+    LOG,
+    MASK_FILENAME,
+    SCREENSHOT_FILENAME,
+)
+from src.core.image_pipeline import materialize_image
+
+
+class ImageFiles(StaticFiles):
+    """Static images, encoding the compared images on first request"""
+
+    __LAZY_FILENAMES = (SCREENSHOT_FILENAME, DIFF_FILENAME)
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        image_path = PurePosixPath(path)
+
+        if image_path.name in self.__LAZY_FILENAMES:
+            mask_path, _ = self.lookup_path(
+                str(image_path.with_name(MASK_FILENAME))
+            )
+
+            if mask_path:
+                try:
+                    await CompareExecutor.run(
+                        materialize_image,
+                        Path(mask_path).parent,
+                        image_path.name,
+                    )
+                except Exception as error:  # pylint: disable=W0718
+                    LOG.error(f"Failed to encode {path} image")
+                    LOG.exception(error)
+
+        return await super().get_response(path, scope)
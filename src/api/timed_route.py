@@ -0,0 +1,47 @@
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any, Callable, Coroutine
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from starlette.routing import Match
+from starlette.types import Scope
+
+from src.core.request_timing import RequestTiming
+
+
+class TimedRoute(APIRoute):
+    """API route timing the request validation before its endpoint"""
+
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        match, child_scope = super().matches(scope)
+
+        if match != Match.NONE:
+            child_scope["route_path"] = self.path
+
+        return match, child_scope
+
+    def get_route_handler(
+        self,
+    ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        endpoint: Callable[..., Any] = self.dependant.call
+
+        if iscoroutinefunction(endpoint):
+
+            @wraps(endpoint)
+            async def timed_endpoint(*args: Any, **kwargs: Any) -> Any:
+                RequestTiming.record("validation", RequestTiming.elapsed())
+                return await endpoint(*args, **kwargs)
+
+            self.dependant.call = timed_endpoint
+
+        else:
+
+            @wraps(endpoint)
+            def timed_sync_endpoint(*args: Any, **kwargs: Any) -> Any:
+                RequestTiming.record("validation", RequestTiming.elapsed())
+                return endpoint(*args, **kwargs)
+
+            self.dependant.call = timed_sync_endpoint
+
+        return super().get_route_handler()
@@ -1,4 +1,4 @@
-from enum import StrEnum, unique
+from enum import IntEnum, StrEnum, unique
 
 
 @unique
@@ -26,3 +26,43 @@ class LockStatus(StrEnum):
     @property
     def boolean(self) -> int:
         return 1 if self.name == "LOCK" else 0
+
+
+@unique
+class JobStatus(StrEnum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
+@unique
+class Readiness(StrEnum):
+    FIXED = "FIXED"
+    ADAPTIVE = "ADAPTIVE"
+
+
+@unique
+class RenderSource(StrEnum):
+    HTTP = "HTTP"
+    DISK = "DISK"
+
+
+@unique
+class ExecutorKind(StrEnum):
+    THREAD = "THREAD"
+    PROCESS = "PROCESS"
+
+
+@unique
+class RequestCost(IntEnum):
+    READ = 1
+    UPLOAD = 2
+    RENDER = 10
+
+
+@unique
+class MetricType(StrEnum):
+    COUNTER = "counter"
+    GAUGE = "gauge"
+    HISTOGRAM = "histogram"
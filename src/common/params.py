@@ -1,5 +1,3 @@
-from tempfile import NamedTemporaryFile
-
 from fastapi import File, UploadFile
 from pydantic import BaseModel, Field, field_validator
 
@@ -29,6 +27,44 @@ class UploadData(RetrieveData):
         min_length=1,
         examples=["<html>...<html>"],
     )
+    background: bool = Field(
+        default=False,
+        description="Score a CSS upload in a background job",
+    )
+
+
+class ReportPage(BaseModel):
+    after: int | None = Field(
+        default=None,
+        description="Continue after the report with this ID",
+        ge=1,
+        examples=[None],
+    )
+    limit: int | None = Field(
+        default=None,
+        description="Maximum number of reports",
+        ge=1,
+        le=10000,
+        examples=[None],
+    )
+    stream: bool = Field(
+        default=False,
+        description="Stream the reports as newline delimited JSON",
+    )
+
+
+class DownloadOptions(BaseModel):
+    level: int = Field(
+        default=9,
+        description="Compression level, 0 stores the files uncompressed",
+        ge=0,
+        le=9,
+        examples=[9],
+    )
+    images: bool = Field(
+        default=False,
+        description="Include the screenshots and diff images",
+    )
 
 
 class CreateNewDynamic(BaseModel):
@@ -83,8 +119,3 @@ class UploadAnswerKey(BaseModel):
     @property
     def web_fields(self) -> bool:
         return all((self.html, self.css))
-
-
-async def get_temp_file():
-    with NamedTemporaryFile(delete=False) as tmp_file:
-        yield tmp_file
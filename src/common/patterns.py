@@ -9,3 +9,6 @@ CODE_PATTERN = r"^[a-zA-Z]{4}$"
 
 # e.g. FINAL
 DYNAMIC_PATTERN = r"^[a-zA-Z\_\-]{1,50}$"
+
+# e.g. 3f2b8c1d9a7e4f6b8c0d2e4f6a8b0c1d
+JOB_ID_PATTERN = r"^[0-9a-f]{32}$"
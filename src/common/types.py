@@ -1,18 +1,18 @@
-from tempfile import _TemporaryFileWrapper
 from typing import Annotated
 
-from fastapi import Depends, Form, Path, Query
+from fastapi import Form, Path, Query
 from pydantic import AfterValidator
 
-from src.common.enums import LockStatus, Operation
+from src.common.enums import LockStatus, Operation, Readiness
 from src.common.params import (
     CreateNewDynamic,
+    DownloadOptions,
+    ReportPage,
     RetrieveData,
     UploadAnswerKey,
     UploadData,
-    get_temp_file,
 )
-from src.common.patterns import CODE_PATTERN, DYNAMIC_PATTERN
+from src.common.patterns import CODE_PATTERN, DYNAMIC_PATTERN, JOB_ID_PATTERN
 from src.utils.formaters import format_code, format_dynamic
 
 DynamicPath = Annotated[
@@ -41,10 +41,22 @@ CodePath = Annotated[
     ),
 ]
 
-TempFile = Annotated[_TemporaryFileWrapper, Depends(get_temp_file)]
+JobIdPath = Annotated[
+    str,
+    Path(
+        description="Score job ID",
+        min_length=32,
+        max_length=32,
+        pattern=JOB_ID_PATTERN,
+    ),
+]
+
+DownloadQuery = Annotated[DownloadOptions, Query(description="Download")]
 
 RetrieveFileQuery = Annotated[RetrieveData, Query(description="Retrieve")]
 
+ReportPageQuery = Annotated[ReportPage, Query(description="Reports page")]
+
 UploadFileForm = Annotated[UploadData, Form(description="Upload")]
 
 UploadAnswerKeyForm = Annotated[
@@ -71,3 +83,11 @@ LockQuery = Annotated[
         examples=[False],
     ),
 ]
+
+ReadinessQuery = Annotated[
+    Readiness,
+    Query(
+        description="Page readiness strategy before the screenshot",
+        examples=[Readiness.ADAPTIVE],
+    ),
+]
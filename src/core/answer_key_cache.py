@@ -0,0 +1,76 @@
+from http import HTTPStatus
+from typing import Any, NamedTuple
+
+from cv2 import imread
+from cv2.typing import MatLike
+from fastapi import HTTPException
+
+from src.api.presenters import HTTPError
+from src.core.compare_executor import CompareExecutor
+from src.core.config import ANSWER_KEY_FILENAME, IMG_DIR, LOG
+from src.utils.formaters import get_size
+
+
+class CachedAnswerKey(NamedTuple):
+    image: MatLike
+    size: tuple[int, int]
+    version: str
+
+
+class AnswerKeyCache:
+    """Per-dynamic cache of the decoded answer-key images"""
+
+    _ENTRIES: dict[str, CachedAnswerKey] = {}
+    _HITS = 0
+    _MISSES = 0
+
+    @classmethod
+    async def get(cls, dynamic: str) -> CachedAnswerKey:
+        answer_key_path = IMG_DIR / dynamic / ANSWER_KEY_FILENAME
+
+        try:
+            stat = answer_key_path.stat()
+        except FileNotFoundError as error:
+            LOG.error("Answer-key image not found")
+            raise HTTPException(
+                HTTPStatus.NOT_FOUND, "Answer-key image not found"
+            ) from error
+
+        version = f"{stat.st_mtime_ns}:{stat.st_size}"
+        entry = cls._ENTRIES.get(dynamic)
+
+        if entry is not None and entry.version == version:
+            cls._HITS += 1
+            return entry
+
+        cls._MISSES += 1
+        image = await CompareExecutor.run(imread, str(answer_key_path))
+
+        if image is None:
+            raise HTTPError(f"Error in decoding {dynamic} answer-key image")
+
+        image.flags.writeable = False
+        entry = CachedAnswerKey(image, get_size(image), version)
+        cls._ENTRIES[dynamic] = entry
+
+        LOG.info(f"{dynamic} answer-key {entry.size} loaded in cache")
+        LOG.debug({"answer_key_cache": cls.stats()})
+
+        return entry
+
+    @classmethod
+    def invalidate(cls, dynamic: str) -> None:
+        cls._ENTRIES.pop(dynamic, None)
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        lookups = cls._HITS + cls._MISSES
+        return {
+            "entries": len(cls._ENTRIES),
+            "bytes": sum(
+                entry.image.nbytes for entry in cls._ENTRIES.values()
+            ),
+            "hits": cls._HITS,
+            "misses": cls._MISSES,
+            "hit_ratio": round(cls._HITS / lookups, 4) if lookups else 0.0,
+        }
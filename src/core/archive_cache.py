@@ -0,0 +1,83 @@
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from src.core.config import ENV
+from src.core.zip_stream import ZipEntry
+
+
+class TreeFile(NamedTuple):
+    arcname: str
+    path: Path
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def stat(cls, arcname: str, path: Path) -> "TreeFile":
+        stat = path.stat()
+        return cls(arcname, path, stat.st_size, stat.st_mtime_ns)
+
+
+class ArchiveCache:
+    """Fingerprint-keyed LRU cache of compressed download zip entries"""
+
+    _ENTRIES: OrderedDict[tuple, ZipEntry] = OrderedDict()
+    _MAX_BYTES = ENV.archive_cache_mb * 1024 * 1024
+    _BYTES = 0
+    _HITS = 0
+    _MISSES = 0
+
+    @classmethod
+    def fingerprint(cls, tree: list[TreeFile], *variants: object) -> str:
+        digest = sha256()
+
+        for file in tree:
+            digest.update(f"{file.arcname}\0{file.size}\0".encode())
+            digest.update(f"{file.mtime_ns}\0".encode())
+
+        for variant in variants:
+            digest.update(str(variant).encode())
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    @classmethod
+    def get(cls, file: TreeFile, level: int) -> ZipEntry | None:
+        entry = cls._ENTRIES.get((file, level))
+
+        if entry is None:
+            cls._MISSES += 1
+            return None
+
+        cls._HITS += 1
+        cls._ENTRIES.move_to_end((file, level))
+        return entry
+
+    @classmethod
+    def put(cls, file: TreeFile, level: int, entry: ZipEntry) -> None:
+        if entry.nbytes > cls._MAX_BYTES:
+            return
+
+        previous = cls._ENTRIES.pop((file, level), None)
+        if previous is not None:
+            cls._BYTES -= previous.nbytes
+
+        cls._ENTRIES[(file, level)] = entry
+        cls._BYTES += entry.nbytes
+
+        while cls._BYTES > cls._MAX_BYTES:
+            _, evicted = cls._ENTRIES.popitem(last=False)
+            cls._BYTES -= evicted.nbytes
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        lookups = cls._HITS + cls._MISSES
+        return {
+            "entries": len(cls._ENTRIES),
+            "bytes": cls._BYTES,
+            "max_bytes": cls._MAX_BYTES,
+            "hits": cls._HITS,
+            "misses": cls._MISSES,
+            "hit_ratio": round(cls._HITS / lookups, 4) if lookups else 0.0,
+        }
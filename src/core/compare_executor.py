@@ -0,0 +1,82 @@
+from asyncio import Semaphore, get_running_loop
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from contextvars import copy_context
+from functools import partial
+from multiprocessing import get_context
+from typing import Any, Callable, TypeVar
+
+from src.common.enums import ExecutorKind
+from src.core.config import ENV, LOG
+from src.core.request_timing import RequestTiming
+
+T = TypeVar("T")
+
+
+class CompareExecutor:
+    """Runs the CPU-bound image pipeline off the event loop"""
+
+    _KIND = ENV.compare_executor
+    _JOBS = ENV.compare_jobs
+    _EXECUTOR: Executor = None
+    _SEMAPHORE: Semaphore = None
+    _RUNNING = 0
+
+    @classmethod
+    async def run(cls, func: Callable[..., T], *args: Any) -> T:
+        with RequestTiming.measure("compare"):
+            async with cls.__get_semaphore():  # pylint: disable=E1701
+                cls._RUNNING += 1
+                try:
+                    return await get_running_loop().run_in_executor(
+                        cls.__get_executor(), cls.__bind(func, *args)
+                    )
+                finally:
+                    cls._RUNNING -= 1
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._EXECUTOR is not None:
+            cls._EXECUTOR.shutdown(wait=True, cancel_futures=True)
+        cls._EXECUTOR, cls._SEMAPHORE = None, None
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        return {
+            "kind": cls._KIND.value,
+            "jobs": cls._JOBS,
+            "running": cls._RUNNING,
+        }
+
+    @classmethod
+    def __bind(cls, func: Callable[..., T], *args: Any) -> Callable[[], T]:
+        if cls._KIND == ExecutorKind.PROCESS:
+            return partial(func, *args)
+        return partial(copy_context().run, func, *args)
+
+    @classmethod
+    def __get_semaphore(cls) -> Semaphore:
+        if cls._SEMAPHORE is None:
+            cls._SEMAPHORE = Semaphore(cls._JOBS)
+        return cls._SEMAPHORE
+
+    @classmethod
+    def __get_executor(cls) -> Executor:
+        if cls._EXECUTOR is None:
+            if cls._KIND == ExecutorKind.PROCESS:
+                cls._EXECUTOR = ProcessPoolExecutor(
+                    max_workers=cls._JOBS, mp_context=get_context("spawn")
+                )
+            else:
+                cls._EXECUTOR = ThreadPoolExecutor(
+                    max_workers=cls._JOBS, thread_name_prefix="compare"
+                )
+            LOG.info(
+                f"Compare executor started with {cls._JOBS} "
+                f"{cls._KIND.value.lower()} workers"
+            )
+
+        return cls._EXECUTOR
@@ -1,9 +1,6 @@
 from pathlib import Path
 from secrets import token_hex
 
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-
 from src.core.env import EnvConfig
 from src.utils.logging import Logging
 
@@ -12,21 +9,21 @@ ROUTE_PREFIX = "/v2/ifms-dev-competition/api"
 
 WEB_DIR = Path("web")
 IMG_DIR = Path("images")
+RENDER_DIR = Path(".render")
 
 DEFAULT_WEIGHT = 5000
 
 ANSWER_KEY_FILENAME = "answer_key.png"
 DIFF_FILENAME = "diff.png"
 SCREENSHOT_FILENAME = "screenshot.png"
+RENDER_FILENAME = "render.png"
+MASK_FILENAME = "diff.mask"
 
 SECRET_KEY = token_hex(nbytes=16)
 
 ENV = EnvConfig()
 LOG = Logging(*ENV.log_config)
 
-LIMITER = Limiter(key_func=get_remote_address)
-LIMIT = "60/2seconds"
-
 ERROR_MESSAGE = "Unexpected internal error occurred"
 
 HEADERS = [
@@ -0,0 +1,92 @@
+from threading import local
+from typing import NamedTuple
+
+from cv2 import (
+    COLOR_BGR2GRAY,
+    THRESH_BINARY,
+    absdiff,
+    bitwise_not,
+    countNonZero,
+    cvtColor,
+    merge,
+    subtract,
+    threshold,
+    transform,
+)
+from cv2.typing import MatLike
+from numpy import empty, full, ones, uint8
+
+
+class DiffBuffers(NamedTuple):
+    pixels: MatLike
+    channel: MatLike
+    white: MatLike
+    image: MatLike
+
+
+class DiffEngine:
+    """Changed pixels count, diff mask and image over reusable buffers"""
+
+    _THRESHOLD = 30
+    _MAX_SHAPES = 4
+    _SUM_CHANNELS = ones((1, 3))
+    _LOCAL = local()
+
+    @classmethod
+    def diff(
+        cls, answer_key: MatLike, screenshot: MatLike
+    ) -> tuple[int, MatLike]:
+        buffers = cls.__get_buffers(answer_key.shape)
+
+        absdiff(answer_key, screenshot, dst=buffers.pixels)
+        transform(buffers.pixels, cls._SUM_CHANNELS, dst=buffers.channel)
+        changed_pixels = countNonZero(buffers.channel)
+
+        subtract(answer_key, screenshot, dst=buffers.pixels)
+        cvtColor(buffers.pixels, COLOR_BGR2GRAY, dst=buffers.channel)
+        threshold(
+            buffers.channel,
+            cls._THRESHOLD,
+            255,
+            THRESH_BINARY,
+            dst=buffers.channel,
+        )
+
+        return changed_pixels, buffers.channel
+
+    @classmethod
+    def image(cls, mask: MatLike) -> MatLike:
+        buffers = cls.__get_buffers((*mask.shape, 3))
+
+        bitwise_not(mask, dst=buffers.channel)
+        merge(
+            (buffers.channel, buffers.channel, buffers.white),
+            dst=buffers.image,
+        )
+
+        return buffers.image
+
+    @classmethod
+    def __get_buffers(cls, shape: tuple[int, ...]) -> DiffBuffers:
+        cache: dict[tuple[int, ...], DiffBuffers] = getattr(
+            cls._LOCAL, "buffers", None
+        )
+
+        if cache is None:
+            cache = cls._LOCAL.buffers = {}
+
+        buffers = cache.pop(shape, None)
+
+        if buffers is None:
+            if len(cache) >= cls._MAX_SHAPES:
+                del cache[next(iter(cache))]
+
+            buffers = DiffBuffers(
+                pixels=empty(shape, uint8),
+                channel=empty(shape[:2], uint8),
+                white=full(shape[:2], 255, uint8),
+                image=empty(shape, uint8),
+            )
+
+        cache[shape] = buffers
+        return buffers
@@ -7,6 +7,7 @@ from pydantic_settings import (
     SettingsConfigDict,
 )
 
+from src.common.enums import ExecutorKind, RenderSource
 from src.common.patterns import HOST_PATTERN
 
 
@@ -30,6 +31,36 @@ class EnvConfig(BaseSettings):
     port: int = Field(default=8000, gt=0, lt=65535, decimal_places=None)
     reload: bool = Field(default=False)
     workers: int = Field(default=1, gt=0, lt=5, decimal_places=None)
+    render_pages: int = Field(default=4, gt=0, lt=17, decimal_places=None)
+    render_processes: int = Field(default=0, ge=0, lt=9, decimal_places=None)
+    render_source: RenderSource = Field(default=RenderSource.DISK)
+    render_cache_mb: int = Field(
+        default=64, ge=0, le=4096, decimal_places=None
+    )
+    archive_cache_mb: int = Field(
+        default=32, ge=0, le=1024, decimal_places=None
+    )
+    compare_executor: ExecutorKind = Field(default=ExecutorKind.THREAD)
+    compare_jobs: int = Field(default=2, gt=0, lt=17, decimal_places=None)
+    lazy_images: bool = Field(default=True)
+    report_batch_size: int = Field(
+        default=200, gt=0, le=5000, decimal_places=None
+    )
+    report_flush_ms: int = Field(
+        default=250, ge=10, le=10000, decimal_places=None
+    )
+    events_poll_ms: int = Field(
+        default=500, ge=100, le=10000, decimal_places=None
+    )
+    events_queue_size: int = Field(
+        default=100, gt=0, le=10000, decimal_places=None
+    )
+    rate_limit_capacity: int = Field(
+        default=60, ge=10, le=10000, decimal_places=None
+    )
+    rate_limit_refill: int = Field(
+        default=30, gt=0, le=10000, decimal_places=None
+    )
     logging_file: bool = Field(default=False)
     debug: bool = Field(default=False)
 
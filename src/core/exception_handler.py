@@ -8,10 +8,10 @@ from fastapi.exceptions import (
     ResponseValidationError,
 )
 from pydantic_core import PydanticUndefined, ValidationError
-from slowapi.errors import RateLimitExceeded
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from src.api.presenters import ErrorJSON, HTTPError
+from src.api.rate_limiter import RateLimitExceeded
 from src.core.config import ERROR_MESSAGE, LOG
 from src.utils.formaters import format_error
 
@@ -19,6 +19,8 @@ from src.utils.formaters import format_error
 class ExceptionHandler:
     """Handles exceptions and returns their JSON representation"""
 
+    __RETRY_AFTER = "Retry-After"
+
     @property
     def handlers(self) -> dict:
         return {
@@ -91,14 +93,16 @@ class ExceptionHandler:
     async def rate_limit_error(
         self, request: Request, exc: RateLimitExceeded
     ) -> ErrorJSON:
-        message = f"Request rate limit of {exc.detail} exceeded"
+        message = str(exc)
         LOG.error(message)
-        LOG.exception(exc)
-        return ErrorJSON(
+
+        response = ErrorJSON(
             request,
             HTTPStatus.TOO_MANY_REQUESTS,
             format_error(exc, message),
         )
+        response.headers[self.__RETRY_AFTER] = str(exc.retry_after)
+        return response
 
     def __undefined_filter(self, item: dict[str, Any]) -> dict[str, Any]:
         if "input" in item and item["input"] is PydanticUndefined:
@@ -0,0 +1,201 @@
+from os import replace
+from pathlib import Path
+from secrets import token_hex
+from struct import Struct
+from zlib import compress, decompress
+
+from cv2 import IMREAD_COLOR, INTER_CUBIC, imdecode, imencode, resize
+from cv2.typing import MatLike
+from numpy import frombuffer, packbits, reshape, uint8, unpackbits
+
+from src.api.presenters import HTTPError
+from src.core.config import (
+    DIFF_FILENAME,
+    ENV,
+    LOG,
+    MASK_FILENAME,
+    RENDER_FILENAME,
+    SCREENSHOT_FILENAME,
+)
+from src.core.diff_engine import DiffEngine
+from src.utils.formaters import get_size
+
+MASK_HEADER = Struct("!II")
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_SIZE = Struct("!II")
+PNG_SIZE_OFFSET = 16
+
+
+def compare_images(
+    answer_key: MatLike,
+    binary_screenshot: bytes,
+    size: tuple[int, int],
+    info: str,
+) -> tuple[float, bytes]:
+    screenshot = decode_screenshot(binary_screenshot, info)
+
+    LOG.debug(
+        {
+            "answer_key_shape": answer_key.shape,
+            "screenshot_shape": screenshot.shape,
+        }
+    )
+
+    screenshot = resize_screenshot(answer_key.shape, screenshot, size, info)
+
+    total_pixels = answer_key.shape[0] * answer_key.shape[1]
+
+    try:
+        num_diff_pixels, mask = DiffEngine.diff(answer_key, screenshot)
+        diff_mask = encode_mask(mask)
+
+    except Exception as error:
+        raise HTTPError(
+            f"Error in getting {info} diff image",
+            error=error,
+        ) from error
+
+    percentage_diff: float = (num_diff_pixels / total_pixels) * 100
+    similarity = 100.00 - percentage_diff
+
+    LOG.debug(
+        {
+            "total_pixels": total_pixels,
+            "num_diff_pixels": num_diff_pixels,
+        }
+    )
+
+    return similarity, diff_mask
+
+
+def decode_screenshot(binary_screenshot: bytes, info: str) -> MatLike:
+    try:
+        array_screenshot = frombuffer(binary_screenshot, dtype=uint8)
+        screenshot = imdecode(array_screenshot, IMREAD_COLOR)
+
+    except Exception as error:
+        raise HTTPError(
+            f"Error in decode {info} screenshot", error=error
+        ) from error
+
+    if screenshot is None:
+        raise HTTPError(f"Error in decode {info} screenshot")
+
+    return screenshot
+
+
+def resize_screenshot(
+    answer_key_shape: tuple[int, int, int],
+    screenshot: MatLike,
+    size: tuple[int, int],
+    info: str,
+) -> MatLike:
+    if answer_key_shape != screenshot.shape:
+        LOG.error("Answer-key and screenshot have different sizes")
+        old_size = get_size(screenshot)
+        LOG.info(f"Resizing screenshot from {old_size} to {size}")
+
+        try:
+            screenshot = resize(
+                screenshot,
+                size,
+                interpolation=INTER_CUBIC,
+            )
+
+        except Exception as error:
+            raise HTTPError(
+                f"Error in resizing {info} screenshot",
+                error=error,
+            ) from error
+
+    return screenshot
+
+
+def encode_png(image: MatLike) -> bytes:
+    _, encoded = imencode(".png", image)
+    return encoded.tobytes()
+
+
+def encode_mask(mask: MatLike) -> bytes:
+    height, width = mask.shape
+    bits = bytes(packbits(mask, axis=None))
+    return MASK_HEADER.pack(height, width) + compress(bits, 1)
+
+
+def decode_mask(diff_mask: bytes) -> MatLike:
+    height, width = MASK_HEADER.unpack_from(diff_mask)
+    bits = frombuffer(decompress(diff_mask[MASK_HEADER.size :]), uint8)
+
+    mask = reshape(unpackbits(bits, count=height * width), (height, width))
+    mask *= 255
+    return mask
+
+
+def get_png_size(binary_png: bytes) -> tuple[int, int] | None:
+    if not binary_png.startswith(PNG_SIGNATURE):
+        return None
+    return PNG_SIZE.unpack_from(binary_png, PNG_SIZE_OFFSET)
+
+
+def write_atomic(path: Path, content: bytes) -> None:
+    temp_path = path.with_name(f".{path.name}.{token_hex(4)}.tmp")
+    temp_path.write_bytes(content)
+    replace(temp_path, path)
+
+
+def write_images(
+    img_dir: Path, render: bytes, diff_mask: bytes, info: str
+) -> None:
+    img_dir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        write_atomic(img_dir / RENDER_FILENAME, render)
+        write_atomic(img_dir / MASK_FILENAME, diff_mask)
+
+        (img_dir / SCREENSHOT_FILENAME).unlink(missing_ok=True)
+        (img_dir / DIFF_FILENAME).unlink(missing_ok=True)
+        LOG.info(f"{info} screenshot saved")
+
+        if not ENV.lazy_images:
+            materialize_image(img_dir, SCREENSHOT_FILENAME)
+            materialize_image(img_dir, DIFF_FILENAME)
+
+    except OSError as error:
+        raise HTTPError(
+            f"Error in saving {info} images", error=error
+        ) from error
+
+
+def materialize_image(img_dir: Path, filename: str) -> None:
+    mask_path = img_dir / MASK_FILENAME
+    image_path = img_dir / filename
+
+    try:
+        version = mask_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return
+
+    try:
+        if image_path.stat().st_mtime_ns >= version:
+            return
+    except FileNotFoundError:
+        pass
+
+    diff_mask = mask_path.read_bytes()
+
+    if filename == DIFF_FILENAME:
+        image = encode_png(DiffEngine.image(decode_mask(diff_mask)))
+
+    else:
+        height, width = MASK_HEADER.unpack_from(diff_mask)
+        image = (img_dir / RENDER_FILENAME).read_bytes()
+
+        if get_png_size(image) != (width, height):
+            screenshot = decode_screenshot(image, str(img_dir))
+            screenshot = resize_screenshot(
+                (height, width, 3), screenshot, (width, height), str(img_dir)
+            )
+            image = encode_png(screenshot)
+
+    write_atomic(image_path, image)
+    LOG.debug({"materialized_image": str(image_path)})
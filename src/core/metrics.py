@@ -0,0 +1,312 @@
+from asyncio import CancelledError, Task, create_task, sleep, to_thread
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import Context
+from json import JSONDecodeError, dumps, loads
+from os import getpid
+from pathlib import Path
+from shutil import rmtree
+from time import perf_counter, time
+from typing import Any, Callable
+
+from src.common.enums import MetricType
+from src.core.config import LOG
+
+Labels = tuple[tuple[str, str], ...]
+Collectors = dict[str, Callable[[], dict[str, Any]]]
+
+PREFIX = "ifms_"
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """Bucket counts and sum of the observed durations"""
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self, counts: list[int] | None = None, total: float = 0.0):
+        self.counts = counts or [0] * (len(BUCKETS) + 1)
+        self.total = total
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+
+    def merge(self, other: "Histogram") -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+
+
+def format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def escape_label(value: str) -> str:
+    value = value.replace("\\", "\\\\").replace('"', '\\"')
+    return value.replace("\n", "\\n")
+
+
+def format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+
+    pairs = (f'{name}="{escape_label(value)}"' for name, value in labels)
+    return "{" + ",".join(pairs) + "}"
+
+
+class Metrics:
+    """Per-worker counters and histograms aggregated through snapshot files"""
+
+    _DIR = Path(".metrics")
+    _INTERVAL = 5
+    _STALE = 3 * _INTERVAL
+    _HELP: dict[str, tuple[MetricType, str]] = {
+        "http_requests_total": (
+            MetricType.COUNTER,
+            "Requests answered by route and status",
+        ),
+        "http_request_duration_seconds": (
+            MetricType.HISTOGRAM,
+            "Time until the response start by route",
+        ),
+        "render_duration_seconds": (
+            MetricType.HISTOGRAM,
+            "Page screenshot render time",
+        ),
+        "render_failures_total": (
+            MetricType.COUNTER,
+            "Page screenshot renders that failed",
+        ),
+        "compare_stage_duration_seconds": (
+            MetricType.HISTOGRAM,
+            "Similarity compare time by stage",
+        ),
+        "rate_limit_rejections_total": (
+            MetricType.COUNTER,
+            "Requests rejected by the rate limiter",
+        ),
+        "db_query_duration_seconds": (
+            MetricType.HISTOGRAM,
+            "Repository call time, executor wait included, by function",
+        ),
+    }
+    _COUNTERS: dict[tuple[str, Labels], float] = {}
+    _HISTOGRAMS: dict[tuple[str, Labels], Histogram] = {}
+    _COLLECTORS: Collectors = {}
+    _TASK: Task = None
+
+    @classmethod
+    def increment(cls, name: str, amount: float = 1, **labels: str) -> None:
+        key = (name, tuple(labels.items()))
+        cls._COUNTERS[key] = cls._COUNTERS.get(key, 0) + amount
+
+    @classmethod
+    def observe(cls, name: str, seconds: float, **labels: str) -> None:
+        key = (name, tuple(labels.items()))
+        histogram = cls._HISTOGRAMS.get(key)
+
+        if histogram is None:
+            histogram = cls._HISTOGRAMS[key] = Histogram()
+
+        histogram.observe(seconds)
+
+    @classmethod
+    @contextmanager
+    def measure(cls, name: str, **labels: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            cls.observe(name, perf_counter() - start, **labels)
+
+    @classmethod
+    def reset(cls) -> None:
+        rmtree(cls._DIR, ignore_errors=True)
+
+    @classmethod
+    def start(cls, collectors: Collectors) -> None:
+        cls._COLLECTORS = collectors
+        cls._DIR.mkdir(parents=True, exist_ok=True)
+        cls._TASK = create_task(cls.__export(), context=Context())
+        LOG.info(f"Metrics exported every {cls._INTERVAL}s to {cls._DIR}")
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._TASK is None:
+            return
+
+        cls._TASK.cancel()
+        try:
+            await cls._TASK
+        except CancelledError:
+            pass
+
+        cls._TASK = None
+        await to_thread(cls.__write, cls.snapshot())
+
+    @classmethod
+    def snapshot(cls) -> dict[str, Any]:
+        gauges = []
+
+        for collector, stats in cls._COLLECTORS.items():
+            for key, value in stats().items():
+                if isinstance(value, (int, float)) and key != "hit_ratio":
+                    gauges.append([f"{collector}_{key}", value])
+
+        return {
+            "pid": getpid(),
+            "updated": time(),
+            "counters": [
+                [name, labels, value]
+                for (name, labels), value in cls._COUNTERS.items()
+            ],
+            "histograms": [
+                [name, labels, list(histogram.counts), histogram.total]
+                for (name, labels), histogram in cls._HISTOGRAMS.items()
+            ],
+            "gauges": gauges,
+        }
+
+    @classmethod
+    async def exposition(cls) -> str:
+        snapshots = await to_thread(cls.__read)
+        snapshots.append(cls.snapshot())
+
+        counters: dict[tuple[str, Labels], float] = {}
+        histograms: dict[tuple[str, Labels], Histogram] = {}
+
+        for snapshot in snapshots:
+            for name, labels, value in snapshot["counters"]:
+                key = (name, tuple(map(tuple, labels)))
+                counters[key] = counters.get(key, 0) + value
+
+            for name, labels, counts, total in snapshot["histograms"]:
+                key = (name, tuple(map(tuple, labels)))
+                histogram = histograms.setdefault(key, Histogram())
+                histogram.merge(Histogram(counts, total))
+
+        lines: list[str] = []
+        for name, (metric_type, description) in cls._HELP.items():
+            lines.append(f"# HELP {PREFIX}{name} {description}")
+            lines.append(f"# TYPE {PREFIX}{name} {metric_type}")
+
+            if metric_type == MetricType.COUNTER:
+                lines.extend(cls.__counter_lines(name, counters))
+            else:
+                lines.extend(cls.__histogram_lines(name, histograms))
+
+        lines.extend(cls.__gauge_lines(snapshots))
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    async def __export(cls) -> None:
+        while True:
+            await sleep(cls._INTERVAL)
+
+            try:
+                await to_thread(cls.__write, cls.snapshot())
+
+            except Exception as error:  # pylint: disable=W0718
+                LOG.error("Failed to export the worker metrics")
+                LOG.exception(error)
+
+    @classmethod
+    def __write(cls, snapshot: dict[str, Any]) -> None:
+        file = cls._DIR / f"{snapshot['pid']}.json"
+        temp_file = file.with_suffix(".tmp")
+
+        cls._DIR.mkdir(parents=True, exist_ok=True)
+        temp_file.write_text(dumps(snapshot), encoding="utf-8")
+        temp_file.replace(file)
+
+    @classmethod
+    def __read(cls) -> list[dict[str, Any]]:
+        snapshots = []
+
+        for file in cls._DIR.glob("*.json"):
+            if file.stem == str(getpid()):
+                continue
+
+            try:
+                snapshots.append(loads(file.read_text(encoding="utf-8")))
+            except (OSError, JSONDecodeError):
+                continue
+
+        return snapshots
+
+    @staticmethod
+    def __counter_lines(
+        name: str, counters: dict[tuple[str, Labels], float]
+    ) -> Iterator[str]:
+        for (metric, labels), value in sorted(counters.items()):
+            if metric == name:
+                value_text = format_value(value)
+                yield f"{PREFIX}{name}{format_labels(labels)} {value_text}"
+
+    @staticmethod
+    def __histogram_lines(
+        name: str, histograms: dict[tuple[str, Labels], Histogram]
+    ) -> Iterator[str]:
+        for (metric, labels), histogram in sorted(
+            histograms.items(), key=lambda item: item[0]
+        ):
+            if metric != name:
+                continue
+
+            cumulative = 0
+            bounds = [*map(format_value, BUCKETS), "+Inf"]
+
+            for bound, count in zip(bounds, histogram.counts):
+                cumulative += count
+                bucket = format_labels((*labels, ("le", bound)))
+                yield f"{PREFIX}{name}_bucket{bucket} {cumulative}"
+
+            total = format_value(histogram.total)
+            yield f"{PREFIX}{name}_sum{format_labels(labels)} {total}"
+            yield f"{PREFIX}{name}_count{format_labels(labels)} {cumulative}"
+
+    @classmethod
+    def __gauge_lines(cls, snapshots: list[dict[str, Any]]) -> Iterator[str]:
+        deadline = time() - cls._STALE
+        fresh = [item for item in snapshots if item["updated"] >= deadline]
+        gauges: dict[str, list[tuple[int, float]]] = {}
+
+        for snapshot in fresh:
+            for name, value in snapshot["gauges"]:
+                gauges.setdefault(name, []).append((snapshot["pid"], value))
+
+        for name, values in sorted(gauges.items()):
+            description = name.replace("_", " ").capitalize()
+            yield f"# HELP {PREFIX}{name} {description} of each worker"
+            yield f"# TYPE {PREFIX}{name} {MetricType.GAUGE}"
+
+            for pid, value in sorted(values):
+                labels = format_labels((("pid", str(pid)),))
+                yield f"{PREFIX}{name}{labels} {format_value(value)}"
+
+        yield from cls.__hit_ratio_lines(gauges)
+
+    @staticmethod
+    def __hit_ratio_lines(
+        gauges: dict[str, list[tuple[int, float]]],
+    ) -> Iterator[str]:
+        yield f"# HELP {PREFIX}cache_hit_ratio Cache hits over lookups"
+        yield f"# TYPE {PREFIX}cache_hit_ratio {MetricType.GAUGE}"
+
+        for name in sorted(gauges):
+            if not name.endswith("_hits"):
+                continue
+
+            cache = name.removesuffix("_hits")
+            hits = sum(value for _, value in gauges[name])
+            misses = sum(
+                value for _, value in gauges.get(f"{cache}_misses", [])
+            )
+            ratio = hits / (hits + misses) if hits + misses else 0.0
+
+            labels = format_labels((("cache", cache),))
+            yield f"{PREFIX}cache_hit_ratio{labels} {format_value(ratio)}"
@@ -0,0 +1,87 @@
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from src.core.config import ENV, LOG
+
+
+class CachedRender(NamedTuple):
+    similarity: float
+    render: bytes
+    diff_mask: bytes
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.render) + len(self.diff_mask)
+
+
+class RenderCache:
+    """Content-addressed LRU cache of rendered and scored pages"""
+
+    _ENTRIES: OrderedDict[str, CachedRender] = OrderedDict()
+    _MAX_BYTES = ENV.render_cache_mb * 1024 * 1024
+    _BYTES = 0
+    _HITS = 0
+    _MISSES = 0
+
+    @classmethod
+    def key(cls, snapshot: dict[str, bytes], *variants: object) -> str:
+        digest = sha256()
+        files = {
+            Path(path).name: content for path, content in snapshot.items()
+        }
+
+        for name in sorted(files):
+            digest.update(name.encode())
+            digest.update(b"\0")
+            digest.update(files[name])
+            digest.update(b"\0")
+
+        for variant in variants:
+            digest.update(str(variant).encode())
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    @classmethod
+    def get(cls, key: str) -> CachedRender | None:
+        entry = cls._ENTRIES.get(key)
+
+        if entry is None:
+            cls._MISSES += 1
+            return None
+
+        cls._HITS += 1
+        cls._ENTRIES.move_to_end(key)
+        return entry
+
+    @classmethod
+    def put(cls, key: str, entry: CachedRender) -> None:
+        if entry.nbytes > cls._MAX_BYTES:
+            return
+
+        previous = cls._ENTRIES.pop(key, None)
+        if previous is not None:
+            cls._BYTES -= previous.nbytes
+
+        cls._ENTRIES[key] = entry
+        cls._BYTES += entry.nbytes
+
+        while cls._BYTES > cls._MAX_BYTES:
+            _, evicted = cls._ENTRIES.popitem(last=False)
+            cls._BYTES -= evicted.nbytes
+
+        LOG.debug({"render_cache": cls.stats()})
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        lookups = cls._HITS + cls._MISSES
+        return {
+            "entries": len(cls._ENTRIES),
+            "bytes": cls._BYTES,
+            "max_bytes": cls._MAX_BYTES,
+            "hits": cls._HITS,
+            "misses": cls._MISSES,
+            "hit_ratio": round(cls._HITS / lookups, 4) if lookups else 0.0,
+        }
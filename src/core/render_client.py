@@ -0,0 +1,104 @@
+from asyncio import (
+    IncompleteReadError,
+    StreamReader,
+    open_unix_connection,
+    wait_for,
+)
+from base64 import b64decode, b64encode
+from json import dumps
+from os import getpid
+from pathlib import Path
+from struct import Struct
+from typing import Any
+
+from src.core.config import ENV, LOG, RENDER_DIR
+
+HEADER = Struct("!BI")
+LENGTH = Struct("!I")
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+
+def socket_path(index: int) -> Path:
+    return RENDER_DIR / f"render_{index}.sock"
+
+
+async def read_frame(reader: StreamReader) -> bytes:
+    (length,) = LENGTH.unpack(await reader.readexactly(LENGTH.size))
+    return await reader.readexactly(length)
+
+
+def encode_frame(payload: bytes) -> bytes:
+    return LENGTH.pack(len(payload)) + payload
+
+
+def encode_reply(status: int, payload: bytes) -> bytes:
+    return HEADER.pack(status, len(payload)) + payload
+
+
+def encode_files(files: dict[str, bytes]) -> dict[str, str]:
+    return {
+        path: b64encode(content).decode() for path, content in files.items()
+    }
+
+
+def decode_files(files: dict[str, str]) -> dict[str, bytes]:
+    return {path: b64decode(content) for path, content in files.items()}
+
+
+class RenderClient:
+    """Submits render jobs to the host-wide render processes"""
+
+    _PROCESSES = ENV.render_processes
+    _REPLY_TIMEOUT = 60  # 60s
+    _NEXT = getpid()
+
+    @classmethod
+    async def render(cls, static_url: str, **options: Any) -> bytes:
+        job = dumps({"url": static_url, **options}).encode()
+        last_error: Exception = None
+
+        for _ in range(cls._PROCESSES):
+            cls._NEXT = (cls._NEXT + 1) % cls._PROCESSES
+            path = socket_path(cls._NEXT)
+
+            try:
+                reader, writer = await open_unix_connection(path)
+            except OSError as error:
+                LOG.error(f"Render process socket {path} unavailable")
+                last_error = error
+                continue
+
+            try:
+                writer.write(encode_frame(job))
+                await writer.drain()
+
+                status, payload = await wait_for(
+                    cls.__read_reply(reader), cls._REPLY_TIMEOUT
+                )
+
+            except TimeoutError as error:
+                LOG.error(f"Render process {path} did not reply in time")
+                last_error = error
+                continue
+
+            except (OSError, IncompleteReadError) as error:
+                LOG.error(f"Render process {path} dropped the connection")
+                last_error = error
+                continue
+
+            finally:
+                writer.close()
+
+            if status != STATUS_OK:
+                raise RuntimeError(payload.decode())
+
+            return payload
+
+        raise ConnectionError("No render process available") from last_error
+
+    @staticmethod
+    async def __read_reply(reader: StreamReader) -> tuple[int, bytes]:
+        status, length = HEADER.unpack(await reader.readexactly(HEADER.size))
+        return status, await reader.readexactly(length)
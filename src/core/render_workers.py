@@ -0,0 +1,128 @@
+from asyncio import (
+    Event,
+    StreamReader,
+    StreamWriter,
+    get_running_loop,
+    start_unix_server,
+)
+from json import loads
+from multiprocessing import get_context
+from multiprocessing.process import BaseProcess
+from signal import SIGINT, SIGTERM
+from time import monotonic, sleep
+
+from uvloop import run
+
+from src.core.config import ENV, LOG, RENDER_DIR
+from src.core.render_client import (
+    STATUS_ERROR,
+    STATUS_OK,
+    decode_files,
+    encode_reply,
+    read_frame,
+    socket_path,
+)
+from src.core.screenshot_service import ScreenshotService
+
+
+class RenderWorkers:
+    """Host-wide render processes, each one owning a browser"""
+
+    _CONTEXT = get_context("spawn")
+    _PROCESSES: list[BaseProcess] = []
+    _START_TIMEOUT = 30  # 30s
+
+    @classmethod
+    def start(cls) -> None:
+        if ENV.render_processes == 0:
+            return
+
+        RENDER_DIR.mkdir(parents=True, exist_ok=True)
+
+        for index in range(ENV.render_processes):
+            socket_path(index).unlink(missing_ok=True)
+            process = cls._CONTEXT.Process(
+                target=serve,
+                args=(index,),
+                name=f"render_{index}",
+                daemon=True,
+            )
+            process.start()
+            cls._PROCESSES.append(process)
+
+        deadline = monotonic() + cls._START_TIMEOUT
+
+        for index, process in enumerate(cls._PROCESSES):
+            while not socket_path(index).exists():
+                if not process.is_alive() or monotonic() > deadline:
+                    cls.stop()
+                    raise RuntimeError(f"Render process {index} not started")
+                sleep(0.1)
+
+        LOG.info(
+            f"\033[33mStarted {len(cls._PROCESSES)} render processes"
+            f" [\033[36m{', '.join(str(p.pid) for p in cls._PROCESSES)}"
+            "\033[33m]"
+        )
+
+    @classmethod
+    def stop(cls) -> None:
+        for process in cls._PROCESSES:
+            if process.is_alive():
+                process.terminate()
+
+        for index, process in enumerate(cls._PROCESSES):
+            process.join(timeout=10)
+            socket_path(index).unlink(missing_ok=True)
+
+        cls._PROCESSES.clear()
+
+
+def serve(index: int) -> None:
+    run(_serve(index))
+
+
+async def _serve(index: int) -> None:
+    path = socket_path(index)
+    stop = Event()
+
+    loop = get_running_loop()
+    loop.add_signal_handler(SIGTERM, stop.set)
+    loop.add_signal_handler(SIGINT, stop.set)
+
+    await ScreenshotService.initialize(remote=False)
+    server = await start_unix_server(_handle_job, path=path)
+    LOG.info(f"Render process {index} listening on {path}")
+
+    async with server:
+        await stop.wait()
+
+    await ScreenshotService.cleanup()
+    path.unlink(missing_ok=True)
+
+
+async def _handle_job(reader: StreamReader, writer: StreamWriter) -> None:
+    try:
+        job = loads(await read_frame(reader))
+        static_url = job.pop("url")
+
+        if job.get("files") is not None:
+            job["files"] = decode_files(job["files"])
+
+        try:
+            screenshot = await ScreenshotService.render(static_url, **job)
+            writer.write(encode_reply(STATUS_OK, screenshot))
+
+        except Exception as error:  # pylint: disable=W0718
+            LOG.error(f"Failed to render {static_url}")
+            LOG.exception(error)
+            writer.write(encode_reply(STATUS_ERROR, repr(error).encode()))
+
+        await writer.drain()
+
+    except Exception as error:  # pylint: disable=W0718
+        LOG.error("Failed to handle render job")
+        LOG.exception(error)
+
+    finally:
+        writer.close()
@@ -0,0 +1,61 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from time import perf_counter
+from typing import NamedTuple
+
+
+class StageTimes(NamedTuple):
+    start: float
+    stages: dict[str, float]
+
+
+class RequestTiming:
+    """Request-scoped durations of the processing stages"""
+
+    _CURRENT: ContextVar[StageTimes | None] = ContextVar(
+        "request_timing", default=None
+    )
+
+    @classmethod
+    def start(cls) -> Token:
+        return cls._CURRENT.set(StageTimes(perf_counter(), {}))
+
+    @classmethod
+    def stop(cls, token: Token) -> None:
+        cls._CURRENT.reset(token)
+
+    @classmethod
+    def elapsed(cls) -> float:
+        timing = cls._CURRENT.get()
+        return perf_counter() - timing.start if timing else 0.0
+
+    @classmethod
+    def record(cls, stage: str, seconds: float) -> None:
+        timing = cls._CURRENT.get()
+
+        if timing is not None:
+            timing.stages[stage] = timing.stages.get(stage, 0.0) + seconds
+
+    @classmethod
+    @contextmanager
+    def measure(cls, stage: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            cls.record(stage, perf_counter() - start)
+
+    @classmethod
+    def server_timing(cls) -> str:
+        timing = cls._CURRENT.get()
+
+        if timing is None:
+            return ""
+
+        metrics = [
+            f"{stage};dur={seconds * 1000:.2f}"
+            for stage, seconds in timing.stages.items()
+        ]
+        metrics.append(f"total;dur={cls.elapsed() * 1000:.2f}")
+        return ", ".join(metrics)
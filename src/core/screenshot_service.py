@@ -1,8 +1,25 @@
-from asyncio import Lock
+from asyncio import Lock, Queue, wait_for
+from contextlib import asynccontextmanager
+from http import HTTPStatus
+from mimetypes import guess_type
+from pathlib import Path
+from time import perf_counter
+from typing import Any, AsyncIterator
+from urllib.parse import unquote, urlsplit
 
-from playwright.async_api import Browser, Page, Playwright, async_playwright
+from playwright.async_api import (
+    Browser,
+    Page,
+    Playwright,
+    Route,
+    async_playwright,
+)
 
-from src.core.config import ENV
+from src.common.enums import FileType, Readiness, RenderSource
+from src.core.config import ENV, LOG, WEB_DIR
+from src.core.metrics import Metrics
+from src.core.render_client import RenderClient, encode_files
+from src.core.request_timing import RequestTiming
 
 
 class ScreenshotService:
@@ -13,46 +30,289 @@ class ScreenshotService:
         "--disable-gpu",
     ]
     BASE_URL = f"http://{ENV.host}:{ENV.port}"
-    _VIEWPORT = {"width": 1280, "height": 720}
+    VIEWPORT = {"width": 1280, "height": 720}
     _PLAYWRIGHT: Playwright = None
     _BLANK_PAGE = "about:blank"
     _BROWSER: Browser = None
     _NEW_PAGE_TIMEOUT = 7000  # 7s
     _STATUS = "networkidle"
+    _LOAD_STATUS = "load"
+    _READY_TIMEOUT = 2000  # 2s
+    _READY_SCRIPT = """
+        async (timeout) => {
+            const deadline = performance.now() + timeout;
+            const remaining = () => Math.max(0, deadline - performance.now());
+            const expire = () => new Promise((r) => setTimeout(r, remaining()));
+            const frame = () => new Promise((r) => requestAnimationFrame(r));
+            const animated = (node, targets) => {
+                for (let item = node; item; item = item.parentElement) {
+                    if (targets.has(item)) return true;
+                }
+                return false;
+            };
+            const layout = () => {
+                const root = document.documentElement;
+                const targets = new Set(document.getAnimations()
+                    .filter((animation) => animation.playState === "running")
+                    .map((animation) => animation.effect?.target));
+                let sum = root.scrollWidth * 31 + root.scrollHeight;
+                for (const node of document.querySelectorAll("body *")) {
+                    if (animated(node, targets)) continue;
+                    const rect = node.getBoundingClientRect();
+                    sum += rect.x + rect.y * 3 + rect.width * 7 + rect.height;
+                }
+                return sum;
+            };
+            const loaded = (image) => new Promise((r) => {
+                image.addEventListener("load", r, { once: true });
+                image.addEventListener("error", r, { once: true });
+            });
+
+            await Promise.race([document.fonts.ready, expire()]);
+            const pending = [...document.images].filter((i) => !i.complete);
+            await Promise.race([Promise.all(pending.map(loaded)), expire()]);
+
+            let previous = layout();
+            let stable = 0;
+            while (stable < 2 && remaining() > 0) {
+                await frame();
+                const current = layout();
+                stable = current === previous ? stable + 1 : 0;
+                previous = current;
+            }
+            return stable >= 2;
+        }
+    """
     _REQUEST_COUNTER = 0
-    _PAGE: Page = None
+    _POOL: Queue[Page | None] = None
+    _POOL_SIZE = ENV.render_pages
+    _WAITING = 0
+    _WAIT_TOTAL = 0.0
+    _WAIT_MAX = 0.0
+    _WAIT_LAST = 0.0
     _FULL_PAGE = True
     _TIMEOUT = 1000  # 1s
+    _SOURCE = ENV.render_source
+    _REMOTE = False
     _LOCK = Lock()
     _TYPE = "png"
 
     @classmethod
-    async def initialize(cls):
+    async def initialize(cls, remote: bool = None):
+        if remote is None:
+            remote = ENV.render_processes > 0
+
+        cls._REMOTE = remote
+
+        if remote:
+            LOG.info(f"Rendering on {ENV.render_processes} render processes")
+            return
+
         async with cls._LOCK:
             cls._PLAYWRIGHT = await async_playwright().start()
             cls._BROWSER = await cls._PLAYWRIGHT.chromium.launch(
                 headless=True, args=cls._ARGS
             )
-            cls._PAGE = await cls._BROWSER.new_page(
-                viewport=cls._VIEWPORT, base_url=cls.BASE_URL
-            )
+            cls._POOL = Queue(maxsize=cls._POOL_SIZE)
+
+            for _ in range(cls._POOL_SIZE):
+                cls._POOL.put_nowait(await cls.__new_page())
+
+            LOG.info(f"Screenshot pages pool of {cls._POOL_SIZE} started")
 
     @classmethod
-    async def render(cls, static_url: str) -> bytes:
-        await cls._PAGE.goto(cls._BLANK_PAGE)
-        await cls._PAGE.goto(static_url, wait_until=cls._STATUS)
-        await cls._PAGE.wait_for_timeout(cls._TIMEOUT)
+    async def render(
+        cls,
+        static_url: str,
+        readiness: Readiness = Readiness.FIXED,
+        files: dict[str, bytes] | None = None,
+    ) -> bytes:
+        with (
+            RequestTiming.measure("render"),
+            Metrics.measure("render_duration_seconds"),
+        ):
+            try:
+                return await cls.__render(static_url, readiness, files)
+            except Exception:
+                Metrics.increment("render_failures_total")
+                raise
+
+    @classmethod
+    async def __render(
+        cls,
+        static_url: str,
+        readiness: Readiness,
+        files: dict[str, bytes] | None,
+    ) -> bytes:
+        readiness = Readiness(readiness)
+
+        if cls._REMOTE:
+            return await RenderClient.render(
+                str(static_url),
+                readiness=readiness.value,
+                files=encode_files(files) if files else None,
+            )
+
+        async with cls.__checkout() as page:
+            await page.goto(cls._BLANK_PAGE)
+
+            if cls._SOURCE == RenderSource.DISK:
+                snapshot = files or {}
+
+                async def handler(route: Route) -> None:
+                    await cls.__fulfill(route, snapshot)
+
+                await page.route(f"{cls.BASE_URL}/**", handler)
+
+            try:
+                if readiness == Readiness.ADAPTIVE:
+                    await page.goto(static_url, wait_until=cls._LOAD_STATUS)
+                    await cls.__wait_until_stable(page)
+                else:
+                    await page.goto(static_url, wait_until=cls._STATUS)
+                    await page.wait_for_timeout(cls._TIMEOUT)
+
+                screenshot_bytes = await page.screenshot(
+                    full_page=cls._FULL_PAGE,
+                    type=cls._TYPE,
+                )
+
+            finally:
+                if cls._SOURCE == RenderSource.DISK:
+                    await page.unroute_all(behavior="ignoreErrors")
 
-        screenshot_bytes = await cls._PAGE.screenshot(
-            full_page=cls._FULL_PAGE,
-            type=cls._TYPE,
-        )
         return screenshot_bytes
 
+    @staticmethod
+    def snapshot(page_dir: Path) -> dict[str, bytes]:
+        files = (page_dir / file_type.file for file_type in FileType)
+        return {
+            str(file_path): file_path.read_bytes()
+            for file_path in files
+            if file_path.is_file()
+        }
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        renders = max(cls._REQUEST_COUNTER, 1)
+        return {
+            "pool_size": cls._POOL_SIZE,
+            "idle_pages": cls._POOL.qsize() if cls._POOL else 0,
+            "waiting": cls._WAITING,
+            "renders": cls._REQUEST_COUNTER,
+            "wait_last": round(cls._WAIT_LAST, 4),
+            "wait_max": round(cls._WAIT_MAX, 4),
+            "wait_avg": round(cls._WAIT_TOTAL / renders, 4),
+        }
+
     @classmethod
     async def cleanup(cls):
-        if not cls._PAGE.is_closed():
-            await cls._PAGE.close()
+        if cls._REMOTE:
+            return
+        while cls._POOL is not None and not cls._POOL.empty():
+            page = cls._POOL.get_nowait()
+            if page is not None:
+                await page.context.close()
         if cls._BROWSER.is_connected():
             await cls._BROWSER.close()
         await cls._PLAYWRIGHT.stop()
+
+    @classmethod
+    @asynccontextmanager
+    async def __checkout(cls) -> AsyncIterator[Page]:
+        start_time = perf_counter()
+        cls._WAITING += 1
+
+        try:
+            page = await cls.__acquire()
+        finally:
+            cls._WAITING -= 1
+
+        wait_time = perf_counter() - start_time
+        cls._REQUEST_COUNTER += 1
+        cls._WAIT_LAST = wait_time
+        cls._WAIT_TOTAL += wait_time
+        cls._WAIT_MAX = max(cls._WAIT_MAX, wait_time)
+        LOG.debug({"render_pool": cls.stats()})
+
+        healthy = False
+        try:
+            yield page
+            healthy = not page.is_closed()
+        finally:
+            if healthy:
+                cls._POOL.put_nowait(page)
+            else:
+                cls._POOL.put_nowait(None)
+                await cls.__close_page(page)
+
+    @classmethod
+    async def __acquire(cls) -> Page:
+        page = await cls._POOL.get()
+
+        if page is not None:
+            return page
+
+        try:
+            return await cls.__new_page()
+        except BaseException:
+            cls._POOL.put_nowait(None)
+            raise
+
+    @classmethod
+    async def __wait_until_stable(cls, page: Page) -> None:
+        start_time = perf_counter()
+
+        try:
+            stable = await wait_for(
+                page.evaluate(cls._READY_SCRIPT, cls._READY_TIMEOUT),
+                timeout=cls._READY_TIMEOUT / 1000 + 1,
+            )
+        except TimeoutError:
+            stable = False
+
+        ready_time = perf_counter() - start_time
+        LOG.debug({"page_stable": stable, "ready_time": round(ready_time, 4)})
+
+        if not stable:
+            LOG.error(f"Page not stable after {ready_time:.2f}s")
+
+    @classmethod
+    async def __fulfill(cls, route: Route, files: dict[str, bytes]) -> None:
+        path = unquote(urlsplit(route.request.url).path).lstrip("/")
+        content = files.get(path)
+
+        if content is None:
+            file_path = Path(path).resolve()
+            web_dir = WEB_DIR.resolve()
+
+            if (
+                not file_path.is_relative_to(web_dir)
+                or not file_path.is_file()
+            ):
+                await route.fulfill(status=HTTPStatus.NOT_FOUND)
+                return
+
+            content = file_path.read_bytes()
+
+        await route.fulfill(
+            status=HTTPStatus.OK,
+            body=content,
+            content_type=guess_type(path)[0] or "application/octet-stream",
+        )
+
+    @classmethod
+    async def __new_page(cls) -> Page:
+        context = await cls._BROWSER.new_context(
+            viewport=cls.VIEWPORT, base_url=cls.BASE_URL
+        )
+        return await context.new_page()
+
+    @classmethod
+    async def __close_page(cls, page: Page) -> None:
+        try:
+            await page.context.close()
+
+        except Exception as error:  # pylint: disable=W0718
+            LOG.error("Failed to close a screenshot pool page")
+            LOG.exception(error)
@@ -0,0 +1,162 @@
+from datetime import datetime
+from pathlib import Path
+from stat import S_ISDIR
+from struct import Struct
+from typing import NamedTuple
+from zlib import DEFLATED, compressobj, crc32
+
+LOCAL_HEADER = Struct("<IHHHHHIIIHH")
+CENTRAL_HEADER = Struct("<IHHHHHHIIIHHHHHII")
+END_RECORD = Struct("<IHHHHIIH")
+
+LOCAL_SIGNATURE = 0x04034B50
+CENTRAL_SIGNATURE = 0x02014B50
+END_SIGNATURE = 0x06054B50
+
+ZIP_VERSION = 20
+UNIX_HOST = 3
+MADE_BY_VERSION = (UNIX_HOST << 8) | ZIP_VERSION
+UTF8_FLAG = 0x800
+STORED = 0
+DIRECTORY_ATTR = 0x10
+MIN_TIMESTAMP = datetime(1980, 1, 1).timestamp()
+MAX_ENTRIES = 0xFFFF
+MAX_SIZE = 0xFFFFFFFF
+
+
+class ZipEntry(NamedTuple):
+    name: bytes
+    method: int
+    time: int
+    date: int
+    crc: int
+    size: int
+    mode: int
+    data: bytes
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.name) + len(self.data)
+
+    @property
+    def is_dir(self) -> bool:
+        return self.name.endswith(b"/")
+
+    def local_record(self) -> bytes:
+        header = LOCAL_HEADER.pack(
+            LOCAL_SIGNATURE,
+            ZIP_VERSION,
+            UTF8_FLAG,
+            self.method,
+            self.time,
+            self.date,
+            self.crc,
+            len(self.data),
+            self.size,
+            len(self.name),
+            0,
+        )
+        return header + self.name + self.data
+
+    def central_record(self, offset: int) -> bytes:
+        attributes = self.mode << 16
+        if self.is_dir:
+            attributes |= DIRECTORY_ATTR
+
+        header = CENTRAL_HEADER.pack(
+            CENTRAL_SIGNATURE,
+            MADE_BY_VERSION,
+            ZIP_VERSION,
+            UTF8_FLAG,
+            self.method,
+            self.time,
+            self.date,
+            self.crc,
+            len(self.data),
+            self.size,
+            len(self.name),
+            0,
+            0,
+            0,
+            0,
+            attributes,
+            offset,
+        )
+        return header + self.name
+
+
+def dos_timestamp(mtime: float) -> tuple[int, int]:
+    moment = datetime.fromtimestamp(max(mtime, MIN_TIMESTAMP))
+    time = (moment.hour << 11) | (moment.minute << 5) | (moment.second // 2)
+    date = ((moment.year - 1980) << 9) | (moment.month << 5) | moment.day
+    return time, date
+
+
+def zip_entry(arcname: str, path: Path, level: int) -> ZipEntry:
+    stat = path.stat()
+    time, date = dos_timestamp(stat.st_mtime)
+
+    if S_ISDIR(stat.st_mode):
+        name = f"{arcname.rstrip('/')}/".encode()
+        return ZipEntry(name, STORED, time, date, 0, 0, stat.st_mode, b"")
+
+    content = path.read_bytes()
+
+    if len(content) > MAX_SIZE:
+        raise ValueError(f"File {arcname} is too large to zip")
+
+    if level == 0:
+        method, data = STORED, content
+
+    else:
+        compressor = compressobj(level, DEFLATED, -15)
+        method = DEFLATED
+        data = compressor.compress(content) + compressor.flush()
+
+    return ZipEntry(
+        arcname.encode(),
+        method,
+        time,
+        date,
+        crc32(content),
+        len(content),
+        stat.st_mode,
+        data,
+    )
+
+
+class ZipStream:
+    """Zip archive written incrementally as byte chunks"""
+
+    def __init__(self) -> None:
+        self.__offset = 0
+        self.__central: list[bytes] = []
+
+    def add(self, entry: ZipEntry) -> bytes:
+        if len(self.__central) >= MAX_ENTRIES:
+            raise ValueError("Too many files to zip")
+
+        record = entry.local_record()
+        self.__central.append(entry.central_record(self.__offset))
+        self.__offset += len(record)
+
+        if self.__offset > MAX_SIZE:
+            raise ValueError("Zip archive is too large")
+
+        return record
+
+    def close(self) -> bytes:
+        directory = b"".join(self.__central)
+        count = len(self.__central)
+
+        end_record = END_RECORD.pack(
+            END_SIGNATURE,
+            0,
+            0,
+            count,
+            count,
+            len(directory),
+            self.__offset,
+            0,
+        )
+        return directory + end_record
@@ -1,5 +1,17 @@
 from .base_repository import BaseRepository
+from .database_executor import DatabaseExecutor
 from .dynamic_repository import DynamicRepository
+from .job_repository import JobRepository
+from .rate_limit_repository import RateLimitRepository
 from .report_repository import ReportRepository
+from .report_writer import ReportWriter
 
-__all__ = ["BaseRepository", "DynamicRepository", "ReportRepository"]
+__all__ = [
+    "BaseRepository",
+    "DatabaseExecutor",
+    "DynamicRepository",
+    "JobRepository",
+    "RateLimitRepository",
+    "ReportRepository",
+    "ReportWriter",
+]
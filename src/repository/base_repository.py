@@ -1,28 +1,128 @@
-from sqlite3 import Error, connect
+from contextlib import contextmanager
+from sqlite3 import Connection, Error, OperationalError, connect
+from threading import Lock, local
+from time import sleep
+from typing import Iterator
 
 from src.core.config import ENV, LOG
 from src.repository import queries
+from src.repository.migrations import MIGRATIONS
 
 
 class BaseRepository:
     _DATABASE = ENV.database_file
+    _TIMEOUT = 10.0
+    _CACHED_STATEMENTS = 256
+    _RETRIES = 5
+    _LOCAL = local()
+    _CONNECTIONS: list[Connection] = []
+    _LOCK = Lock()
 
     @classmethod
     def set_database(cls, database: str) -> None:
+        cls.close()
         cls._DATABASE = database
 
     @classmethod
-    def create_tables(cls) -> None:
+    @contextmanager
+    def _connect(cls) -> Iterator[Connection]:
+        connection = cls.__get_connection()
+        with connection:
+            yield connection
+
+    @classmethod
+    def checkpoint(cls) -> None:
+        try:
+            with cls._connect() as connection:
+                connection.execute(queries.WAL_CHECKPOINT)
+
+        except Error as error:
+            LOG.error("Failed to checkpoint the database")
+            LOG.exception(error)
+
+    @classmethod
+    def close(cls) -> None:
+        with cls._LOCK:
+            for connection in cls._CONNECTIONS:
+                connection.close()
+            cls._CONNECTIONS.clear()
+
+        BaseRepository._LOCAL = local()
+
+    @classmethod
+    def migrate(cls) -> None:
         try:
-            with connect(cls._DATABASE) as connection:
+            with cls._connect() as connection:
                 cursor = connection.cursor()
-                cursor.execute(queries.CREATE_REPORT_TABLE)
-                cursor.execute(queries.CREATE_DYNAMIC_TABLE)
-                connection.commit()
 
-            LOG.info("\033[33mTables created successfully")
+                for version, migration in enumerate(MIGRATIONS, 1):
+                    cursor.execute(queries.BEGIN_IMMEDIATE)
+                    cursor.execute(queries.SELECT_USER_VERSION)
+
+                    if cursor.fetchone()[0] >= version:
+                        connection.rollback()
+                        continue
+
+                    migration(cursor)
+                    cursor.execute(
+                        queries.UPDATE_USER_VERSION.format(version=version)
+                    )
+                    connection.commit()
+
+                    LOG.info(f"Database migrated to version {version}")
+
+            LOG.info("\033[33mDatabase migrated successfully")
 
         except Error as error:
-            LOG.error("Failed to create tables")
+            LOG.error("Failed to migrate the database")
             LOG.exception(error)
-            raise Error("Failed to create tables") from error
+            raise Error("Failed to migrate the database") from error
+
+    @classmethod
+    def __get_connection(cls) -> Connection:
+        connection: Connection | None = getattr(cls._LOCAL, "connection", None)
+
+        if connection is None:
+            connection = cls.__open_connection()
+
+            with cls._LOCK:
+                cls._CONNECTIONS.append(connection)
+
+            cls._LOCAL.connection = connection
+
+        return connection
+
+    @classmethod
+    def __open_connection(cls) -> Connection:
+        for attempt in range(1, cls._RETRIES):
+            try:
+                return cls.__configure(cls.__new_connection())
+
+            except OperationalError as error:
+                LOG.error(f"Database busy, retrying connection ({error})")
+                sleep(0.05 * attempt)
+
+        return cls.__configure(cls.__new_connection())
+
+    @classmethod
+    def __new_connection(cls) -> Connection:
+        return connect(
+            cls._DATABASE,
+            timeout=cls._TIMEOUT,
+            isolation_level="IMMEDIATE",
+            check_same_thread=False,
+            cached_statements=cls._CACHED_STATEMENTS,
+        )
+
+    @staticmethod
+    def __configure(connection: Connection) -> Connection:
+        try:
+            connection.execute(queries.WAL_JOURNAL_MODE)
+            for pragma in queries.CONNECTION_PRAGMAS:
+                connection.execute(pragma)
+
+        except OperationalError:
+            connection.close()
+            raise
+
+        return connection
@@ -0,0 +1,50 @@
+from asyncio import get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from typing import Callable, ParamSpec, TypeVar
+
+from src.core.config import LOG
+from src.core.metrics import Metrics
+from src.core.request_timing import RequestTiming
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class DatabaseExecutor:
+    """Runs the blocking repository calls off the event loop"""
+
+    _THREADS = 4
+    _EXECUTOR: ThreadPoolExecutor = None
+
+    @classmethod
+    async def run(
+        cls, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        call = partial(copy_context().run, func, *args, **kwargs)
+        query = getattr(func, "__name__", "call")
+
+        with (
+            RequestTiming.measure("db"),
+            Metrics.measure("db_query_duration_seconds", query=query),
+        ):
+            return await get_running_loop().run_in_executor(
+                cls.__get_executor(), call
+            )
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._EXECUTOR is not None:
+            cls._EXECUTOR.shutdown(wait=True)
+        cls._EXECUTOR = None
+
+    @classmethod
+    def __get_executor(cls) -> ThreadPoolExecutor:
+        if cls._EXECUTOR is None:
+            cls._EXECUTOR = ThreadPoolExecutor(
+                max_workers=cls._THREADS, thread_name_prefix="database"
+            )
+            LOG.info(f"Database executor started with {cls._THREADS} threads")
+
+        return cls._EXECUTOR
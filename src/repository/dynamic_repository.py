@@ -1,25 +1,43 @@
 from http import HTTPStatus
-from sqlite3 import Error, connect
+from sqlite3 import Cursor, Error
+from time import monotonic
+from typing import Any, NamedTuple
 
 from fastapi import HTTPException
 
 from src.api.presenters import HTTPError
+from src.common.enums import Readiness
 from src.core.config import DEFAULT_WEIGHT, LOG
 from src.repository import queries
 from src.repository.base_repository import BaseRepository
 
 
+class DynamicMetadata(NamedTuple):
+    lock_requests: int
+    weight: int
+    size: str | None
+    readiness: str
+
+
 class DynamicRepository(BaseRepository):
+    _METADATA: dict[str, DynamicMetadata] = {}
+    _REVISION: tuple[str, int] | None = None
+    _REVISION_TTL = 1.0
+    _REVISION_CHECKED = 0.0
+    _HITS = 0
+    _MISSES = 0
 
     @classmethod
     def add_dynamic(cls, dynamic: str) -> None:
-        params = (dynamic, True, DEFAULT_WEIGHT)
+        params = (dynamic, True, DEFAULT_WEIGHT, Readiness.ADAPTIVE.value)
         try:
-            with connect(cls._DATABASE) as connection:
+            with cls._connect() as connection:
                 cursor = connection.cursor()
                 cursor.execute(queries.INSERT_DYNAMIC, params)
                 connection.commit()
 
+            cls.__invalidate(dynamic)
+
             LOG.info(f"{dynamic} dynamic added successfully")
 
         except Error as error:
@@ -30,7 +48,7 @@ class DynamicRepository(BaseRepository):
     @classmethod
     def get_dynamics(cls) -> list[str]:
         try:
-            with connect(cls._DATABASE) as connection:
+            with cls._connect() as connection:
                 cursor = connection.cursor()
                 cursor.execute(queries.SELECT_DYNAMICS)
                 dynamics = cursor.fetchall()
@@ -47,11 +65,14 @@ class DynamicRepository(BaseRepository):
     @classmethod
     def remove_dynamic(cls, dynamic: str) -> None:
         try:
-            with connect(cls._DATABASE) as connection:
+            with cls._connect() as connection:
                 cursor = connection.cursor()
                 cursor.execute(queries.DELETE_DYNAMIC, (dynamic,))
+                cursor.execute(queries.DELETE_RATE_BUCKETS, (dynamic,))
                 connection.commit()
 
+            cls.__invalidate(dynamic)
+
             LOG.info("Dynamic removed successfully")
 
         except Error as error:
@@ -59,14 +80,25 @@ class DynamicRepository(BaseRepository):
                 f"Failed removing {dynamic} dynamic", error=error
             ) from error
 
+    @classmethod
+    def check_dynamic(cls, dynamic: str) -> None:
+        try:
+            metadata = cls.__get_metadata(dynamic)
+
+        except Error as error:
+            raise HTTPError(
+                f"Failed getting {dynamic} dynamic", error=error
+            ) from error
+
+        if metadata is None:
+            raise HTTPException(
+                HTTPStatus.NOT_FOUND, f"{dynamic} dynamic not found"
+            )
+
     @classmethod
     def get_lock_status(cls, dynamic: str) -> bool:
         try:
-            with connect(cls._DATABASE) as connection:
-                cursor = connection.cursor()
-                cursor.execute(queries.SELECT_LOCK_STATUS, (dynamic,))
-                lock = cursor.fetchone()
-                connection.commit()
+            metadata = cls.__get_metadata(dynamic)
 
         except Error as error:
             raise HTTPError(
@@ -75,21 +107,23 @@ class DynamicRepository(BaseRepository):
 
         LOG.info(f"Dynamic {dynamic} lock status found")
 
-        if lock is None or len(lock) == 0:
+        if metadata is None:
             raise HTTPException(
                 HTTPStatus.NOT_FOUND, f"{dynamic} lock status not found"
             )
 
-        return bool(lock[0])
+        return bool(metadata.lock_requests)
 
     @classmethod
     def set_lock_status(cls, dynamic: str, lock: int) -> None:
         try:
-            with connect(cls._DATABASE) as connection:
+            with cls._connect() as connection:
                 cursor = connection.cursor()
                 cursor.execute(queries.UPDATE_LOCK_STATUS, (lock, dynamic))
                 connection.commit()
 
+            cls.__invalidate(dynamic)
+
         except Error as error:
             raise HTTPError(
                 f"Failed setting lock status for {dynamic} dynamic",
@@ -99,11 +133,7 @@ class DynamicRepository(BaseRepository):
     @classmethod
     def get_size(cls, dynamic: str) -> tuple[int, int]:
         try:
-            with connect(cls._DATABASE) as connection:
-                cursor = connection.cursor()
-                cursor.execute(queries.SELECT_SIZE, (dynamic,))
-                dimensions = cursor.fetchone()
-                connection.commit()
+            metadata = cls.__get_metadata(dynamic)
 
         except Error as error:
             raise HTTPError(
@@ -112,12 +142,12 @@ class DynamicRepository(BaseRepository):
 
         LOG.info(f"Dynamic {dynamic} weight found")
 
-        if dimensions is None or len(dimensions) == 0 or not all(dimensions):
+        if metadata is None or not metadata.size:
             raise HTTPException(
                 HTTPStatus.NOT_FOUND, f"{dynamic} size not found"
             )
 
-        size = str(dimensions[0]).split("x")
+        size = str(metadata.size).split("x")
 
         return int(size[0]), int(size[1])
 
@@ -125,11 +155,13 @@ class DynamicRepository(BaseRepository):
     def set_size(cls, dynamic: str, size: tuple[int, int]) -> None:
         dimensions = f"{size[0]}x{size[1]}"
         try:
-            with connect(cls._DATABASE) as connection:
+            with cls._connect() as connection:
                 cursor = connection.cursor()
                 cursor.execute(queries.UPDATE_SIZE, (dimensions, dynamic))
                 connection.commit()
 
+            cls.__invalidate(dynamic)
+
         except Error as error:
             LOG.exception(error)
             raise HTTPError(
@@ -140,11 +172,7 @@ class DynamicRepository(BaseRepository):
     @classmethod
     def get_weight(cls, dynamic: str) -> int:
         try:
-            with connect(cls._DATABASE) as connection:
-                cursor = connection.cursor()
-                cursor.execute(queries.SELECT_WEIGHT, (dynamic,))
-                weight = cursor.fetchone()
-                connection.commit()
+            metadata = cls.__get_metadata(dynamic)
 
         except Error as error:
             raise HTTPError(
@@ -153,22 +181,122 @@ class DynamicRepository(BaseRepository):
 
         LOG.info(f"Dynamic {dynamic} weight found")
 
-        if weight is None or len(weight) == 0 or not all(weight):
+        if metadata is None or not metadata.weight:
             raise HTTPException(
                 HTTPStatus.NOT_FOUND, f"{dynamic} weight not found"
             )
 
-        return int(weight[0])
+        return int(metadata.weight)
 
     @classmethod
     def set_weight(cls, dynamic: str, weight: int) -> None:
         try:
-            with connect(cls._DATABASE) as connection:
+            with cls._connect() as connection:
                 cursor = connection.cursor()
                 cursor.execute(queries.UPDATE_WEIGHT, (weight, dynamic))
                 connection.commit()
 
+            cls.__invalidate(dynamic)
+
         except Error as error:
             raise HTTPError(
                 f"Failed setting weight for {dynamic} dynamic", error=error
             ) from error
+
+    @classmethod
+    def get_readiness(cls, dynamic: str) -> Readiness:
+        try:
+            metadata = cls.__get_metadata(dynamic)
+
+        except Error as error:
+            raise HTTPError(
+                f"Failed getting {dynamic} readiness", error=error
+            ) from error
+
+        if metadata is None or not metadata.readiness:
+            raise HTTPException(
+                HTTPStatus.NOT_FOUND, f"{dynamic} readiness not found"
+            )
+
+        return Readiness(metadata.readiness)
+
+    @classmethod
+    def set_readiness(cls, dynamic: str, readiness: Readiness) -> None:
+        params = (readiness.value, dynamic)
+        try:
+            with cls._connect() as connection:
+                cursor = connection.cursor()
+                cursor.execute(queries.UPDATE_READINESS, params)
+                connection.commit()
+
+            cls.__invalidate(dynamic)
+
+        except Error as error:
+            raise HTTPError(
+                f"Failed setting readiness for {dynamic} dynamic",
+                error=error,
+            ) from error
+
+    @classmethod
+    def metadata_stats(cls) -> dict[str, Any]:
+        lookups = cls._HITS + cls._MISSES
+        return {
+            "entries": len(cls._METADATA),
+            "hits": cls._HITS,
+            "misses": cls._MISSES,
+            "hit_ratio": round(cls._HITS / lookups, 4) if lookups else 0.0,
+        }
+
+    @classmethod
+    def __get_metadata(cls, dynamic: str) -> DynamicMetadata | None:
+        if not cls.__revision_due():
+            metadata = cls._METADATA.get(dynamic)
+
+            if metadata is not None:
+                cls._HITS += 1
+                return metadata
+
+        with cls._connect() as connection:
+            cursor = connection.cursor()
+
+            if cls.__revision_due():
+                cls.__check_revision(cursor)
+
+            metadata = cls._METADATA.get(dynamic)
+
+            if metadata is not None:
+                cls._HITS += 1
+                return metadata
+
+            cls._MISSES += 1
+            cursor.execute(queries.SELECT_DYNAMIC_METADATA, (dynamic,))
+            row = cursor.fetchone()
+
+        if row is None:
+            return None
+
+        metadata = DynamicMetadata(*row)
+        cls._METADATA[dynamic] = metadata
+        return metadata
+
+    @classmethod
+    def __revision_due(cls) -> bool:
+        return (
+            cls._REVISION is None
+            or cls._REVISION[0] != cls._DATABASE
+            or monotonic() - cls._REVISION_CHECKED >= cls._REVISION_TTL
+        )
+
+    @classmethod
+    def __check_revision(cls, cursor: Cursor) -> None:
+        cursor.execute(queries.SELECT_REVISION)
+        revision = (cls._DATABASE, cursor.fetchone()[0])
+        cls._REVISION_CHECKED = monotonic()
+
+        if revision != cls._REVISION:
+            cls._METADATA.clear()
+            cls._REVISION = revision
+
+    @classmethod
+    def __invalidate(cls, dynamic: str) -> None:
+        cls._METADATA.pop(dynamic, None)
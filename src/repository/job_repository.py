@@ -0,0 +1,91 @@
+from http import HTTPStatus
+from sqlite3 import Error
+from time import time
+from typing import Any
+
+from fastapi import HTTPException
+
+from src.api.presenters import HTTPError
+from src.common.enums import JobStatus
+from src.core.config import LOG
+from src.repository import queries
+from src.repository.base_repository import BaseRepository
+from src.utils.formaters import format_score_job
+
+
+class JobRepository(BaseRepository):
+
+    @classmethod
+    def add_job(cls, job_id: str, dynamic: str, code: str) -> None:
+        now = time()
+        params = (job_id, dynamic, code, JobStatus.QUEUED.value, now, now)
+
+        try:
+            with cls._connect() as connection:
+                cursor = connection.cursor()
+                cursor.execute(queries.INSERT_SCORE_JOB, params)
+                connection.commit()
+
+            LOG.info(f"Score job {job_id} queued")
+
+        except Error as error:
+            raise HTTPError(
+                f"Failed saving {dynamic} {code} score job", error=error
+            ) from error
+
+    @classmethod
+    def set_status(
+        cls,
+        job_id: str,
+        status: JobStatus,
+        similarity: float | None = None,
+        score: int | None = None,
+        message: str | None = None,
+    ) -> None:
+        params = (status.value, time(), similarity, score, message, job_id)
+
+        try:
+            with cls._connect() as connection:
+                cursor = connection.cursor()
+                cursor.execute(queries.UPDATE_SCORE_JOB, params)
+                connection.commit()
+
+        except Error as error:
+            raise HTTPError(
+                f"Failed setting score job {job_id} status", error=error
+            ) from error
+
+    @classmethod
+    def get_job(cls, dynamic: str, job_id: str) -> dict[str, Any]:
+        try:
+            with cls._connect() as connection:
+                cursor = connection.cursor()
+                cursor.execute(queries.SELECT_SCORE_JOB, (dynamic, job_id))
+                job = cursor.fetchone()
+
+        except Error as error:
+            raise HTTPError(
+                f"Failed getting score job {job_id}", error=error
+            ) from error
+
+        if job is None or len(job) == 0:
+            raise HTTPException(
+                HTTPStatus.NOT_FOUND, f"Score job {job_id} not found"
+            )
+
+        return format_score_job(job)
+
+    @classmethod
+    def clean_jobs(cls, dynamic: str) -> None:
+        try:
+            with cls._connect() as connection:
+                cursor = connection.cursor()
+                cursor.execute(queries.DELETE_SCORE_JOBS, (dynamic,))
+                connection.commit()
+
+            LOG.info(f"{dynamic} score jobs removed")
+
+        except Error as error:
+            raise HTTPError(
+                f"Failed removing {dynamic} score jobs", error=error
+            ) from error
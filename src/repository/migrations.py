@@ -0,0 +1,67 @@
+from sqlite3 import Cursor
+from typing import Callable
+
+from src.repository import queries
+
+
+def create_base_tables(cursor: Cursor) -> None:
+    cursor.execute(queries.CREATE_REPORT_TABLE)
+    cursor.execute(queries.CREATE_DYNAMIC_TABLE)
+
+
+def add_dynamic_readiness(cursor: Cursor) -> None:
+    cursor.execute(queries.SELECT_DYNAMIC_COLUMNS)
+    columns = [column[1] for column in cursor.fetchall()]
+
+    if "readiness" not in columns:
+        cursor.execute(queries.ADD_DYNAMIC_READINESS)
+
+
+def create_score_job_table(cursor: Cursor) -> None:
+    cursor.execute(queries.CREATE_SCORE_JOB_TABLE)
+    cursor.execute(queries.CREATE_SCORE_JOB_INDEX)
+
+
+def create_report_indexes(cursor: Cursor) -> None:
+    for query in queries.CREATE_REPORT_INDEXES:
+        cursor.execute(query)
+    cursor.execute(queries.ANALYZE)
+
+
+def create_revision_table(cursor: Cursor) -> None:
+    cursor.execute(queries.CREATE_REVISION_TABLE)
+    cursor.execute(queries.INSERT_REVISION)
+
+    for query in queries.CREATE_DYNAMIC_REVISION_TRIGGERS:
+        cursor.execute(query)
+
+
+def create_team_stats_table(cursor: Cursor) -> None:
+    cursor.execute(queries.CREATE_TEAM_STATS_TABLE)
+    cursor.execute(queries.INSERT_TEAM_STATS)
+    cursor.execute(queries.UPDATE_TEAM_RANKS)
+    cursor.execute(queries.CREATE_REPORT_STATS_TRIGGER)
+
+    for query in queries.CREATE_TEAM_RANK_TRIGGERS:
+        cursor.execute(query)
+
+
+def create_rate_bucket_table(cursor: Cursor) -> None:
+    cursor.execute(queries.CREATE_RATE_BUCKET_TABLE)
+
+
+def create_report_id_index(cursor: Cursor) -> None:
+    cursor.execute(queries.CREATE_REPORT_ID_INDEX)
+    cursor.execute(queries.ANALYZE)
+
+
+MIGRATIONS: tuple[Callable[[Cursor], None], ...] = (
+    create_base_tables,
+    add_dynamic_readiness,
+    create_score_job_table,
+    create_report_indexes,
+    create_revision_table,
+    create_team_stats_table,
+    create_rate_bucket_table,
+    create_report_id_index,
+)
@@ -16,9 +16,15 @@ INSERT_REPORT = """
         (dynamic,code,operation,file_type,timestamp,similarity,score)
     VALUES (?, ?, ?, ?, ?, ?, ?);
 """
-SELECT_DYNAMIC_REPORT = (
-    "SELECT * FROM Report WHERE dynamic=? ORDER BY timestamp ASC;"
-)
+SELECT_DYNAMIC_REPORT = """
+    SELECT * FROM Report WHERE dynamic=? ORDER BY timestamp ASC, id ASC;
+"""
+SELECT_DYNAMIC_REPORT_AFTER = """
+    SELECT * FROM Report WHERE dynamic=? AND id>? ORDER BY id LIMIT ?;
+"""
+SELECT_DYNAMIC_REPORT_CURSOR = "SELECT 1 FROM Report WHERE id=? AND dynamic=?;"
+SELECT_LAST_REPORT_ID = "SELECT COALESCE(MAX(id), 0) FROM Report;"
+SELECT_REPORTS_AFTER = "SELECT * FROM Report WHERE id>? ORDER BY id LIMIT ?;"
 SELECT_FILE_REPORT = """
     SELECT MAX(timestamp) AS last_timestamp
     FROM Report WHERE dynamic=? AND code=? AND file_type=?;
@@ -26,24 +32,151 @@ SELECT_FILE_REPORT = """
 SELECT_OPERATIONS_REPORT = """
     SELECT
         code,
-        operation,
-        COUNT(*) AS total_exchanges,
-        MIN(timestamp) AS first_timestamp,
-        MAX(timestamp) AS last_timestamp,
-        MAX(similarity) AS max_comparison,
-        MAX(score) AS max_score
-    FROM Report WHERE dynamic=? GROUP BY code;
+        MAX(operation) AS operation,
+        SUM(total_exchanges) AS total_exchanges,
+        MIN(first_timestamp) AS first_timestamp,
+        MAX(last_timestamp) AS last_timestamp,
+        MAX(max_comparison) AS max_comparison,
+        MAX(max_score) AS max_score
+    FROM TeamStats WHERE dynamic=? GROUP BY code;
 """
 SELECT_OPERATION_REPORT = """
     SELECT
         code,
         operation,
-        COUNT(*) AS total_exchanges,
-        MIN(timestamp) AS first_timestamp,
-        MAX(timestamp) AS last_timestamp,
-        MAX(similarity) AS max_comparison,
-        MAX(score) AS max_score
-    FROM Report WHERE dynamic=? AND operation=? GROUP BY code;
+        total_exchanges,
+        first_timestamp,
+        last_timestamp,
+        max_comparison,
+        max_score
+    FROM TeamStats WHERE dynamic=? AND operation=? ORDER BY code;
+"""
+CREATE_REPORT_INDEXES = (
+    """
+    CREATE INDEX IF NOT EXISTS report_dynamic_timestamp ON Report
+        (dynamic,timestamp,id,code,operation,file_type,similarity,score);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS report_dynamic_code_file ON Report
+        (dynamic,code,file_type,timestamp);
+    """,
+)
+CREATE_REPORT_ID_INDEX = """
+    CREATE INDEX IF NOT EXISTS report_dynamic_id ON Report (dynamic,id);
+"""
+
+
+CREATE_TEAM_STATS_TABLE = """
+    CREATE TABLE IF NOT EXISTS TeamStats (
+        dynamic TEXT NOT NULL,
+        code TEXT NOT NULL,
+        operation TEXT NOT NULL,
+        total_exchanges INTEGER NOT NULL,
+        first_timestamp REAL NOT NULL,
+        last_timestamp REAL NOT NULL,
+        max_comparison REAL NULL,
+        max_score INTEGER NULL,
+        rank INTEGER NULL,
+        PRIMARY KEY (dynamic,code,operation)
+    ) WITHOUT ROWID;
+"""
+INSERT_TEAM_STATS = """
+    INSERT INTO TeamStats
+        (dynamic,code,operation,total_exchanges,first_timestamp,
+        last_timestamp,max_comparison,max_score)
+    SELECT
+        dynamic,
+        code,
+        operation,
+        COUNT(*),
+        MIN(timestamp),
+        MAX(timestamp),
+        MAX(similarity),
+        MAX(score)
+    FROM Report GROUP BY dynamic,code,operation;
+"""
+CREATE_REPORT_STATS_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS report_team_stats
+    AFTER INSERT ON Report
+    BEGIN
+        INSERT INTO TeamStats
+            (dynamic,code,operation,total_exchanges,first_timestamp,
+            last_timestamp,max_comparison,max_score)
+        VALUES (
+            NEW.dynamic,
+            NEW.code,
+            NEW.operation,
+            1,
+            NEW.timestamp,
+            NEW.timestamp,
+            NEW.similarity,
+            NEW.score
+        )
+        ON CONFLICT (dynamic,code,operation) DO UPDATE SET
+            total_exchanges=total_exchanges+1,
+            first_timestamp=MIN(first_timestamp,excluded.first_timestamp),
+            last_timestamp=MAX(last_timestamp,excluded.last_timestamp),
+            max_comparison=MAX(
+                COALESCE(max_comparison,excluded.max_comparison),
+                COALESCE(excluded.max_comparison,max_comparison)
+            ),
+            max_score=MAX(
+                COALESCE(max_score,excluded.max_score),
+                COALESCE(excluded.max_score,max_score)
+            );
+    END;
+"""
+CREATE_TEAM_RANK_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS team_stats_insert_rank
+    AFTER INSERT ON TeamStats WHEN NEW.max_score IS NOT NULL
+    BEGIN
+        UPDATE TeamStats SET rank=(
+            SELECT COUNT(*)+1 FROM TeamStats AS other
+            WHERE other.dynamic=TeamStats.dynamic
+            AND other.operation=TeamStats.operation
+            AND other.max_score>TeamStats.max_score
+        )
+        WHERE dynamic=NEW.dynamic AND operation=NEW.operation
+        AND max_score IS NOT NULL;
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS team_stats_update_rank
+    AFTER UPDATE OF max_score ON TeamStats
+    WHEN NEW.max_score IS NOT OLD.max_score
+    BEGIN
+        UPDATE TeamStats SET rank=(
+            SELECT COUNT(*)+1 FROM TeamStats AS other
+            WHERE other.dynamic=TeamStats.dynamic
+            AND other.operation=TeamStats.operation
+            AND other.max_score>TeamStats.max_score
+        )
+        WHERE dynamic=NEW.dynamic AND operation=NEW.operation
+        AND max_score IS NOT NULL;
+    END;
+    """,
+)
+UPDATE_TEAM_RANKS = """
+    UPDATE TeamStats SET rank=(
+        SELECT COUNT(*)+1 FROM TeamStats AS other
+        WHERE other.dynamic=TeamStats.dynamic
+        AND other.operation=TeamStats.operation
+        AND other.max_score>TeamStats.max_score
+    )
+    WHERE max_score IS NOT NULL;
+"""
+DELETE_TEAM_STATS = "DELETE FROM TeamStats WHERE dynamic=?;"
+SELECT_LEADERBOARD = """
+    SELECT
+        rank,
+        code,
+        total_exchanges,
+        last_timestamp,
+        max_comparison,
+        max_score
+    FROM TeamStats WHERE dynamic=? AND operation=?
+    ORDER BY rank IS NULL, rank, code;
 """
 
 
@@ -56,14 +189,118 @@ CREATE_DYNAMIC_TABLE = """
         size TEXT NULL
     );
 """
+SELECT_DYNAMIC_COLUMNS = "PRAGMA table_info(Dynamic);"
+ADD_DYNAMIC_READINESS = """
+    ALTER TABLE Dynamic
+    ADD COLUMN readiness TEXT NOT NULL DEFAULT 'FIXED';
+"""
 INSERT_DYNAMIC = """
-    INSERT INTO Dynamic (dynamic,lock_requests,weight) VALUES (?, ?, ?);
+    INSERT INTO Dynamic (dynamic,lock_requests,weight,readiness)
+    VALUES (?, ?, ?, ?);
 """
 SELECT_DYNAMICS = "SELECT dynamic FROM Dynamic ORDER BY id ASC;"
 DELETE_DYNAMIC = "DELETE FROM Dynamic WHERE dynamic=?;"
-SELECT_LOCK_STATUS = "SELECT lock_requests FROM Dynamic WHERE dynamic=?;"
 UPDATE_LOCK_STATUS = "UPDATE Dynamic SET lock_requests=? WHERE dynamic=?;"
-SELECT_WEIGHT = "SELECT weight FROM Dynamic WHERE dynamic=?;"
 UPDATE_WEIGHT = "UPDATE Dynamic SET weight=? WHERE dynamic=?;"
-SELECT_SIZE = "SELECT size FROM Dynamic WHERE dynamic=?;"
 UPDATE_SIZE = "UPDATE Dynamic SET size=? WHERE dynamic=?;"
+UPDATE_READINESS = "UPDATE Dynamic SET readiness=? WHERE dynamic=?;"
+SELECT_DYNAMIC_METADATA = """
+    SELECT lock_requests,weight,size,readiness FROM Dynamic WHERE dynamic=?;
+"""
+
+
+CREATE_REVISION_TABLE = """
+    CREATE TABLE IF NOT EXISTS Revision (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        revision INTEGER NOT NULL
+    );
+"""
+INSERT_REVISION = "INSERT OR IGNORE INTO Revision (id,revision) VALUES (1, 0);"
+CREATE_DYNAMIC_REVISION_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS dynamic_insert_revision
+    AFTER INSERT ON Dynamic
+    BEGIN UPDATE Revision SET revision=revision+1 WHERE id=1; END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS dynamic_update_revision
+    AFTER UPDATE ON Dynamic
+    BEGIN UPDATE Revision SET revision=revision+1 WHERE id=1; END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS dynamic_delete_revision
+    AFTER DELETE ON Dynamic
+    BEGIN UPDATE Revision SET revision=revision+1 WHERE id=1; END;
+    """,
+)
+SELECT_REVISION = "SELECT revision FROM Revision WHERE id=1;"
+
+
+CREATE_SCORE_JOB_TABLE = """
+    CREATE TABLE IF NOT EXISTS ScoreJob (
+        id TEXT PRIMARY KEY,
+        dynamic TEXT NOT NULL,
+        code TEXT NOT NULL,
+        status TEXT NOT NULL,
+        created REAL NOT NULL,
+        updated REAL NOT NULL,
+        similarity REAL NULL,
+        score INTEGER NULL,
+        error TEXT NULL
+    );
+"""
+CREATE_SCORE_JOB_INDEX = """
+    CREATE INDEX IF NOT EXISTS score_job_dynamic ON ScoreJob (dynamic);
+"""
+INSERT_SCORE_JOB = """
+    INSERT INTO ScoreJob (id,dynamic,code,status,created,updated)
+    VALUES (?, ?, ?, ?, ?, ?);
+"""
+UPDATE_SCORE_JOB = """
+    UPDATE ScoreJob SET status=?,updated=?,similarity=?,score=?,error=?
+    WHERE id=?;
+"""
+SELECT_SCORE_JOB = "SELECT * FROM ScoreJob WHERE dynamic=? AND id=?;"
+DELETE_SCORE_JOBS = "DELETE FROM ScoreJob WHERE dynamic=?;"
+
+
+CREATE_RATE_BUCKET_TABLE = """
+    CREATE TABLE IF NOT EXISTS RateBucket (
+        dynamic TEXT NOT NULL,
+        client TEXT NOT NULL,
+        tokens REAL NOT NULL,
+        updated REAL NOT NULL,
+        PRIMARY KEY (dynamic, client)
+    ) WITHOUT ROWID;
+"""
+TAKE_RATE_TOKENS = """
+    INSERT INTO RateBucket (dynamic,client,tokens,updated)
+    SELECT :dynamic, :client, :capacity - :cost, :now WHERE :cost<=:capacity
+    ON CONFLICT (dynamic, client) DO UPDATE SET
+        tokens=MIN(
+            :capacity, tokens + MAX(0, :now - updated) * :refill
+        ) - :cost,
+        updated=:now
+    WHERE MIN(:capacity, tokens + MAX(0, :now - updated) * :refill) >= :cost
+    RETURNING tokens;
+"""
+SELECT_RATE_TOKENS = """
+    SELECT MIN(:capacity, tokens + MAX(0, :now - updated) * :refill)
+    FROM RateBucket WHERE dynamic=:dynamic AND client=:client;
+"""
+DELETE_IDLE_RATE_BUCKETS = "DELETE FROM RateBucket WHERE updated<?;"
+DELETE_RATE_BUCKETS = "DELETE FROM RateBucket WHERE dynamic=?;"
+
+
+SELECT_USER_VERSION = "PRAGMA user_version;"
+UPDATE_USER_VERSION = "PRAGMA user_version={version};"
+BEGIN_IMMEDIATE = "BEGIN IMMEDIATE;"
+ANALYZE = "ANALYZE;"
+WAL_JOURNAL_MODE = "PRAGMA journal_mode=WAL;"
+WAL_CHECKPOINT = "PRAGMA wal_checkpoint(TRUNCATE);"
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA cache_size=-16000;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA mmap_size=67108864;",
+)
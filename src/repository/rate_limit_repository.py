@@ -0,0 +1,64 @@
+from sqlite3 import Error
+
+from src.api.presenters import HTTPError
+from src.repository import queries
+from src.repository.base_repository import BaseRepository
+
+
+class RateLimitRepository(BaseRepository):
+    """Token buckets of the rate limiter shared by all the workers"""
+
+    @classmethod
+    def take_tokens(  # pylint: disable=R0913,R0917
+        cls,
+        dynamic: str,
+        client: str,
+        cost: int,
+        capacity: int,
+        refill: float,
+        now: float,
+    ) -> float:
+        params = {
+            "dynamic": dynamic,
+            "client": client,
+            "cost": cost,
+            "capacity": capacity,
+            "refill": refill,
+            "now": now,
+        }
+
+        try:
+            with cls._connect() as connection:
+                cursor = connection.cursor()
+                cursor.execute(queries.TAKE_RATE_TOKENS, params)
+
+                if cursor.fetchone() is not None:
+                    connection.commit()
+                    return 0.0
+
+                cursor.execute(queries.SELECT_RATE_TOKENS, params)
+                bucket = cursor.fetchone()
+                connection.commit()
+
+        except Error as error:
+            raise HTTPError(
+                f"Failed taking {dynamic} {client} rate tokens", error=error
+            ) from error
+
+        tokens = capacity if bucket is None else bucket[0]
+        return (cost - tokens) / refill
+
+    @classmethod
+    def delete_idle_buckets(cls, updated_before: float) -> None:
+        try:
+            with cls._connect() as connection:
+                cursor = connection.cursor()
+                cursor.execute(
+                    queries.DELETE_IDLE_RATE_BUCKETS, (updated_before,)
+                )
+                connection.commit()
+
+        except Error as error:
+            raise HTTPError(
+                "Failed deleting idle rate buckets", error=error
+            ) from error
@@ -1,5 +1,5 @@
 from http import HTTPStatus
-from sqlite3 import Error, connect
+from sqlite3 import Cursor, Error
 from time import time
 from typing import Any
 
@@ -12,9 +12,11 @@ from src.core.config import LOG
 from src.repository import queries
 from src.repository.base_repository import BaseRepository
 from src.repository.dynamic_repository import DynamicRepository
+from src.repository.report_writer import ReportWriter
 from src.utils.formaters import (
     format_dynamic_report,
     format_file_report,
+    format_leaderboard,
     format_operation_report,
 )
 
@@ -28,7 +30,7 @@ class ReportRepository(BaseRepository):
         data: UploadData | RetrieveData,
         operation: Operation,
         similarity: float | None = None,
-    ) -> None:
+    ) -> int | None:
         weight = DynamicRepository.get_weight(dynamic)
 
         if similarity is not None:
@@ -47,7 +49,10 @@ class ReportRepository(BaseRepository):
         )
 
         try:
-            with connect(cls._DATABASE) as connection:
+            if ReportWriter.add(params):
+                return score
+
+            with cls._connect() as connection:
                 cursor = connection.cursor()
                 cursor.execute(queries.INSERT_REPORT, params)
                 connection.commit()
@@ -58,12 +63,17 @@ class ReportRepository(BaseRepository):
             LOG.exception(error)
             raise HTTPError("Failed saving report", error=error) from error
 
+        return score
+
     @classmethod
     def clean_reports(cls, dynamic: str) -> None:
         try:
-            with connect(cls._DATABASE) as connection:
+            ReportWriter.sync()
+
+            with cls._connect() as connection:
                 cursor = connection.cursor()
                 cursor.execute(queries.DELETE_REPORTS, (dynamic,))
+                cursor.execute(queries.DELETE_TEAM_STATS, (dynamic,))
                 connection.commit()
 
             LOG.info(f"{dynamic} reports removed")
@@ -74,11 +84,26 @@ class ReportRepository(BaseRepository):
             ) from error
 
     @classmethod
-    def get_dynamic_reports(cls, dynamic: str) -> list[dict[str, Any]]:
+    def get_dynamic_reports(
+        cls, dynamic: str, after: int | None = None, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        if after is None and limit is None:
+            sql, params = queries.SELECT_DYNAMIC_REPORT, (dynamic,)
+
+        else:
+            sql = queries.SELECT_DYNAMIC_REPORT_AFTER
+            params = (dynamic, after or 0, -1 if limit is None else limit)
+
         try:
-            with connect(cls._DATABASE) as connection:
+            ReportWriter.sync()
+
+            with cls._connect() as connection:
                 cursor = connection.cursor()
-                cursor.execute(queries.SELECT_DYNAMIC_REPORT, (dynamic,))
+
+                if after is not None:
+                    cls.__check_cursor(cursor, dynamic, after)
+
+                cursor.execute(sql, params)
                 reports = cursor.fetchall()
 
         except Error as error:
@@ -86,6 +111,9 @@ class ReportRepository(BaseRepository):
                 f"Failed getting {dynamic} report", error=error
             ) from error
 
+        if after is not None:
+            return list(map(format_dynamic_report, reports))
+
         if reports is None or len(reports) == 0 or not all(reports):
             raise HTTPException(
                 HTTPStatus.NOT_FOUND,
@@ -94,6 +122,36 @@ class ReportRepository(BaseRepository):
 
         return list(map(format_dynamic_report, reports))
 
+    @classmethod
+    def get_last_report_id(cls) -> int:
+        try:
+            with cls._connect() as connection:
+                cursor = connection.cursor()
+                cursor.execute(queries.SELECT_LAST_REPORT_ID)
+                last_id = cursor.fetchone()[0]
+
+        except Error as error:
+            raise HTTPError(
+                "Failed getting last report", error=error
+            ) from error
+
+        return int(last_id)
+
+    @classmethod
+    def get_reports_after(cls, last_id: int, limit: int) -> list[tuple]:
+        try:
+            with cls._connect() as connection:
+                cursor = connection.cursor()
+                cursor.execute(queries.SELECT_REPORTS_AFTER, (last_id, limit))
+                reports = cursor.fetchall()
+
+        except Error as error:
+            raise HTTPError(
+                "Failed getting new reports", error=error
+            ) from error
+
+        return reports
+
     @classmethod
     def get_file_report(
         cls, dynamic: str, query: RetrieveData
@@ -101,7 +159,9 @@ class ReportRepository(BaseRepository):
         params = (dynamic, query.code, query.type.value)
 
         try:
-            with connect(cls._DATABASE) as connection:
+            ReportWriter.sync()
+
+            with cls._connect() as connection:
                 cursor = connection.cursor()
                 cursor.execute(queries.SELECT_FILE_REPORT, params)
                 report = cursor.fetchone()
@@ -132,7 +192,9 @@ class ReportRepository(BaseRepository):
             params = (dynamic, operation.value)
 
         try:
-            with connect(cls._DATABASE) as connection:
+            ReportWriter.sync()
+
+            with cls._connect() as connection:
                 cursor = connection.cursor()
                 cursor.execute(sql, params)
                 reports = cursor.fetchall()
@@ -150,3 +212,38 @@ class ReportRepository(BaseRepository):
             )
 
         return list(map(format_operation_report, reports))
+
+    @classmethod
+    def get_leaderboard(cls, dynamic: str) -> list[dict[str, Any]]:
+        params = (dynamic, Operation.UPLOAD.value)
+
+        try:
+            ReportWriter.sync()
+
+            with cls._connect() as connection:
+                cursor = connection.cursor()
+                cursor.execute(queries.SELECT_LEADERBOARD, params)
+                teams = cursor.fetchall()
+
+        except Error as error:
+            raise HTTPError(
+                f"Failed getting {dynamic} leaderboard", error=error
+            ) from error
+
+        if teams is None or len(teams) == 0:
+            raise HTTPException(
+                HTTPStatus.NOT_FOUND,
+                f"{dynamic} leaderboard not found",
+            )
+
+        return list(map(format_leaderboard, teams))
+
+    @staticmethod
+    def __check_cursor(cursor: Cursor, dynamic: str, after: int) -> None:
+        cursor.execute(queries.SELECT_DYNAMIC_REPORT_CURSOR, (after, dynamic))
+
+        if cursor.fetchone() is None:
+            raise HTTPException(
+                HTTPStatus.NOT_FOUND,
+                f"{dynamic} report {after} not found",
+            )
@@ -0,0 +1,138 @@
+from asyncio import (
+    AbstractEventLoop,
+    CancelledError,
+    Event,
+    Task,
+    create_task,
+    get_running_loop,
+    to_thread,
+    wait_for,
+)
+from collections import deque
+from sqlite3 import Error
+from threading import Lock
+from typing import Any
+
+from src.core.config import ENV, LOG
+from src.repository import queries
+from src.repository.base_repository import BaseRepository
+
+
+class ReportWriter(BaseRepository):
+    """Buffers report rows and inserts them in batched transactions"""
+
+    _BATCH_SIZE = ENV.report_batch_size
+    _INTERVAL = ENV.report_flush_ms / 1000
+    _MAX_PENDING = ENV.report_batch_size * 4
+    _PENDING: deque[tuple] = deque()
+    _FLUSH_LOCK = Lock()
+    _LOOP: AbstractEventLoop = None
+    _FULL: Event = None
+    _TASK: Task = None
+    _WRITTEN = 0
+    _BATCHES = 0
+
+    @classmethod
+    def start(cls) -> None:
+        cls._LOOP = get_running_loop()
+        cls._FULL = Event()
+        cls._TASK = create_task(cls.__run())
+        LOG.info(
+            f"Report writer started with batches of {cls._BATCH_SIZE} rows"
+            f" every {ENV.report_flush_ms}ms"
+        )
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._TASK is None:
+            return
+
+        cls._TASK.cancel()
+        try:
+            await cls._TASK
+        except CancelledError:
+            pass
+
+        cls._TASK, cls._LOOP, cls._FULL = None, None, None
+        cls.flush()
+
+    @classmethod
+    def add(cls, params: tuple) -> bool:
+        if cls._TASK is None:
+            return False
+
+        if len(cls._PENDING) >= cls._MAX_PENDING:
+            LOG.error("Report writer is behind, flushing in request")
+            cls.flush()
+
+        cls._PENDING.append(params)
+
+        if len(cls._PENDING) >= cls._BATCH_SIZE:
+            cls._LOOP.call_soon_threadsafe(cls._FULL.set)
+
+        return True
+
+    @classmethod
+    def flush(cls, timeout: float = -1) -> None:
+        if not cls._FLUSH_LOCK.acquire(  # pylint: disable=R1732
+            timeout=timeout
+        ):
+            return
+
+        try:
+            remaining = len(cls._PENDING)
+
+            while remaining > 0 and cls._PENDING:
+                batch = [
+                    cls._PENDING.popleft()
+                    for _ in range(min(cls._BATCH_SIZE, len(cls._PENDING)))
+                ]
+                remaining -= len(batch)
+
+                try:
+                    with cls._connect() as connection:
+                        cursor = connection.cursor()
+                        cursor.executemany(queries.INSERT_REPORT, batch)
+                        connection.commit()
+
+                except Error:
+                    cls._PENDING.extendleft(reversed(batch))
+                    raise
+
+                cls._WRITTEN += len(batch)
+                cls._BATCHES += 1
+
+        finally:
+            cls._FLUSH_LOCK.release()
+
+    @classmethod
+    def sync(cls) -> None:
+        cls.flush(cls._INTERVAL)
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        return {
+            "pending": len(cls._PENDING),
+            "written": cls._WRITTEN,
+            "batches": cls._BATCHES,
+        }
+
+    @classmethod
+    async def __run(cls) -> None:
+        while True:
+            try:
+                await wait_for(cls._FULL.wait(), cls._INTERVAL)
+            except TimeoutError:
+                pass
+
+            cls._FULL.clear()
+
+            if not cls._PENDING:
+                continue
+
+            try:
+                await to_thread(cls.flush)
+
+            except Error as error:
+                LOG.error("Failed to flush the reports batch")
+                LOG.exception(error)
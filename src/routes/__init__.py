@@ -2,6 +2,7 @@ from .admin import router as admin_router
 from .code_dirs import router as code_dirs_router
 from .dynamics import router as dynamics_router
 from .files import router as files_router
+from .metrics import router as metrics_router
 from .reports import router as reports_router
 
 __all__ = [
@@ -9,5 +10,6 @@ __all__ = [
     "dynamics_router",
     "code_dirs_router",
     "files_router",
+    "metrics_router",
     "reports_router",
 ]
@@ -4,9 +4,11 @@ from fastapi import Request
 from fastapi.routing import APIRouter
 
 from src.api.presenters import SuccessJSON, SuccessResponse
+from src.api.timed_route import TimedRoute
 from src.common.types import (
     DynamicPath,
     LockQuery,
+    ReadinessQuery,
     UploadAnswerKeyForm,
     WeightQuery,
 )
@@ -15,11 +17,12 @@ from src.use_cases.admin import (
     clean_files,
     clean_reports,
     lock_requests,
+    set_readiness,
     set_weight,
 )
 from src.use_cases.answer_key import AnswerKey
 
-router = APIRouter(prefix=ROUTE_PREFIX, tags=["Admin"])
+router = APIRouter(prefix=ROUTE_PREFIX, tags=["Admin"], route_class=TimedRoute)
 
 
 @router.put(
@@ -48,6 +51,19 @@ async def api_set_weight(
     return await set_weight(request, dynamic, weight)
 
 
+@router.put(
+    "/{dynamic}/set-readiness",
+    status_code=HTTPStatus.OK,
+    summary="Sets the page readiness strategy of the screenshots",
+    response_model=SuccessResponse,
+)
+async def api_set_readiness(
+    request: Request, dynamic: DynamicPath, readiness: ReadinessQuery
+) -> SuccessJSON:
+    LOG.debug({"dynamic": dynamic, "readiness": readiness.value})
+    return await set_readiness(request, dynamic, readiness)
+
+
 @router.post(
     "/{dynamic}/answer-key",
     status_code=HTTPStatus.OK,
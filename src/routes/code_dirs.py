@@ -4,6 +4,7 @@ from fastapi import Request
 from fastapi.routing import APIRouter
 
 from src.api.presenters import SuccessJSON, SuccessResponse
+from src.api.timed_route import TimedRoute
 from src.common.types import CodePath, DynamicPath
 from src.core.config import LOG, ROUTE_PREFIX
 from src.use_cases.code_dirs import (
@@ -12,7 +13,9 @@ from src.use_cases.code_dirs import (
     remove_code_dir,
 )
 
-router = APIRouter(prefix=ROUTE_PREFIX, tags=["Code Dirs"])
+router = APIRouter(
+    prefix=ROUTE_PREFIX, tags=["Code Dirs"], route_class=TimedRoute
+)
 
 
 # NOTE: update back to /list-code-dirs
@@ -4,11 +4,14 @@ from fastapi import Request
 from fastapi.routing import APIRouter
 
 from src.api.presenters import SuccessJSON, SuccessResponse
+from src.api.timed_route import TimedRoute
 from src.common.types import DynamicPath, NewDynamicForm
 from src.core.config import LOG, ROUTE_PREFIX
 from src.use_cases.dynamics import add_dynamic, list_dynamics, remove_dynamic
 
-router = APIRouter(prefix=ROUTE_PREFIX, tags=["Dynamics"])
+router = APIRouter(
+    prefix=ROUTE_PREFIX, tags=["Dynamics"], route_class=TimedRoute
+)
 
 
 @router.get(
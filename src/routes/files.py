@@ -1,23 +1,31 @@
 from http import HTTPStatus
 
 from fastapi import Request
-from fastapi.responses import FileResponse
+from fastapi.responses import Response, StreamingResponse
 from fastapi.routing import APIRouter
 
 from src.api.presenters import SuccessJSON, SuccessResponse
-from src.common.enums import FileType, Operation
+from src.api.rate_limiter import RateLimiter
+from src.api.timed_route import TimedRoute
+from src.common.enums import FileType, Operation, RequestCost
 from src.common.types import (
+    DownloadQuery,
     DynamicPath,
+    JobIdPath,
     RetrieveFileQuery,
-    TempFile,
     UploadFileForm,
 )
-from src.core.config import LIMIT, LIMITER, LOG, ROUTE_PREFIX
-from src.repository import ReportRepository
+from src.core.config import LOG, ROUTE_PREFIX
+from src.repository import DatabaseExecutor, ReportRepository
 from src.use_cases.compare_similarity import Similarity
-from src.use_cases.files import download_dir_tree, retrieve_file, upload_file
+from src.use_cases.files import (
+    download_dir_tree,
+    retrieve_file,
+    score_job,
+    upload_file,
+)
 
-router = APIRouter(prefix=ROUTE_PREFIX)
+router = APIRouter(prefix=ROUTE_PREFIX, route_class=TimedRoute)
 
 
 # NOTE: update back to /retrieve-file
@@ -28,7 +36,7 @@ router = APIRouter(prefix=ROUTE_PREFIX)
     summary="Retrieves a code dir file",
     response_model=SuccessResponse,
 )
-@LIMITER.limit(LIMIT)
+@RateLimiter.limit(RequestCost.READ)
 async def api_retrieve_file(
     request: Request,
     dynamic: DynamicPath,
@@ -37,7 +45,9 @@ async def api_retrieve_file(
     LOG.debug({"dynamic": dynamic, "query": query.model_dump()})
 
     response = await retrieve_file(request, dynamic, query)
-    ReportRepository.add_report(dynamic, query, Operation.RETRIEVE)
+    await DatabaseExecutor.run(
+        ReportRepository.add_report, dynamic, query, Operation.RETRIEVE
+    )
 
     return response
 
@@ -50,7 +60,7 @@ async def api_retrieve_file(
     summary="Uploads a code dir file",
     response_model=SuccessResponse,
 )
-@LIMITER.limit(LIMIT)
+@RateLimiter.limit(RequestCost.UPLOAD, render_cost=RequestCost.RENDER)
 async def api_upload_file(
     request: Request, dynamic: DynamicPath, form: UploadFileForm
 ) -> SuccessJSON:
@@ -59,6 +69,9 @@ async def api_upload_file(
     response = await upload_file(request, dynamic, form)
     similarity = None
 
+    if response.status_code == HTTPStatus.ACCEPTED:
+        return response
+
     if form.type == FileType.CSS:
         try:
             similarity = await Similarity().compare(dynamic, form.code)
@@ -66,20 +79,41 @@ async def api_upload_file(
             LOG.error("Failed to compare page to answer key")
             LOG.exception(error)
 
-    ReportRepository.add_report(dynamic, form, Operation.UPLOAD, similarity)
+    await DatabaseExecutor.run(
+        ReportRepository.add_report,
+        dynamic,
+        form,
+        Operation.UPLOAD,
+        similarity,
+    )
 
     return response
 
 
+@router.get(
+    "/{dynamic}/score/{job_id}",
+    status_code=HTTPStatus.OK,
+    tags=["Files"],
+    summary="Retrieves a background score job status",
+    response_model=SuccessResponse,
+)
+@RateLimiter.limit(RequestCost.READ)
+async def api_score_job(
+    request: Request, dynamic: DynamicPath, job_id: JobIdPath
+) -> SuccessJSON:
+    LOG.debug({"dynamic": dynamic, "job_id": job_id})
+    return await score_job(request, dynamic, job_id)
+
+
 @router.get(
     "/{dynamic}/download",
     status_code=HTTPStatus.OK,
     tags=["Download"],
     summary="Downloads a dynamic dir tree",
-    response_class=FileResponse,
+    response_class=StreamingResponse,
 )
 async def api_download_dir_tree(
-    dynamic: DynamicPath, temp_file: TempFile
-) -> FileResponse:
-    LOG.debug({"dynamic": dynamic, "temp_file": temp_file.name})
-    return await download_dir_tree(dynamic, temp_file)
+    request: Request, dynamic: DynamicPath, query: DownloadQuery
+) -> Response:
+    LOG.debug({"dynamic": dynamic, "query": query.model_dump()})
+    return await download_dir_tree(request, dynamic, query)
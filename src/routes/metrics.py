@@ -0,0 +1,19 @@
+from http import HTTPStatus
+
+from fastapi import Response
+from fastapi.routing import APIRouter
+
+from src.api.timed_route import TimedRoute
+from src.use_cases.metrics import get_metrics
+
+router = APIRouter(tags=["Metrics"], route_class=TimedRoute)
+
+
+@router.get(
+    "/metrics",
+    status_code=HTTPStatus.OK,
+    summary="Prometheus metrics of all the server workers",
+    response_class=Response,
+)
+async def api_metrics() -> Response:
+    return await get_metrics()
@@ -1,18 +1,31 @@
 from http import HTTPStatus
 
 from fastapi import Request
+from fastapi.responses import StreamingResponse
 from fastapi.routing import APIRouter
 
 from src.api.presenters import SuccessJSON, SuccessResponse
-from src.common.types import DynamicPath, OperationPath, RetrieveFileQuery
-from src.core.config import LIMIT, LIMITER, LOG, ROUTE_PREFIX
+from src.api.rate_limiter import RateLimiter
+from src.api.timed_route import TimedRoute
+from src.common.enums import RequestCost
+from src.common.types import (
+    DynamicPath,
+    OperationPath,
+    ReportPageQuery,
+    RetrieveFileQuery,
+)
+from src.core.config import LOG, ROUTE_PREFIX
 from src.use_cases.reports import (
     dynamic_reports,
     file_report,
+    leaderboard,
     operation_reports,
+    report_events,
 )
 
-router = APIRouter(prefix=ROUTE_PREFIX, tags=["Reports"])
+router = APIRouter(
+    prefix=ROUTE_PREFIX, tags=["Reports"], route_class=TimedRoute
+)
 
 
 @router.get(
@@ -21,12 +34,12 @@ router = APIRouter(prefix=ROUTE_PREFIX, tags=["Reports"])
     summary="Retrieve a dynamic reports",
     response_model=SuccessResponse,
 )
-@LIMITER.limit(LIMIT)
+@RateLimiter.limit(RequestCost.READ)
 async def api_dynamic_reports(
-    request: Request, dynamic: DynamicPath
-) -> SuccessJSON:
-    LOG.debug({"dynamic": dynamic})
-    return await dynamic_reports(request, dynamic)
+    request: Request, dynamic: DynamicPath, query: ReportPageQuery
+) -> SuccessJSON | StreamingResponse:
+    LOG.debug({"dynamic": dynamic, "query": query.model_dump()})
+    return await dynamic_reports(request, dynamic, query)
 
 
 @router.get(
@@ -35,7 +48,7 @@ async def api_dynamic_reports(
     summary="Retrieve a file report",
     response_model=SuccessResponse,
 )
-@LIMITER.limit(LIMIT)
+@RateLimiter.limit(RequestCost.READ)
 async def api_file_report(
     request: Request, dynamic: DynamicPath, query: RetrieveFileQuery
 ) -> SuccessJSON:
@@ -49,9 +62,37 @@ async def api_file_report(
     summary="Retrieve a operation reports",
     response_model=SuccessResponse,
 )
-@LIMITER.limit(LIMIT)
+@RateLimiter.limit(RequestCost.READ)
 async def api_operation_reports(
     request: Request, dynamic: DynamicPath, operation: OperationPath
 ) -> SuccessJSON:
     LOG.debug({"dynamic": dynamic, "operation": operation.value})
     return await operation_reports(request, dynamic, operation)
+
+
+@router.get(
+    "/{dynamic}/leaderboard",
+    status_code=HTTPStatus.OK,
+    summary="Retrieve a dynamic teams leaderboard",
+    response_model=SuccessResponse,
+)
+@RateLimiter.limit(RequestCost.READ)
+async def api_leaderboard(
+    request: Request, dynamic: DynamicPath
+) -> SuccessJSON:
+    LOG.debug({"dynamic": dynamic})
+    return await leaderboard(request, dynamic)
+
+
+@router.get(
+    "/{dynamic}/events",
+    status_code=HTTPStatus.OK,
+    summary="Stream a dynamic reports and leaderboard events",
+    response_class=StreamingResponse,
+)
+@RateLimiter.limit(RequestCost.READ)
+async def api_report_events(
+    request: Request, dynamic: DynamicPath  # pylint: disable=W0613
+) -> StreamingResponse:
+    LOG.debug({"dynamic": dynamic})
+    return await report_events(dynamic)
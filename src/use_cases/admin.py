@@ -6,22 +6,32 @@ from time import strftime
 from fastapi import HTTPException, Request
 
 from src.api.presenters import HTTPError, SuccessJSON
-from src.common.enums import FileType, LockStatus
+from src.common.enums import FileType, LockStatus, Readiness
 from src.core.config import (
     DIFF_FILENAME,
     ENV,
     IMG_DIR,
     LOG,
+    MASK_FILENAME,
+    RENDER_FILENAME,
     SCREENSHOT_FILENAME,
     WEB_DIR,
 )
-from src.repository import DynamicRepository, ReportRepository
+from src.repository import (
+    BaseRepository,
+    DatabaseExecutor,
+    DynamicRepository,
+    JobRepository,
+    ReportRepository,
+)
 
 
 async def lock_requests(
     request: Request, dynamic: str, lock_status: LockStatus
 ) -> SuccessJSON:
-    DynamicRepository.set_lock_status(dynamic, lock_status.boolean)
+    await DatabaseExecutor.run(
+        DynamicRepository.set_lock_status, dynamic, lock_status.boolean
+    )
     LOG.info(f"{dynamic} lock requests set to {lock_status.name}")
 
     return SuccessJSON(
@@ -34,7 +44,7 @@ async def lock_requests(
 async def set_weight(
     request: Request, dynamic: str, weight: int
 ) -> SuccessJSON:
-    DynamicRepository.set_weight(dynamic, weight)
+    await DatabaseExecutor.run(DynamicRepository.set_weight, dynamic, weight)
     LOG.info(f"Score weight set to {weight}")
 
     return SuccessJSON(
@@ -44,13 +54,29 @@ async def set_weight(
     )
 
 
+async def set_readiness(
+    request: Request, dynamic: str, readiness: Readiness
+) -> SuccessJSON:
+    await DatabaseExecutor.run(
+        DynamicRepository.set_readiness, dynamic, readiness
+    )
+    LOG.info(f"{dynamic} page readiness set to {readiness.name}")
+
+    return SuccessJSON(
+        request,
+        f"{dynamic} page readiness set to {readiness.name}",
+        {"readiness": readiness.name},
+    )
+
+
 async def clean_reports(request: Request, dynamic: str) -> SuccessJSON:
     try:
         timestamp = strftime("%Y-%m-%d_%H-%M-%S")
         file = Path(ENV.database_file)
 
         backup_file = f"{file.stem}_{timestamp}{file.suffix}"
-        copy2(ENV.database_file, backup_file)
+        await DatabaseExecutor.run(BaseRepository.checkpoint)
+        await DatabaseExecutor.run(copy2, ENV.database_file, backup_file)
 
         LOG.debug({"backup_file": backup_file})
 
@@ -59,7 +85,8 @@ async def clean_reports(request: Request, dynamic: str) -> SuccessJSON:
             "Error in making the database file backup", error=error
         ) from error
 
-    ReportRepository.clean_reports(dynamic)
+    await DatabaseExecutor.run(ReportRepository.clean_reports, dynamic)
+    await DatabaseExecutor.run(JobRepository.clean_jobs, dynamic)
     LOG.info("Database file backup created successfully")
     LOG.info(f"{dynamic} dynamic reports records removed")
 
@@ -107,6 +134,8 @@ async def clean_files(request: Request, dynamic: str) -> SuccessJSON:
         for code_dir in filter(Path.is_dir, dynamic_dir.iterdir()):
             (code_dir / DIFF_FILENAME).unlink(missing_ok=True)
             (code_dir / SCREENSHOT_FILENAME).unlink(missing_ok=True)
+            (code_dir / MASK_FILENAME).unlink(missing_ok=True)
+            (code_dir / RENDER_FILENAME).unlink(missing_ok=True)
 
     except OSError as error:
         raise HTTPError(
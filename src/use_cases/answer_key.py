@@ -7,9 +7,10 @@ from numpy import frombuffer, uint8
 from src.api.presenters import HTTPError, SuccessJSON
 from src.common.enums import FileType
 from src.common.params import UploadAnswerKey
+from src.core.answer_key_cache import AnswerKeyCache
 from src.core.config import ANSWER_KEY_FILENAME, IMG_DIR, LOG, WEB_DIR
 from src.core.screenshot_service import ScreenshotService
-from src.repository.dynamic_repository import DynamicRepository
+from src.repository import DatabaseExecutor, DynamicRepository
 from src.utils.formaters import get_size
 
 
@@ -51,7 +52,10 @@ class AnswerKey:
         elif form.image:
             await self.__save_from_image_field()
 
-        DynamicRepository.set_size(dynamic, self.__size)
+        AnswerKeyCache.invalidate(dynamic)
+        await DatabaseExecutor.run(
+            DynamicRepository.set_size, dynamic, self.__size
+        )
         LOG.info(f"Answer-Key image {self.__size} saved in PNG")
 
         return SuccessJSON(
@@ -90,7 +94,12 @@ class AnswerKey:
             ) from error
 
         try:
-            binary_screenshot = await ScreenshotService.render(html_path)
+            readiness = await DatabaseExecutor.run(
+                DynamicRepository.get_readiness, self.__dynamic
+            )
+            binary_screenshot = await ScreenshotService.render(
+                html_path, readiness, ScreenshotService.snapshot(dynamic_dir)
+            )
 
         except Exception as error:
             raise HTTPError(
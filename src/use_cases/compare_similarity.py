@@ -1,42 +1,20 @@
 # mypy: disable-error-code="union-attr"
+from contextlib import AbstractContextManager
 from http import HTTPStatus
 from pathlib import Path
 
-from cv2 import (
-    COLOR_BGR2GRAY,
-    COLOR_GRAY2BGR,
-    IMREAD_COLOR,
-    INTER_CUBIC,
-    THRESH_BINARY,
-    absdiff,
-    cvtColor,
-    imdecode,
-    imread,
-    imwrite,
-    resize,
-    subtract,
-    threshold,
-)
-from cv2.typing import MatLike
 from fastapi import HTTPException
-from numpy import all as np_all
-from numpy import count_nonzero, frombuffer, full_like
-from numpy import sum as np_sum
-from numpy import uint8
 
 from src.api.presenters import HTTPError
-from src.common.enums import FileType
-from src.core.config import (
-    ANSWER_KEY_FILENAME,
-    DIFF_FILENAME,
-    IMG_DIR,
-    LOG,
-    SCREENSHOT_FILENAME,
-    WEB_DIR,
-)
+from src.common.enums import FileType, Readiness
+from src.core.answer_key_cache import AnswerKeyCache
+from src.core.compare_executor import CompareExecutor
+from src.core.config import IMG_DIR, LOG, WEB_DIR
+from src.core.image_pipeline import compare_images, write_images
+from src.core.metrics import Metrics
+from src.core.render_cache import CachedRender, RenderCache
 from src.core.screenshot_service import ScreenshotService
-from src.repository import DynamicRepository
-from src.utils.formaters import get_size
+from src.repository import DatabaseExecutor, DynamicRepository
 
 
 class Similarity:
@@ -50,10 +28,12 @@ class Similarity:
         self,
         dynamic: str,
         code: str,
+        snapshot: dict[str, bytes] | None = None,
     ) -> float:
         self.__dynamic, self.__code = dynamic, code
         self.__info = f"{dynamic} {code}"
-        html_path = WEB_DIR / dynamic / code / FileType.HTML.file
+        code_dir = WEB_DIR / dynamic / code
+        html_path = code_dir / FileType.HTML.file
 
         if not html_path.exists():
             raise HTTPException(
@@ -61,48 +41,48 @@ class Similarity:
                 f"Index.html not found in {dynamic} {code} code dir",
             )
 
-        screenshot = await self.__take_screenshot(html_path)
-
-        size = DynamicRepository.get_size(dynamic)
-        LOG.debug({"answer_key_size": size})
-
-        answer_key_path = IMG_DIR / dynamic / ANSWER_KEY_FILENAME
-
-        if not answer_key_path.exists():
-            LOG.error("Answer-key image not found")
-
-            raise HTTPException(
-                HTTPStatus.NOT_FOUND, "Answer-key image not found"
+        with self.__stage("answer_key"):
+            answer_key = await AnswerKeyCache.get(dynamic)
+        LOG.debug({"answer_key_size": answer_key.size})
+
+        if snapshot is None:
+            snapshot = ScreenshotService.snapshot(code_dir)
+
+        readiness = await DatabaseExecutor.run(
+            DynamicRepository.get_readiness, dynamic
+        )
+        cache_key = RenderCache.key(
+            snapshot,
+            dynamic,
+            answer_key.version,
+            ScreenshotService.VIEWPORT,
+            readiness.value,
+        )
+        cached = RenderCache.get(cache_key)
+
+        if cached is not None:
+            await self.__write_images(cached.render, cached.diff_mask)
+            LOG.info(
+                f"Similarity of {code} to the answer-key: "
+                f"{cached.similarity:.2f}% (cached)"
             )
+            return cached.similarity
 
-        try:
-            answer_key = imread(str(answer_key_path))
-            LOG.debug(
-                {
-                    "answer_key_shape": answer_key.shape,
-                    "screenshot_shape": screenshot.shape,
-                }
+        with self.__stage("render"):
+            screenshot = await self.__take_screenshot(
+                html_path, readiness, snapshot
             )
 
-            screenshot = self.__save_and_resize_screenshot(
-                answer_key.shape, screenshot, size
-            )
-
-            total_pixels = answer_key.shape[0] * answer_key.shape[1]
-            diff = absdiff(answer_key, screenshot)
-
-            num_diff_pixels = count_nonzero(np_sum(diff, 2))
-            percentage_diff: float = (num_diff_pixels / total_pixels) * 100
-            similarity = 100.00 - percentage_diff
-
-            LOG.debug(
-                {
-                    "total_pixels": total_pixels,
-                    "num_diff_pixels": num_diff_pixels,
-                }
-            )
-
-            self.__save_diff_image(answer_key, screenshot)
+        try:
+            with self.__stage("compare"):
+                similarity, diff_mask = await CompareExecutor.run(
+                    compare_images,
+                    answer_key.image,
+                    screenshot,
+                    answer_key.size,
+                    self.__info,
+                )
+            await self.__write_images(screenshot, diff_mask)
 
         except Exception as error:
             raise HTTPError(
@@ -110,13 +90,23 @@ class Similarity:
                 error=error,
             ) from error
 
+        RenderCache.put(
+            cache_key, CachedRender(similarity, screenshot, diff_mask)
+        )
         LOG.info(f"Similarity of {code} to the answer-key: {similarity:.2f}%")
 
         return similarity
 
-    async def __take_screenshot(self, html_path: Path) -> MatLike:
+    async def __take_screenshot(
+        self,
+        html_path: Path,
+        readiness: Readiness,
+        snapshot: dict[str, bytes],
+    ) -> bytes:
         try:
-            binary_screenshot = await ScreenshotService.render(html_path)
+            binary_screenshot = await ScreenshotService.render(
+                html_path, readiness, snapshot
+            )
 
         except Exception as error:
             raise HTTPError(
@@ -124,73 +114,16 @@ class Similarity:
                 error=error,
             ) from error
 
-        try:
-            array_screenshot = frombuffer(binary_screenshot, dtype=uint8)
-            screenshot = imdecode(array_screenshot, IMREAD_COLOR)
-
-        except Exception as error:
-            raise HTTPError(
-                f"Error in decode {self.__info} screenshot",
-                error=error,
-            ) from error
-
-        return screenshot  # type: ignore
-
-    def __save_and_resize_screenshot(
-        self,
-        answer_key_shape: tuple[int, int, int],
-        screenshot: MatLike,
-        size: tuple[int, int],
-    ) -> MatLike:
-        if answer_key_shape != screenshot.shape:
-            LOG.error("Answer-key and screenshot have different sizes")
-            old_size = get_size(screenshot)
-            LOG.info(f"Resizing screenshot from {old_size} to {size}")
-
-            try:
-                screenshot = resize(
-                    screenshot,
-                    size,
-                    interpolation=INTER_CUBIC,
-                )
-
-            except Exception as error:
-                raise HTTPError(
-                    f"Error in resizing {self.__info} screenshot",
-                    error=error,
-                ) from error
+        return binary_screenshot
 
+    async def __write_images(self, render: bytes, diff_mask: bytes) -> None:
         img_dir = IMG_DIR / self.__dynamic / self.__code
-        img_dir.mkdir(parents=True, exist_ok=True)
-
-        screenshot_path = img_dir / SCREENSHOT_FILENAME
-
-        imwrite(str(screenshot_path), screenshot)
-        LOG.info(f"{self.__info} screenshot saved")
 
-        return screenshot
-
-    def __save_diff_image(
-        self, answer_key: MatLike, screenshot: MatLike
-    ) -> None:
-        try:
-            diff = subtract(answer_key, screenshot)
-            gray_diff = cvtColor(diff, COLOR_BGR2GRAY)
-
-            diff = threshold(gray_diff, 30, 255, THRESH_BINARY)[1]
-            diff = cvtColor(diff, COLOR_GRAY2BGR)
-            diff[:, :, 0] = 0
-            diff[:, :, 1] = 0
-
-            black_pixels_mask = np_all(diff == 0, axis=2)
-            white_image = full_like(answer_key, 255)
-            diff[black_pixels_mask] = white_image[black_pixels_mask]
-
-            diff_path = IMG_DIR / self.__dynamic / self.__code / DIFF_FILENAME
-            imwrite(str(diff_path), diff)
+        with self.__stage("write_images"):
+            await CompareExecutor.run(
+                write_images, img_dir, render, diff_mask, self.__info
+            )
 
-        except Exception as error:
-            raise HTTPError(
-                f"Error in getting {self.__info} diff image",
-                error=error,
-            ) from error
+    @staticmethod
+    def __stage(stage: str) -> AbstractContextManager[None]:
+        return Metrics.measure("compare_stage_duration_seconds", stage=stage)
@@ -9,12 +9,13 @@ from fastapi import HTTPException, Request
 from src.api.presenters import HTTPError, SuccessJSON
 from src.common.enums import FileType
 from src.common.params import CreateNewDynamic
+from src.core.answer_key_cache import AnswerKeyCache
 from src.core.config import IMG_DIR, LOG, WEB_DIR
-from src.repository import DynamicRepository
+from src.repository import DatabaseExecutor, DynamicRepository
 
 
 async def list_dynamics(request: Request) -> SuccessJSON:
-    dynamics = DynamicRepository.get_dynamics()
+    dynamics = await DatabaseExecutor.run(DynamicRepository.get_dynamics)
     LOG.info(f"Found {len(dynamics)} dynamics")
 
     return SuccessJSON(
@@ -60,7 +61,7 @@ async def add_dynamic(request: Request, form: CreateNewDynamic) -> SuccessJSON:
             error=error,
         ) from error
 
-    DynamicRepository.add_dynamic(form.name)
+    await DatabaseExecutor.run(DynamicRepository.add_dynamic, form.name)
     LOG.info(f"Dynamic {form.name} has {count} code dirs created")
 
     return SuccessJSON(
@@ -87,7 +88,8 @@ async def remove_dynamic(request: Request, dynamic: str) -> SuccessJSON:
             f"Error in removing dynamic dir {dynamic}", error=error
         ) from error
 
-    DynamicRepository.remove_dynamic(dynamic)
+    await DatabaseExecutor.run(DynamicRepository.remove_dynamic, dynamic)
+    AnswerKeyCache.invalidate(dynamic)
     dynamic_dir = IMG_DIR / dynamic
 
     if dynamic_dir.exists():
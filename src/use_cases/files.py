@@ -1,20 +1,38 @@
+from asyncio import to_thread
+from collections.abc import AsyncIterator
 from http import HTTPStatus
-from tempfile import _TemporaryFileWrapper
-from zipfile import ZIP_DEFLATED, ZipFile
 
 from fastapi import HTTPException, Request
-from fastapi.responses import FileResponse
+from fastapi.responses import Response, StreamingResponse
 
 from src.api.presenters import HTTPError, SuccessJSON
-from src.common.params import RetrieveData, UploadData
-from src.core.config import LOG, WEB_DIR
-from src.repository.dynamic_repository import DynamicRepository
+from src.common.enums import FileType
+from src.common.params import DownloadOptions, RetrieveData, UploadData
+from src.core.archive_cache import ArchiveCache, TreeFile
+from src.core.compare_executor import CompareExecutor
+from src.core.config import (
+    DIFF_FILENAME,
+    IMG_DIR,
+    LOG,
+    MASK_FILENAME,
+    RENDER_FILENAME,
+    SCREENSHOT_FILENAME,
+    WEB_DIR,
+)
+from src.core.image_pipeline import materialize_image
+from src.core.screenshot_service import ScreenshotService
+from src.core.zip_stream import ZipStream, zip_entry
+from src.repository import DatabaseExecutor, DynamicRepository, JobRepository
+from src.use_cases.scoring_jobs import ScoringJobs
+
+IMAGES_ARCNAME = "images"
+ZIP_CHUNK_SIZE = 64 * 1024
 
 
 async def retrieve_file(
     request: Request, dynamic: str, query: RetrieveData
 ) -> SuccessJSON:
-    if DynamicRepository.get_lock_status(dynamic):
+    if await DatabaseExecutor.run(DynamicRepository.get_lock_status, dynamic):
         raise HTTPException(
             HTTPStatus.LOCKED, "Request sending has not started yet"
         )
@@ -56,7 +74,7 @@ async def retrieve_file(
 async def upload_file(
     request: Request, dynamic: str, form: UploadData
 ) -> SuccessJSON:
-    if DynamicRepository.get_lock_status(dynamic):
+    if await DatabaseExecutor.run(DynamicRepository.get_lock_status, dynamic):
         raise HTTPException(
             HTTPStatus.LOCKED, "Request sending has not started yet"
         )
@@ -82,52 +100,138 @@ async def upload_file(
     message = f"Upload code dir {form.code} {form.type.file}"
     LOG.info(message)
 
+    data = {"dynamic": dynamic, "code": form.code, "type": form.type.value}
+
+    if form.type == FileType.CSS and form.background:
+        snapshot = ScreenshotService.snapshot(code_dir)
+        data["job_id"] = await ScoringJobs.submit(dynamic, form, snapshot)
+        message = f"{message} queued to score as job {data['job_id']}"
+
+        return SuccessJSON(request, message, data, HTTPStatus.ACCEPTED)
+
+    return SuccessJSON(request, message, data)
+
+
+async def score_job(
+    request: Request, dynamic: str, job_id: str
+) -> SuccessJSON:
+    job = await DatabaseExecutor.run(JobRepository.get_job, dynamic, job_id)
+    LOG.info(f"Score job {job_id} is {job['status']}")
+
     return SuccessJSON(
         request,
-        message,
-        {
-            "dynamic": dynamic,
-            "code": form.code,
-            "type": form.type.value,
-        },
+        f"Score job {job_id} is {job['status']}",
+        {"dynamic": dynamic, **job},
     )
 
 
 async def download_dir_tree(
-    dynamic: str, temp_file: _TemporaryFileWrapper
-) -> FileResponse:
+    request: Request, dynamic: str, options: DownloadOptions
+) -> Response:
+    if not (WEB_DIR / dynamic).is_dir():
+        raise HTTPException(HTTPStatus.NOT_FOUND, f"{dynamic} dir not found")
+
+    if options.images:
+        await materialize_images(dynamic)
+
+    tree = await to_thread(list_dir_tree, dynamic, options.images)
+    etag = f'"{ArchiveCache.fingerprint(tree, options.level)}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if match_etag(request.headers.get("If-None-Match"), etag):
+        LOG.info(f"{dynamic} zip file not modified")
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+    filename = f"{dynamic.lower()}.zip"
+    headers["Content-Disposition"] = f"attachment; filename={filename}"
+    LOG.info(f"Streaming zip file {filename}")
+
+    return StreamingResponse(
+        iter_dir_tree(dynamic, tree, options.level),
+        media_type="application/zip",
+        headers=headers,
+    )
+
+
+async def iter_dir_tree(
+    dynamic: str, tree: list[TreeFile], level: int
+) -> AsyncIterator[bytes]:
+    archive = ZipStream()
+    chunk: list[bytes] = []
+    chunk_size = 0
+
     try:
-        with ZipFile(
-            temp_file,
-            mode="w",
-            compression=ZIP_DEFLATED,
-            compresslevel=9,
-        ) as zip_archive:
-
-            dynamic_dir = WEB_DIR / dynamic
-
-            for sub_dir in dynamic_dir.rglob("*"):
-                arcname = sub_dir.relative_to(dynamic_dir)
-                zip_archive.write(sub_dir, arcname=arcname)
-
-            filename = f"{dynamic.lower()}.zip"
-            disposition = f"attachment; filename={filename}"
-
-            LOG.info(f"Zip file {filename} in {temp_file.name} temp file")
-
-            return FileResponse(
-                path=temp_file.name,
-                status_code=HTTPStatus.OK,
-                headers={
-                    "Content-Type": "application/zip; charset=utf-8",
-                    "Content-Disposition": disposition,
-                },
-                media_type="application/zip",
-                filename=filename,
-                content_disposition_type=disposition,
-            )
+        for file in tree:
+            entry = ArchiveCache.get(file, level)
+
+            if entry is None:
+                try:
+                    entry = await to_thread(
+                        zip_entry, file.arcname, file.path, level
+                    )
+                except FileNotFoundError:
+                    continue
+
+                ArchiveCache.put(file, level, entry)
+
+            record = archive.add(entry)
+            chunk.append(record)
+            chunk_size += len(record)
+
+            if chunk_size >= ZIP_CHUNK_SIZE:
+                yield b"".join(chunk)
+                chunk, chunk_size = [], 0
+
+        chunk.append(archive.close())
+        yield b"".join(chunk)
+
+        LOG.debug({"archive_cache": ArchiveCache.stats()})
 
     except Exception as error:
-        raise HTTPError(
-            f"Failed to compress {dynamic} dir", error=error
-        ) from error
+        LOG.error(f"Failed to compress {dynamic} dir")
+        LOG.exception(error)
+        raise
+
+
+async def materialize_images(dynamic: str) -> None:
+    for mask_path in (IMG_DIR / dynamic).glob(f"*/{MASK_FILENAME}"):
+        for filename in (SCREENSHOT_FILENAME, DIFF_FILENAME):
+            await CompareExecutor.run(
+                materialize_image, mask_path.parent, filename
+            )
+
+
+def list_dir_tree(dynamic: str, images: bool) -> list[TreeFile]:
+    dynamic_dir = WEB_DIR / dynamic
+    paths = [
+        (str(path.relative_to(dynamic_dir)), path)
+        for path in sorted(dynamic_dir.rglob("*"))
+    ]
+
+    img_dir = IMG_DIR / dynamic
+
+    if images and img_dir.is_dir():
+        paths.append((IMAGES_ARCNAME, img_dir))
+        paths.extend(
+            (f"{IMAGES_ARCNAME}/{path.relative_to(img_dir)}", path)
+            for path in sorted(img_dir.rglob("*"))
+            if path.name not in (MASK_FILENAME, RENDER_FILENAME)
+        )
+
+    tree = []
+
+    for arcname, path in paths:
+        try:
+            tree.append(TreeFile.stat(arcname, path))
+        except FileNotFoundError:
+            continue
+
+    return tree
+
+
+def match_etag(if_none_match: str | None, etag: str) -> bool:
+    if if_none_match is None:
+        return False
+
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in tags or "*" in tags
@@ -0,0 +1,28 @@
+from fastapi import Response
+
+from src.core.answer_key_cache import AnswerKeyCache
+from src.core.archive_cache import ArchiveCache
+from src.core.compare_executor import CompareExecutor
+from src.core.metrics import CONTENT_TYPE, Collectors, Metrics
+from src.core.render_cache import RenderCache
+from src.core.screenshot_service import ScreenshotService
+from src.repository import DynamicRepository, ReportWriter
+from src.use_cases.report_events import ReportEvents
+from src.use_cases.scoring_jobs import ScoringJobs
+
+COLLECTORS: Collectors = {
+    "render_pool": ScreenshotService.stats,
+    "render_cache": RenderCache.stats,
+    "answer_key_cache": AnswerKeyCache.stats,
+    "archive_cache": ArchiveCache.stats,
+    "compare_executor": CompareExecutor.stats,
+    "dynamic_metadata": DynamicRepository.metadata_stats,
+    "report_writer": ReportWriter.stats,
+    "scoring_jobs": ScoringJobs.stats,
+    "report_events": ReportEvents.stats,
+}
+
+
+async def get_metrics() -> Response:
+    content = await Metrics.exposition()
+    return Response(content, media_type=CONTENT_TYPE)
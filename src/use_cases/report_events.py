@@ -0,0 +1,168 @@
+from asyncio import Queue, Task, create_task, sleep, wait_for
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import Context
+from json import dumps
+from typing import Any
+
+from src.common.enums import Operation
+from src.core.config import ENV, LOG
+from src.repository import DatabaseExecutor, ReportRepository
+from src.utils.formaters import format_dynamic_report
+
+HEARTBEAT = ": heartbeat\n\n"
+
+
+def encode_event(
+    event: str, data: dict[str, Any], event_id: int | None = None
+) -> str:
+    lines = [] if event_id is None else [f"id: {event_id}"]
+    lines.append(f"event: {event}")
+    lines.append(f"data: {dumps(data, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+class ReportEvents:
+    """Fans out new reports and leaderboard changes to SSE subscribers"""
+
+    _SUBSCRIBERS: dict[str, set[Queue[str | None]]] = {}
+    _INTERVAL = ENV.events_poll_ms / 1000
+    _QUEUE_SIZE = ENV.events_queue_size
+    _BATCH_SIZE = 500
+    _HEARTBEAT = 15
+    _RETRY_MS = 3000
+    _TASK: Task = None
+    _LAST_ID: int | None = None
+    _PUBLISHED = 0
+    _DROPPED = 0
+
+    @classmethod
+    async def initialize(cls) -> None:
+        if cls._LAST_ID is None:
+            last_id = await DatabaseExecutor.run(
+                ReportRepository.get_last_report_id
+            )
+            cls._LAST_ID = last_id if cls._LAST_ID is None else cls._LAST_ID
+
+    @classmethod
+    async def stream(cls, dynamic: str) -> AsyncIterator[str]:
+        async with cls.__subscribe(dynamic) as queue:
+            yield f"retry: {cls._RETRY_MS}\n\n"
+
+            while True:
+                try:
+                    message = await wait_for(queue.get(), cls._HEARTBEAT)
+                except TimeoutError:
+                    message = HEARTBEAT
+
+                if message is None:
+                    return
+
+                yield message
+
+    @classmethod
+    def stop(cls) -> None:
+        cls.__stop_poller()
+
+        for queues in cls._SUBSCRIBERS.values():
+            for queue in queues:
+                cls.__put(queue, None)
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        return {
+            "dynamics": len(cls._SUBSCRIBERS),
+            "subscribers": sum(map(len, cls._SUBSCRIBERS.values())),
+            "published": cls._PUBLISHED,
+            "dropped": cls._DROPPED,
+        }
+
+    @classmethod
+    @asynccontextmanager
+    async def __subscribe(cls, dynamic: str) -> AsyncIterator[Queue]:
+        queue: Queue[str | None] = Queue(maxsize=cls._QUEUE_SIZE)
+        cls._SUBSCRIBERS.setdefault(dynamic, set()).add(queue)
+
+        if cls._TASK is None:
+            cls._TASK = create_task(cls.__poll(), context=Context())
+            LOG.info("Report events poller started")
+
+        try:
+            yield queue
+
+        finally:
+            queues = cls._SUBSCRIBERS.get(dynamic, set())
+            queues.discard(queue)
+
+            if not queues:
+                cls._SUBSCRIBERS.pop(dynamic, None)
+
+            if not cls._SUBSCRIBERS:
+                cls.__stop_poller()
+
+    @classmethod
+    def __stop_poller(cls) -> None:
+        if cls._TASK is not None:
+            cls._TASK.cancel()
+            LOG.info("Report events poller stopped")
+
+        cls._TASK, cls._LAST_ID = None, None
+
+    @classmethod
+    async def __poll(cls) -> None:
+        while True:
+            published = 0
+
+            try:
+                await cls.initialize()
+                published = await cls.__publish_reports()
+
+            except Exception as error:  # pylint: disable=W0718
+                LOG.error("Failed to publish report events")
+                LOG.exception(error)
+
+            if published < cls._BATCH_SIZE:
+                await sleep(cls._INTERVAL)
+
+    @classmethod
+    async def __publish_reports(cls) -> int:
+        reports = await DatabaseExecutor.run(
+            ReportRepository.get_reports_after, cls._LAST_ID, cls._BATCH_SIZE
+        )
+        scored: set[str] = set()
+
+        for report in reports:
+            cls._LAST_ID = report[0]
+            dynamic = report[1]
+
+            if dynamic not in cls._SUBSCRIBERS:
+                continue
+
+            data = format_dynamic_report(report)
+            cls.__publish(dynamic, encode_event("report", data, report[0]))
+
+            if report[3] == Operation.UPLOAD.value and report[7] is not None:
+                scored.add(dynamic)
+
+        for dynamic in scored:
+            teams = await DatabaseExecutor.run(
+                ReportRepository.get_leaderboard, dynamic
+            )
+            data = {"dynamic": dynamic, "count": len(teams), "teams": teams}
+            cls.__publish(dynamic, encode_event("leaderboard", data))
+
+        return len(reports)
+
+    @classmethod
+    def __publish(cls, dynamic: str, message: str) -> None:
+        for queue in cls._SUBSCRIBERS.get(dynamic, set()):
+            cls.__put(queue, message)
+
+    @classmethod
+    def __put(cls, queue: Queue[str | None], message: str | None) -> None:
+        if queue.full():
+            queue.get_nowait()
+            cls._DROPPED += 1
+
+        queue.put_nowait(message)
+        cls._PUBLISHED += 1
@@ -1,16 +1,52 @@
+from collections.abc import AsyncIterator
+from json import dumps
+from typing import Any
+
 from fastapi import Request
+from fastapi.responses import StreamingResponse
 
 from src.api.presenters import SuccessJSON
 from src.common.enums import Operation
-from src.common.params import RetrieveData
+from src.common.params import ReportPage, RetrieveData
 from src.core.config import LOG
-from src.repository import ReportRepository
+from src.repository import (
+    DatabaseExecutor,
+    DynamicRepository,
+    ReportRepository,
+)
+from src.use_cases.report_events import ReportEvents
+
+EVENTS_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+STREAM_PAGE_SIZE = 1000
+
+
+async def dynamic_reports(
+    request: Request, dynamic: str, query: ReportPage
+) -> SuccessJSON | StreamingResponse:
+    limit = query.limit
 
+    if query.stream:
+        limit = STREAM_PAGE_SIZE if limit is None else limit
+        limit = min(limit, STREAM_PAGE_SIZE)
+
+    reports = await DatabaseExecutor.run(
+        ReportRepository.get_dynamic_reports, dynamic, query.after, limit
+    )
+
+    if query.stream:
+        LOG.info(f"Streaming reports for dynamic {dynamic}")
+        return StreamingResponse(
+            iter_dynamic_reports(dynamic, reports, query.limit),
+            media_type="application/x-ndjson",
+        )
 
-async def dynamic_reports(request: Request, dynamic: str) -> SuccessJSON:
-    reports = ReportRepository.get_dynamic_reports(dynamic)
     LOG.info(f"Found {len(reports)} for dynamic {dynamic}")
 
+    if limit is not None and len(reports) == limit:
+        next_cursor = reports[-1]["id"]
+    else:
+        next_cursor = None
+
     return SuccessJSON(
         request,
         f"Found {len(reports)} for dynamic {dynamic}",
@@ -18,14 +54,45 @@ async def dynamic_reports(request: Request, dynamic: str) -> SuccessJSON:
             "dynamic": dynamic,
             "count": len(reports),
             "reports": reports,
+            "next_cursor": next_cursor,
         },
     )
 
 
+async def iter_dynamic_reports(
+    dynamic: str, reports: list[dict[str, Any]], limit: int | None
+) -> AsyncIterator[str]:
+    remaining = limit
+
+    while reports:
+        yield "".join(
+            dumps(report, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for report in reports
+        )
+
+        if remaining is not None:
+            remaining -= len(reports)
+
+        size = STREAM_PAGE_SIZE if remaining is None else remaining
+        size = min(size, STREAM_PAGE_SIZE)
+
+        if size == 0 or len(reports) < STREAM_PAGE_SIZE:
+            return
+
+        reports = await DatabaseExecutor.run(
+            ReportRepository.get_dynamic_reports,
+            dynamic,
+            reports[-1]["id"],
+            size,
+        )
+
+
 async def file_report(
     request: Request, dynamic: str, query: RetrieveData
 ) -> SuccessJSON:
-    report = ReportRepository.get_file_report(dynamic, query)
+    report = await DatabaseExecutor.run(
+        ReportRepository.get_file_report, dynamic, query
+    )
     LOG.info(f"{query.code} {query.type.value} file report found")
 
     return SuccessJSON(
@@ -43,7 +110,9 @@ async def file_report(
 async def operation_reports(
     request: Request, dynamic: str, operation: Operation
 ) -> SuccessJSON:
-    reports = ReportRepository.get_operation_reports(dynamic, operation)
+    reports = await DatabaseExecutor.run(
+        ReportRepository.get_operation_reports, dynamic, operation
+    )
     LOG.info(f"{operation.value} operation reports found")
 
     return SuccessJSON(
@@ -55,3 +124,32 @@ async def operation_reports(
             "reports": reports,
         },
     )
+
+
+async def leaderboard(request: Request, dynamic: str) -> SuccessJSON:
+    teams = await DatabaseExecutor.run(
+        ReportRepository.get_leaderboard, dynamic
+    )
+    LOG.info(f"{dynamic} leaderboard found with {len(teams)} teams")
+
+    return SuccessJSON(
+        request,
+        f"{dynamic} leaderboard found",
+        {
+            "dynamic": dynamic,
+            "count": len(teams),
+            "teams": teams,
+        },
+    )
+
+
+async def report_events(dynamic: str) -> StreamingResponse:
+    await DatabaseExecutor.run(DynamicRepository.check_dynamic, dynamic)
+    await ReportEvents.initialize()
+    LOG.info(f"New {dynamic} report events subscriber")
+
+    return StreamingResponse(
+        ReportEvents.stream(dynamic),
+        media_type="text/event-stream",
+        headers=EVENTS_HEADERS,
+    )
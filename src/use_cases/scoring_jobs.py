@@ -0,0 +1,161 @@
+from asyncio import CancelledError, Queue, QueueFull, Task, create_task
+from contextvars import Context
+from http import HTTPStatus
+from typing import Any
+from uuid import uuid4
+
+from fastapi import HTTPException
+
+from src.common.enums import JobStatus, Operation
+from src.common.params import UploadData
+from src.core.config import ENV, LOG
+from src.repository import DatabaseExecutor, JobRepository, ReportRepository
+from src.use_cases.compare_similarity import Similarity
+from src.utils.formaters import get_error_message
+
+
+class ScoringJobs:
+    """In-process scheduler for background CSS scoring jobs"""
+
+    _QUEUE: Queue[tuple[str, str, UploadData, dict[str, bytes]]] = None
+    _WORKERS: list[Task] = []
+    _CONCURRENCY = ENV.render_pages
+    _MAX_QUEUED = 500
+
+    @classmethod
+    def start(cls) -> None:
+        cls._QUEUE = Queue(maxsize=cls._MAX_QUEUED)
+        cls._WORKERS = [
+            create_task(cls.__work(), context=Context())
+            for _ in range(cls._CONCURRENCY)
+        ]
+        LOG.info(f"Scoring jobs started with {cls._CONCURRENCY} workers")
+
+    @classmethod
+    async def stop(cls) -> None:
+        for worker in cls._WORKERS:
+            worker.cancel()
+
+        for worker in cls._WORKERS:
+            try:
+                await worker
+            except CancelledError:
+                pass
+
+        while cls._QUEUE is not None and not cls._QUEUE.empty():
+            job_id, *_ = cls._QUEUE.get_nowait()
+            await DatabaseExecutor.run(
+                JobRepository.set_status,
+                job_id,
+                JobStatus.FAILED,
+                message="Server shutting down",
+            )
+
+        cls._WORKERS, cls._QUEUE = [], None
+
+    @classmethod
+    async def submit(
+        cls, dynamic: str, form: UploadData, snapshot: dict[str, bytes]
+    ) -> str:
+        if cls._QUEUE is None:
+            cls.start()
+
+        job_id = uuid4().hex
+        await DatabaseExecutor.run(
+            JobRepository.add_job, job_id, dynamic, form.code
+        )
+
+        try:
+            cls._QUEUE.put_nowait((job_id, dynamic, form, snapshot))
+
+        except QueueFull as error:
+            await DatabaseExecutor.run(
+                JobRepository.set_status,
+                job_id,
+                JobStatus.FAILED,
+                message="Scoring queue is full",
+            )
+            raise HTTPException(
+                HTTPStatus.SERVICE_UNAVAILABLE, "Scoring queue is full"
+            ) from error
+
+        return job_id
+
+    @classmethod
+    def queued(cls) -> int:
+        return cls._QUEUE.qsize() if cls._QUEUE else 0
+
+    @classmethod
+    def stats(cls) -> dict[str, Any]:
+        return {"workers": len(cls._WORKERS), "queued": cls.queued()}
+
+    @classmethod
+    async def __work(cls) -> None:
+        while True:
+            job_id, dynamic, form, snapshot = await cls._QUEUE.get()
+
+            try:
+                await cls.__run(job_id, dynamic, form, snapshot)
+
+            except Exception as error:  # pylint: disable=W0718
+                LOG.error(f"Failed to finish score job {job_id}")
+                LOG.exception(error)
+
+            finally:
+                cls._QUEUE.task_done()
+
+    @classmethod
+    async def __run(
+        cls,
+        job_id: str,
+        dynamic: str,
+        form: UploadData,
+        snapshot: dict[str, bytes],
+    ) -> None:
+        await DatabaseExecutor.run(
+            JobRepository.set_status, job_id, JobStatus.RUNNING
+        )
+        similarity, message = None, None
+
+        try:
+            similarity = await Similarity().compare(
+                dynamic, form.code, snapshot
+            )
+        except Exception as error:  # pylint: disable=W0718
+            LOG.error("Failed to compare page to answer key")
+            LOG.exception(error)
+            message = cls.__error_message(error)
+
+        try:
+            score = await DatabaseExecutor.run(
+                ReportRepository.add_report,
+                dynamic,
+                form,
+                Operation.UPLOAD,
+                similarity,
+            )
+        except Exception as error:
+            await DatabaseExecutor.run(
+                JobRepository.set_status,
+                job_id,
+                JobStatus.FAILED,
+                message=cls.__error_message(error),
+            )
+            raise
+
+        status = JobStatus.FAILED if similarity is None else JobStatus.DONE
+        await DatabaseExecutor.run(
+            JobRepository.set_status,
+            job_id,
+            status,
+            similarity,
+            score,
+            message,
+        )
+        LOG.info(f"Score job {job_id} finished as {status.value}")
+
+    @staticmethod
+    def __error_message(error: Exception) -> str:
+        if isinstance(error, HTTPException):
+            return str(error.detail)
+        return get_error_message(error)
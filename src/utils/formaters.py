@@ -62,6 +62,35 @@ def format_operation_report(report: tuple) -> dict[str, Any]:
     }
 
 
+def format_leaderboard(team: tuple) -> dict[str, Any]:
+    last = datetime.fromtimestamp(team[3])
+
+    return {
+        "rank": team[0],
+        "code": team[1],
+        "uploads": team[2],
+        "last_timestamp": last.isoformat(),
+        "similarity": team[4],
+        "score": team[5],
+    }
+
+
+def format_score_job(job: tuple) -> dict[str, Any]:
+    created = datetime.fromtimestamp(job[4])
+    updated = datetime.fromtimestamp(job[5])
+
+    return {
+        "job_id": job[0],
+        "code": job[2],
+        "status": job[3],
+        "created": created.isoformat(),
+        "updated": updated.isoformat(),
+        "similarity": job[6],
+        "score": job[7],
+        "error": job[8],
+    }
+
+
 def get_error_message(exc: Exception) -> str:
     return exc.args[0] if exc.args and exc.args[0] else ERROR_MESSAGE
 
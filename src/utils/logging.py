@@ -1,11 +1,17 @@
+from atexit import register
 from enum import StrEnum
+from gzip import open as gzip_open
 from http import HTTPStatus
 from json import dumps
-from logging import DEBUG, ERROR, INFO, Formatter, StreamHandler, getLogger
-from logging.handlers import RotatingFileHandler
+from logging import DEBUG, INFO, Formatter, LogRecord, StreamHandler, getLogger
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from os import remove
 from pathlib import Path
-from re import sub
+from queue import SimpleQueue
+from re import compile as compile_pattern
+from shutil import copyfileobj
 from sys import stdout
+from time import time as now
 
 from fastapi import Request
 from uvicorn.config import LOGGING_CONFIG
@@ -21,10 +27,66 @@ class Prefix(StrEnum):
     EXCEPTION = "\033[31mEXCEPTION\033[m:".ljust(17)
 
 
+ANSI_ESCAPE = compile_pattern(ANSI_ESCAPE_PATTERN)
+
+
 class ANSIFormatter(Formatter):
     def format(self, record) -> str:
         message = super().format(record)
-        return sub(ANSI_ESCAPE_PATTERN, "", message)
+        return ANSI_ESCAPE.sub("", message)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue handler leaving the records formatting to the listener"""
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        return record
+
+
+class CompressedRotatingFileHandler(RotatingFileHandler):
+    """Size and time rotating log file with gzip compressed backups"""
+
+    def __init__(
+        self,
+        filename: Path,
+        max_bytes: int,
+        interval: int,
+        backup_count: int,
+    ) -> None:
+        super().__init__(
+            filename=filename,
+            mode="a",
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+        self.namer = self.__namer
+        self.rotator = self.__rotator
+        self.__interval = interval
+        self.__rollover_at = now() + interval
+
+    def shouldRollover(self, record: LogRecord) -> bool:
+        if now() >= self.__rollover_at:
+            return Path(self.baseFilename).exists()
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self.__rollover_at = now() + self.__interval
+
+    @staticmethod
+    def __namer(default_filename: str) -> str:
+        log_count = Path(default_filename).suffixes[1].removeprefix(".")
+        path = Path(default_filename).with_name(f"records_{log_count}.log")
+        return f"{path}.gz"
+
+    @staticmethod
+    def __rotator(source: str, destination: str) -> None:
+        with open(source, "rb") as log_file:
+            with gzip_open(destination, "wb") as compressed_file:
+                copyfileobj(log_file, compressed_file)
+        remove(source)
 
 
 class Logging:
@@ -39,65 +101,74 @@ class Logging:
     __UVICORN_FMT = "%(asctime)s %(levelprefix)s %(message)s"
     __STATUS_COLOR = {2: "32", 3: "33", 4: "31", 5: "31"}
     __LOGGER_NAME = "ifms.dev.competition"
+    __UVICORN_LOGGER = "uvicorn"
     __FMT = "%(asctime)s %(message)s"
     __DATEFMT = "%Y-%m-%d %H:%M:%S"
     __DIR = Path(".logs")
+    __MAX_BYTES = 1024 * 1024
+    __INTERVAL = 24 * 60 * 60
+    __BACKUP_COUNT = 15
 
     def __init__(
         self, host: str, port: int, logging_file: bool, debug: bool
     ) -> None:
         """Configure and customize application logging"""
         self.__logger = getLogger(self.__LOGGER_NAME)
+        self.__logger.setLevel(DEBUG if debug else INFO)
         self.__host, self.__port, self.__debug = host, port, debug
 
         formater = {"fmt": self.__UVICORN_FMT, "datefmt": self.__DATEFMT}
         LOGGING_CONFIG["formatters"]["default"].update(formater)
 
         formatter = Formatter(self.__FMT, self.__DATEFMT)
-        self.__stream_handler = StreamHandler(stream=stdout)
-        self.__stream_handler.setFormatter(formatter)
-        self.__logger.addHandler(self.__stream_handler)
+        stream_handler = StreamHandler(stream=stdout)
+        stream_handler.setFormatter(formatter)
+        stream_handler.addFilter(self.__not_uvicorn)
+        handlers = [stream_handler]
+
+        queue: SimpleQueue[LogRecord] = SimpleQueue()
+        queue_handler = DeferredQueueHandler(queue)
+        self.__logger.addHandler(queue_handler)
 
         if logging_file:
             self.__DIR.mkdir(parents=True, exist_ok=True)
-            filename = self.__DIR / "records_0.log"
-
-            file_handler = RotatingFileHandler(
-                filename=filename,
-                mode="a",
-                maxBytes=50000,
-                backupCount=15,
-                encoding="utf-8",
-            )
 
-            file_handler.namer = self.__namer
+            file_handler = CompressedRotatingFileHandler(
+                filename=self.__DIR / "records_0.log",
+                max_bytes=self.__MAX_BYTES,
+                interval=self.__INTERVAL,
+                backup_count=self.__BACKUP_COUNT,
+            )
             ansi_formatter = ANSIFormatter(self.__FMT, self.__DATEFMT)
             file_handler.setFormatter(ansi_formatter)
+            handlers.append(file_handler)
 
-            getLogger("uvicorn").addHandler(file_handler)
-            self.__logger.addHandler(file_handler)
+            getLogger(self.__UVICORN_LOGGER).addHandler(queue_handler)
 
-    def __namer(self, default_filename: str) -> Path:
-        log_count = Path(default_filename).suffixes[1].removeprefix(".")
-        return Path(default_filename).with_name(f"records_{log_count}.log")
+        listener = QueueListener(queue, *handlers)
+        listener.start()
+        register(listener.stop)
+
+    @classmethod
+    def __not_uvicorn(cls, record: LogRecord) -> bool:
+        name = record.name
+        return name != cls.__UVICORN_LOGGER and not name.startswith(
+            f"{cls.__UVICORN_LOGGER}."
+        )
 
     def info(self, message: str) -> None:
-        self.__logger.setLevel(INFO)
         self.__logger.info("%s %s\033[m", Prefix.INFO, message)
 
     def error(self, message: str) -> None:
-        self.__logger.setLevel(ERROR)
         self.__logger.error("%s \033[31m%s\033[m", Prefix.ERROR, message)
 
     def debug(self, data: dict) -> None:
         if self.__debug:
-            self.__logger.setLevel(DEBUG)
             self.__logger.debug(
                 "%s \033[33mJSON:\033[m %s", Prefix.DEBUG, dumps(data)
             )
 
     def exception(self, exception: Exception) -> None:
-        self.__logger.setLevel(ERROR)
         self.__logger.exception(
             "%s \033[31m%s\033[m",
             Prefix.EXCEPTION,
@@ -126,5 +197,4 @@ class Logging:
             time=time,
         )
 
-        self.__logger.setLevel(INFO)
         self.__logger.info("%s %s\033[m", Prefix.TRACE, message)
@@ -14,11 +14,10 @@ from src.api.main import app
 from src.core.config import IMG_DIR, LOG, ROUTE_PREFIX, WEB_DIR
 from src.core.screenshot_service import ScreenshotService
 from src.repository.base_repository import BaseRepository
-from tests.mocks import DATABASE, DYNAMIC_IMG_PATH, DYNAMIC_WEB_PATH
+from tests.mocks import CLIENT, DATABASE, DYNAMIC_IMG_PATH, DYNAMIC_WEB_PATH
 
 install()
 TIMEOUT = 15
-CLIENT = ("127.0.0.1", 2007)
 BASE_URL = f"http://{CLIENT[0]}:{CLIENT[1]}"
 TRANSPORT = ASGITransport(app=app, client=CLIENT)
 
@@ -40,7 +39,7 @@ def lifespan():
     IMG_DIR.mkdir(parents=True, exist_ok=True)
 
     BaseRepository.set_database(DATABASE)
-    BaseRepository.create_tables()
+    BaseRepository.migrate()
 
     print("\033[93mPytest Session Start\033[m", flush=True)
 
@@ -49,6 +48,7 @@ def lifespan():
     rmtree(DYNAMIC_IMG_PATH, True)
     rmtree(DYNAMIC_WEB_PATH, True)
 
+    BaseRepository.close()
     remove(DATABASE)
     print("\033[93mPytest Session Finish\033[m", flush=True)
 
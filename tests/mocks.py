@@ -1,10 +1,30 @@
+from asyncio import Queue
 from pathlib import Path
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from zipfile import ZipInfo
 
+from cv2 import (
+    COLOR_BGR2GRAY,
+    COLOR_GRAY2BGR,
+    THRESH_BINARY,
+    absdiff,
+    cvtColor,
+    subtract,
+    threshold,
+)
+from cv2.typing import MatLike
+from numpy import all as np_all
+from numpy import count_nonzero, full_like, int16
+from numpy import sum as np_sum
+from numpy import uint8
+from numpy.random import default_rng
+
+from src.api.rate_limiter import RateLimiter
 from src.common.enums import FileType, LockStatus, Operation
 from src.core.config import ANSWER_KEY_FILENAME, IMG_DIR, WEB_DIR
+from src.core.render_client import RenderClient
+from src.core.screenshot_service import ScreenshotService
 from src.use_cases.admin import clean_reports
 from src.use_cases.answer_key import AnswerKey
 
@@ -12,6 +32,7 @@ DATABASE = "tests/test_database.db"
 IMAGE_PATH = "tests/test.png"
 
 DYNAMIC = "TEST_DYNAMIC_PYTEST"
+CLIENT = ("127.0.0.1", 2007)
 
 SHUTIL_COPY2_MOCK = patch(
     f"{clean_reports.__module__}.copy2",
@@ -23,6 +44,20 @@ FAILED_WEB_FILES_MOCK = patch.object(
     f"_{AnswerKey.__name__}__save_from_web_fields",
     side_effect=Exception("any"),
 )
+POOL_MOCK = patch.object(ScreenshotService, "_POOL", new_callable=Queue)
+NEW_PAGE_MOCK = patch.object(
+    ScreenshotService,
+    f"_{ScreenshotService.__name__}__new_page",
+    new_callable=AsyncMock,
+)
+RENDER_MOCK = patch.object(ScreenshotService, "render", new_callable=AsyncMock)
+RENDER_PROCESSES_MOCK = patch.object(RenderClient, "_PROCESSES", 1)
+REPLY_TIMEOUT_MOCK = patch.object(RenderClient, "_REPLY_TIMEOUT", 0.1)
+READY_TIMEOUT_MOCK = patch.object(ScreenshotService, "_READY_TIMEOUT", 10000)
+RATE_LIMIT_CLOCK_MOCK = patch(
+    f"{RateLimiter.__module__}.time",
+    autospec=True,
+)
 
 WEIGHT = 123
 COUNT = 1
@@ -55,6 +90,18 @@ CSS_CONTENT = """
         color: #333;
     }
 """
+ANIMATED_CSS_CONTENT = f"""
+    {CSS_CONTENT}
+    h1 {{
+        animation: spin 1s linear infinite;
+    }}
+
+    @keyframes spin {{
+        to {{
+            transform: rotate(360deg);
+        }}
+    }}
+"""
 
 FILE_TYPES_PARAMS = [FileType.HTML, FileType.CSS]
 
@@ -92,3 +139,43 @@ def report_filter(report: dict[str, Any]) -> bool:
 
 def report_score(similarity: Any) -> int:
     return int((float(similarity) * WEIGHT) / 100)
+
+
+def diff_images_pair() -> tuple[MatLike, MatLike]:
+    rng = default_rng(2024)
+    answer_key = rng.integers(0, 256, (90, 120, 3), dtype=uint8)
+    screenshot = answer_key.copy()
+
+    screenshot[10:40, 20:70] = rng.integers(0, 256, (30, 50, 3), dtype=uint8)
+    shift = rng.integers(-60, 61, (30, 40, 3)).astype(int16)
+    shifted = screenshot[50:80, 60:100].astype(int16) + shift
+    screenshot[50:80, 60:100] = shifted.clip(0, 255).astype(uint8)
+
+    return answer_key, screenshot
+
+
+def legacy_diff(
+    answer_key: MatLike, screenshot: MatLike
+) -> tuple[int, MatLike]:
+    changed_pixels = count_nonzero(np_sum(absdiff(answer_key, screenshot), 2))
+
+    diff = subtract(answer_key, screenshot)
+    gray_diff = cvtColor(diff, COLOR_BGR2GRAY)
+
+    diff = threshold(gray_diff, 30, 255, THRESH_BINARY)[1]
+    diff = cvtColor(diff, COLOR_GRAY2BGR)
+    diff[:, :, 0] = 0
+    diff[:, :, 1] = 0
+
+    black_pixels_mask = np_all(diff == 0, axis=2)
+    white_image = full_like(answer_key, 255)
+    diff[black_pixels_mask] = white_image[black_pixels_mask]
+
+    return int(changed_pixels), diff
+
+
+def pool_page(closed: bool = False) -> MagicMock:
+    page = MagicMock()
+    page.is_closed.return_value = closed
+    page.context.close = AsyncMock()
+    return page
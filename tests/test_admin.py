@@ -10,7 +10,7 @@ from fastapi import HTTPException
 from httpx import AsyncClient as Client
 from pytest import mark, raises
 
-from src.common.enums import FileType
+from src.common.enums import FileType, Readiness
 from src.core.config import DIFF_FILENAME, SCREENSHOT_FILENAME
 from src.repository.dynamic_repository import DynamicRepository
 from src.repository.report_repository import ReportRepository
@@ -60,6 +60,20 @@ async def test_set_weight(client: Client):
     assert res["data"]["weight"] == WEIGHT
 
 
+@mark.order(7)
+@mark.asyncio
+async def test_set_readiness(client: Client):
+    url = f"/{DYNAMIC}/set-readiness"
+    res = await client.put(url, params={"readiness": Readiness.ADAPTIVE})
+
+    assert res.status_code == HTTPStatus.OK
+    assert DynamicRepository.get_readiness(DYNAMIC) == Readiness.ADAPTIVE
+
+    res = res.json()
+    assert res["success"] and res["code"] == HTTPStatus.OK
+    assert res["data"]["readiness"] == Readiness.ADAPTIVE
+
+
 @mark.order(8)
 @mark.asyncio
 async def test_save_answer_key_from_image(client: Client):
@@ -188,6 +202,11 @@ async def test_clean_files(client: Client, session_data):
 
     assert len(index_path.read_text("utf-8")) > 0
     assert len(css_path.read_text("utf-8")) > 0
+
+    for path in (diff_path, screenshot_path):
+        res = await client.get(client.base_url.join(f"/{path}"))
+        assert res.status_code == HTTPStatus.OK
+
     assert diff_path.exists() and screenshot_path.exists()
 
     res = await client.delete(f"/{DYNAMIC}/clean-files")
@@ -200,3 +219,4 @@ async def test_clean_files(client: Client, session_data):
     assert len(index_path.read_text("utf-8")) == 0
     assert len(css_path.read_text("utf-8")) == 0
     assert not diff_path.exists() and not screenshot_path.exists()
+    assert not any(img_path.iterdir())
@@ -1,24 +1,66 @@
 # mypy: disable-error-code="index"
+from asyncio import (
+    CancelledError,
+    Event,
+    StreamReader,
+    StreamWriter,
+    create_task,
+    sleep,
+    start_unix_server,
+)
 from http import HTTPStatus
 from io import BytesIO
-from zipfile import ZipFile
+from pathlib import Path
+from shutil import rmtree
+from time import perf_counter, time
+from unittest.mock import patch
+from zipfile import ZIP_STORED, ZipFile
 
 from httpx import AsyncClient as Client
-from pytest import mark
+from numpy import array_equal
+from pytest import mark, raises
 
-from src.common.enums import FileType
+from src.api.rate_limiter import RateLimiter, RateLimitExceeded
+from src.common.enums import FileType, JobStatus, Readiness, RequestCost
 from src.common.params import RetrieveData
-from src.core.config import DIFF_FILENAME, SCREENSHOT_FILENAME
+from src.core.config import DIFF_FILENAME, ENV, SCREENSHOT_FILENAME
+from src.core.diff_engine import DiffEngine
+from src.core.render_cache import CachedRender, RenderCache
+from src.core.render_client import (
+    RenderClient,
+    encode_files,
+    read_frame,
+    socket_path,
+)
+from src.core.render_workers import _handle_job
+from src.core.screenshot_service import ScreenshotService
 from src.repository.report_repository import ReportRepository
 from tests.mocks import (
+    ANIMATED_CSS_CONTENT,
+    CLIENT,
+    CSS_CONTENT,
     DYNAMIC,
     DYNAMIC_IMG_PATH,
     DYNAMIC_WEB_PATH,
     FILE_TYPES_PARAMS,
+    HTML_CONTENT,
+    NEW_PAGE_MOCK,
+    POOL_MOCK,
+    RATE_LIMIT_CLOCK_MOCK,
+    READY_TIMEOUT_MOCK,
+    RENDER_MOCK,
+    RENDER_PROCESSES_MOCK,
+    REPLY_TIMEOUT_MOCK,
     UPLOAD_FILE_PARAMS,
+    diff_images_pair,
+    legacy_diff,
+    pool_page,
+    report_score,
     zip_file_list,
 )
 
+CHECKOUT = f"_{ScreenshotService.__name__}__checkout"
+
 
 @mark.order(11)
 @mark.parametrize(
@@ -57,6 +99,12 @@ async def test_upload_file(
 
     elif file_type == FileType.CSS:
         assert img_path.exists()
+
+        for path in (diff_path, screenshot_path):
+            res = await client.get(client.base_url.join(f"/{path}"))
+            assert res.status_code == HTTPStatus.OK
+            assert res.headers["content-type"] == "image/png"
+
         assert diff_path.exists() and screenshot_path.exists()
 
 
@@ -83,6 +131,237 @@ async def test_retrieve_file(client: Client, session_data, file_type):
     assert file_path.exists() and len(file_path.read_text("utf-8")) > 0
 
 
+@mark.order(13)
+@mark.asyncio
+async def test_rate_limit(client: Client, session_data):
+    code = session_data["code"]
+    url = f"/{DYNAMIC}/retrieve"
+    params = {"code": code, "type": FileType.HTML.value}
+    capacity = ENV.rate_limit_capacity
+
+    with raises(RateLimitExceeded) as error:
+        await RateLimiter.take(DYNAMIC, "team:RATE", capacity + 1)
+
+    assert error.value.retry_after == 1
+
+    with RATE_LIMIT_CLOCK_MOCK as mock:
+        mock.return_value = time()
+
+        with raises(RateLimitExceeded):
+            for _ in range(capacity + 1):
+                await RateLimiter.take(
+                    DYNAMIC, f"team:{code}", RequestCost.READ
+                )
+
+        res = await client.get(url, params=params)
+        assert res.status_code == HTTPStatus.TOO_MANY_REQUESTS
+        assert res.headers["Retry-After"] == "1"
+        assert not res.json()["success"]
+
+        with raises(RateLimitExceeded):
+            for _ in range(capacity + 1):
+                await RateLimiter.take(
+                    DYNAMIC, f"address:{CLIENT[0]}", RequestCost.READ
+                )
+
+        res = await client.get(url, params={**params, "code": "ZZZZ"})
+        assert res.status_code == HTTPStatus.TOO_MANY_REQUESTS
+
+    await sleep(1)
+
+    res = await client.get(url, params=params)
+    assert res.status_code == HTTPStatus.OK
+
+
+@mark.order(13)
+def test_render_cache_key(tmp_path: Path):
+    pages = []
+
+    for code in ("AAAA", "BBBB"):
+        page_dir = tmp_path / DYNAMIC / code
+        page_dir.mkdir(parents=True)
+        (page_dir / FileType.HTML.file).write_text(HTML_CONTENT, "utf-8")
+        (page_dir / FileType.CSS.file).write_text(CSS_CONTENT, "utf-8")
+        pages.append(ScreenshotService.snapshot(page_dir))
+
+    keys = [RenderCache.key(page, DYNAMIC, "version") for page in pages]
+    assert keys[0] == keys[1]
+
+    entry = CachedRender(50.0, b"render", b"diff")
+    RenderCache.put(keys[0], entry)
+    assert RenderCache.get(keys[1]) is entry
+
+    pages[1][next(iter(pages[1]))] += b" "
+    assert RenderCache.key(pages[1], DYNAMIC, "version") != keys[0]
+
+
+@mark.order(13)
+@mark.asyncio
+async def test_render_animated_page(screenshot: None):  # pylint: disable=W0613
+    page_dir = DYNAMIC_WEB_PATH / "ANIM"
+    page_dir.mkdir(parents=True, exist_ok=True)
+    (page_dir / FileType.HTML.file).write_text(HTML_CONTENT, "utf-8")
+    (page_dir / FileType.CSS.file).write_text(ANIMATED_CSS_CONTENT, "utf-8")
+
+    try:
+        with READY_TIMEOUT_MOCK:
+            start = perf_counter()
+            screenshot_bytes = await ScreenshotService.render(
+                page_dir / FileType.HTML.file,
+                Readiness.ADAPTIVE,
+                ScreenshotService.snapshot(page_dir),
+            )
+            render_time = perf_counter() - start
+
+    finally:
+        rmtree(page_dir, True)
+
+    assert screenshot_bytes
+    assert render_time < 5
+
+
+@mark.order(13)
+def test_diff_engine():
+    answer_key, screenshot = diff_images_pair()
+    changed_pixels, diff_image = legacy_diff(answer_key, screenshot)
+
+    for _ in range(2):
+        engine_pixels, mask = DiffEngine.diff(answer_key, screenshot)
+        assert engine_pixels == changed_pixels
+        assert array_equal(DiffEngine.image(mask), diff_image)
+
+    engine_pixels, _ = DiffEngine.diff(answer_key, answer_key)
+    assert engine_pixels == 0
+
+
+@mark.order(13)
+@mark.asyncio
+async def test_render_pool_recovery():
+    checkout = getattr(ScreenshotService, CHECKOUT)
+    dead_page, fresh_page = pool_page(closed=True), pool_page()
+
+    with POOL_MOCK as pool, NEW_PAGE_MOCK as new_page:
+        pool.put_nowait(dead_page)
+        new_page.side_effect = [Exception("any"), fresh_page]
+
+        async with checkout() as page:
+            assert page is dead_page
+
+        dead_page.context.close.assert_awaited_once()
+        assert pool.qsize() == 1
+
+        with raises(Exception):
+            async with checkout():
+                pass
+
+        assert pool.qsize() == 1
+
+        async with checkout() as page:
+            assert page is fresh_page
+
+        assert pool.get_nowait() is fresh_page
+
+
+@mark.order(13)
+@mark.asyncio
+async def test_render_pool_cancelled_close():
+    checkout = getattr(ScreenshotService, CHECKOUT)
+    dead_page = pool_page(closed=True)
+    dead_page.context.close.side_effect = Event().wait
+
+    async def render() -> None:
+        async with checkout():
+            pass
+
+    with POOL_MOCK as pool:
+        pool.put_nowait(dead_page)
+        task = create_task(render())
+
+        while not dead_page.context.close.await_count:
+            await sleep(0)
+
+        task.cancel()
+        with raises(CancelledError):
+            await task
+
+        assert pool.qsize() == 1
+        assert pool.get_nowait() is None
+
+
+@mark.order(13)
+@mark.asyncio
+async def test_render_process(tmp_path: Path):
+    files = {"index.html": b"<h1>Document</h1>"}
+
+    async def hang(reader: StreamReader, _: StreamWriter) -> None:
+        await read_frame(reader)
+        await Event().wait()
+
+    with (
+        patch(f"{RenderClient.__module__}.RENDER_DIR", tmp_path),
+        RENDER_PROCESSES_MOCK,
+        RENDER_MOCK as render,
+    ):
+        render.return_value = b"screenshot"
+        server = await start_unix_server(_handle_job, path=socket_path(0))
+
+        async with server:
+            screenshot = await RenderClient.render(
+                "web/index.html",
+                readiness=Readiness.ADAPTIVE.value,
+                files=encode_files(files),
+            )
+
+        assert screenshot == b"screenshot"
+        render.assert_awaited_once_with(
+            "web/index.html", readiness=Readiness.ADAPTIVE, files=files
+        )
+
+        server = await start_unix_server(hang, path=socket_path(0))
+
+        async with server:
+            with REPLY_TIMEOUT_MOCK, raises(ConnectionError):
+                await RenderClient.render("web/index.html")
+
+
+@mark.order(
+    after="test_admin.py::test_clean_reports",
+    before="test_admin.py::test_clean_files",
+)
+@mark.asyncio
+async def test_upload_file_background(client: Client, session_data):
+    code = session_data["code"]
+
+    url = f"/{DYNAMIC}/upload"
+    data = {
+        "code": code,
+        "type": FileType.CSS,
+        "file": CSS_CONTENT,
+        "background": True,
+    }
+
+    res = await client.post(url, data=data)
+    assert res.status_code == HTTPStatus.ACCEPTED
+
+    res = res.json()
+    assert res["success"] and res["code"] == HTTPStatus.ACCEPTED
+    job_id = res["data"]["job_id"]
+
+    for _ in range(30):
+        res = await client.get(f"/{DYNAMIC}/score/{job_id}")
+        assert res.status_code == HTTPStatus.OK
+
+        job = res.json()["data"]
+        if job["status"] in (JobStatus.DONE, JobStatus.FAILED):
+            break
+
+        await sleep(0.5)
+
+    assert job["job_id"] == job_id and job["code"] == code
+    assert job["status"] == JobStatus.DONE
+    assert job["score"] == report_score(job["similarity"])
+
+
 @mark.order(13)
 @mark.asyncio
 async def test_download(client: Client):
@@ -94,3 +373,43 @@ async def test_download(client: Client):
     with ZipFile(BytesIO(res.content), "r") as zip_archive:
         assert len(zip_archive.filelist) == 8
         assert len(zip_file_list(zip_archive.infolist())) == 2
+        assert all(info.create_system == 3 for info in zip_archive.filelist)
+
+
+@mark.order(13)
+@mark.asyncio
+async def test_download_images(client: Client, session_data):
+    code = session_data["code"]
+    params = {"level": 0, "images": True}
+
+    res = await client.get(f"/{DYNAMIC}/download", params=params)
+    assert res.status_code == HTTPStatus.OK
+
+    with ZipFile(BytesIO(res.content), "r") as zip_archive:
+        assert zip_archive.testzip() is None
+
+        filenames = zip_archive.namelist()
+        assert f"images/{code}/{SCREENSHOT_FILENAME}" in filenames
+        assert f"images/{code}/{DIFF_FILENAME}" in filenames
+
+        for info in zip_archive.infolist():
+            assert info.compress_type == ZIP_STORED
+
+
+@mark.order(13)
+@mark.asyncio
+async def test_download_not_modified(client: Client):
+    url = f"/{DYNAMIC}/download"
+
+    res = await client.get(url)
+    assert res.status_code == HTTPStatus.OK
+    etag = res.headers["ETag"]
+
+    res = await client.get(url, headers={"If-None-Match": etag})
+    assert res.status_code == HTTPStatus.NOT_MODIFIED
+    assert res.headers["ETag"] == etag
+    assert len(res.content) == 0
+
+    res = await client.get(url, params={"level": 0})
+    assert res.status_code == HTTPStatus.OK
+    assert res.headers["ETag"] != etag
@@ -0,0 +1,68 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, FastAPI
+from httpx import ASGITransport
+from httpx import AsyncClient as Client
+from pytest import mark
+
+from src.api.middleware import TracingTimeExceptionHandlerMiddleware
+from src.api.timed_route import TimedRoute
+from src.core.config import ROUTE_PREFIX
+from src.core.metrics import CONTENT_TYPE
+
+
+@mark.order(18)
+@mark.asyncio
+async def test_metrics(client: Client):
+    res = await client.get(client.base_url.copy_with(path="/metrics"))
+    assert res.status_code == HTTPStatus.OK
+    assert res.headers["content-type"] == CONTENT_TYPE
+
+    metrics = res.text.splitlines()
+    route = f"{ROUTE_PREFIX}/{{dynamic}}/events"
+    labels = f'method="GET",route="{route}",status="404"'
+    assert f"ifms_http_requests_total{{{labels}}} 1" in metrics
+
+    assert any(
+        line.startswith(
+            'ifms_db_query_duration_seconds_count{query="check_dynamic"}'
+        )
+        for line in metrics
+    )
+    assert any(
+        line.startswith("ifms_render_duration_seconds_count ")
+        for line in metrics
+    )
+    assert any(
+        line.startswith(
+            'ifms_compare_stage_duration_seconds_count{stage="compare"}'
+        )
+        for line in metrics
+    )
+    assert "# TYPE ifms_cache_hit_ratio gauge" in metrics
+
+
+@mark.order(18)
+@mark.asyncio
+async def test_timed_sync_endpoint():
+    router = APIRouter(route_class=TimedRoute)
+
+    def get_code() -> str:
+        return "ABCD"
+
+    @router.get("/sync")
+    def sync_endpoint(code: str = Depends(get_code)) -> dict[str, str]:
+        return {"code": code}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(TracingTimeExceptionHandlerMiddleware)
+
+    async with Client(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        res = await client.get("/sync")
+
+    assert res.status_code == HTTPStatus.OK
+    assert res.json() == {"code": "ABCD"}
+    assert "validation;dur=" in res.headers["Server-Timing"]
@@ -1,12 +1,15 @@
 # mypy: disable-error-code="index"
+from asyncio import wait_for
 from datetime import datetime
 from http import HTTPStatus
+from json import loads
 from typing import Any
 
 from httpx import AsyncClient as Client
 from pytest import mark
 
-from src.common.enums import Operation
+from src.common.enums import FileType, Operation
+from src.use_cases.report_events import ReportEvents
 from tests.mocks import (
     COUNT,
     DYNAMIC,
@@ -41,6 +44,38 @@ async def test_dynamic_report(client: Client, session_data):
     assert report["score"] == report_score(report["similarity"])
 
 
+@mark.order(14)
+@mark.asyncio
+async def test_dynamic_report_pages(client: Client):
+    url = f"/{DYNAMIC}/dynamic-report"
+
+    res = await client.get(url, params={"limit": 2})
+    assert res.status_code == HTTPStatus.OK
+
+    first_page = res.json()["data"]
+    assert first_page["count"] == 2
+    assert first_page["next_cursor"] == first_page["reports"][-1]["id"]
+
+    params = {"limit": 2, "after": first_page["next_cursor"]}
+    res = await client.get(url, params=params)
+    assert res.status_code == HTTPStatus.OK
+
+    last_page = res.json()["data"]
+    assert last_page["count"] == 2
+
+    reports = first_page["reports"] + last_page["reports"]
+    assert len({report["id"] for report in reports}) == 4
+
+    params = {"limit": 2, "after": reports[-1]["id"] + 1000}
+    res = await client.get(url, params=params)
+    assert res.status_code == HTTPStatus.NOT_FOUND
+
+    res = await client.get(url, params={"stream": True})
+    assert res.status_code == HTTPStatus.OK
+    assert res.headers["content-type"] == "application/x-ndjson"
+    assert list(map(loads, res.text.splitlines())) == reports
+
+
 @mark.order(15)
 @mark.parametrize("file_type", FILE_TYPES_PARAMS)
 @mark.asyncio
@@ -92,3 +127,58 @@ async def test_operation_report(
     elif operation == Operation.UPLOAD:
         assert report["similarity"] is not None
         assert report["score"] == report_score(report["similarity"])
+
+
+@mark.order(16)
+@mark.asyncio
+async def test_leaderboard(client: Client, session_data):
+    code = session_data["code"]
+
+    res = await client.get(f"/{DYNAMIC}/leaderboard")
+    assert res.status_code == HTTPStatus.OK
+
+    server_timing = res.headers["Server-Timing"]
+    for stage in ("validation", "db", "serialization", "total"):
+        assert f"{stage};dur=" in server_timing
+
+    res = res.json()
+    assert res["success"] and res["code"] == HTTPStatus.OK
+    assert res["data"]["count"] == COUNT
+    assert len(res["data"]["teams"]) == COUNT
+
+    team: dict[str, Any] = res["data"]["teams"][0]
+    assert team["rank"] == 1
+    assert team["code"] == code
+    assert team["uploads"] == 2
+    assert datetime.fromisoformat(team["last_timestamp"])
+    assert team["similarity"] is not None
+    assert team["score"] == report_score(team["similarity"])
+
+
+@mark.order(16)
+@mark.asyncio
+async def test_report_events(client: Client, session_data):
+    code = session_data["code"]
+
+    res = await client.get("/NOT_FOUND/events")
+    assert res.status_code == HTTPStatus.NOT_FOUND
+
+    await ReportEvents.initialize()
+    events = ReportEvents.stream(DYNAMIC)
+    assert (await anext(events)).startswith("retry: ")
+
+    params = {"code": code, "type": FileType.HTML.value}
+    res = await client.get(f"/{DYNAMIC}/retrieve", params=params)
+    assert res.status_code == HTTPStatus.OK
+
+    event = await wait_for(anext(events), 5)
+    await events.aclose()
+
+    event_id, event_type, data = event.strip().split("\n")
+    report: dict[str, Any] = loads(data.removeprefix("data: "))
+    assert event_id == f"id: {report['id']}"
+    assert event_type == "event: report"
+    assert report["code"] == code
+    assert report["operation"] == Operation.RETRIEVE
+    assert report["file_type"] == FileType.HTML
+    assert report["similarity"] is None and report["score"] is None